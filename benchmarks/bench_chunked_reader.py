@@ -0,0 +1,73 @@
+"""
+Бенчмарк разбора одного большого CSV файла по диапазонам байтов
+
+Сравнивает последовательный разбор через csv.DictReader с разбором
+диапазонов в пуле процессов для разного количества процессов.
+
+Запуск:
+    python -m benchmarks.bench_chunked_reader --rows 500000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from src.csv_processor import CSVProcessor
+
+HEADER = ("name,position,completed_tasks,performance,"
+          "skills,team,experience_years\n")
+
+
+def write_synthetic_csv(path: str, rows: int) -> None:
+    """Создает CSV файл с многострочными значениями в колонке skills"""
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(HEADER)
+        for i in range(rows):
+            skills = "Python, Django" if i % 7 else "Python,\nDjango"
+            file.write(
+                f'Employee {i},Developer {i % 40},{i % 100},'
+                f'{(i % 50) / 10},"{skills}",Team {i % 12},{i % 30}\n'
+            )
+
+
+def measure(processor: CSVProcessor, path: str) -> float:
+    """Возвращает время загрузки файла в секундах"""
+    started = time.perf_counter()
+    processor.load_data([path])
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=500_000)
+    parser.add_argument('--chunk-size', type=int, default=4 * 1024 * 1024)
+    parser.add_argument(
+        '--workers', type=int, nargs='+',
+        default=sorted({2, 4, os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'employees.csv')
+        write_synthetic_csv(path, args.rows)
+        size_mb = os.path.getsize(path) / 1024 / 1024
+
+        print(f"Файл: {args.rows} строк, {size_mb:.1f} МБ, "
+              f"процессоров: {os.cpu_count()}")
+
+        baseline = measure(
+            CSVProcessor(workers=1, cache_enabled=False), path)
+        print(f"DictReader, 1 процесс: {baseline:.2f} с "
+              f"({args.rows / baseline:,.0f} строк/с)")
+
+        for workers in args.workers:
+            processor = CSVProcessor(
+                workers=workers, chunk_size=args.chunk_size,
+                cache_enabled=False)
+            elapsed = measure(processor, path)
+            print(f"Диапазоны, {workers} процессов: {elapsed:.2f} с "
+                  f"({args.rows / elapsed:,.0f} строк/с, "
+                  f"ускорение x{baseline / elapsed:.2f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Микробенчмарк проверки только колонок, нужных отчету
+
+Измеряет время загрузки синтетического CSV файла через CSVProcessor
+с проверкой всех обязательных колонок и только колонок отчетов
+performance и skills (BaseReport.COLUMNS).
+
+Запуск:
+    python -m benchmarks.bench_column_projection --rows 300000
+    python -m benchmarks.bench_column_projection --record-format table
+"""
+import argparse
+import os
+import tempfile
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+from benchmarks.bench_chunked_reader import write_synthetic_csv
+from src.csv_processor import CSVProcessor
+from src.report_generator import PerformanceReport, SkillsReport
+
+
+def measure(path: str,
+            cases: Sequence[Tuple[str, Optional[Sequence[str]]]],
+            repeat: int,
+            record_format: str,
+            numeric_backend: str) -> Dict[str, float]:
+    """
+    Возвращает лучшее время загрузки файла для каждого набора колонок
+
+    Загрузки с разными наборами колонок чередуются, чтобы колебания
+    нагрузки машины одинаково влияли на все варианты.
+    """
+    processors = {
+        label: CSVProcessor(
+            record_format=record_format, numeric_backend=numeric_backend,
+            columns=columns, always_validate=[], cache_enabled=False)
+        for label, columns in cases
+    }
+    best = {label: float('inf') for label in processors}
+    for _ in range(repeat):
+        for label, processor in processors.items():
+            started = time.perf_counter()
+            processor.load_data([path])
+            best[label] = min(best[label], time.perf_counter() - started)
+            processor.data = []
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=300_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument(
+        '--record-format', choices=['dict', 'employee', 'table'],
+        default='dict')
+    parser.add_argument(
+        '--numeric-backend', choices=['python', 'numpy'], default='python')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'employees.csv')
+        write_synthetic_csv(path, args.rows)
+
+        cases = [
+            ('все колонки', None),
+            ('skills', SkillsReport.COLUMNS),
+            ('performance', PerformanceReport.COLUMNS),
+        ]
+        timings = measure(path, cases, args.repeat,
+                          args.record_format, args.numeric_backend)
+        baseline = timings[cases[0][0]]
+        for label, elapsed in timings.items():
+            print(f"{label:>12}: {elapsed:.3f} с "
+                  f"({baseline / elapsed:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
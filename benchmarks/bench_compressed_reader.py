@@ -0,0 +1,88 @@
+"""
+Бенчмарк загрузки сжатых CSV файлов
+
+Сравнивает скорость загрузки через CSVProcessor (строк в секунду)
+несжатого файла и того же файла в .csv.gz, .csv.bz2 и .csv.xz.
+Для сжатых файлов отдельно измеряется чтение через csv.DictReader
+с распаковкой в отдельном потоке и в потоке разбора: выигрыш от
+перекрытия возможен только при наличии свободного ядра.
+
+Запуск:
+    python -m benchmarks.bench_compressed_reader --rows 300000
+"""
+import argparse
+import bz2
+import csv
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import time
+
+from benchmarks.bench_chunked_reader import write_synthetic_csv
+from src.csv_processor import CSVProcessor
+from src.utils.compression import open_csv_text
+
+COMPRESSORS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+
+def measure(path: str, repeat: int) -> float:
+    """Возвращает лучшее время загрузки файла в секундах"""
+    processor = CSVProcessor(cache_enabled=False)
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        processor.load_data([path])
+        best = min(best, time.perf_counter() - started)
+        processor.data = []
+    return best
+
+
+def measure_reader(path: str, repeat: int, threaded: bool) -> float:
+    """Возвращает лучшее время чтения файла через csv.DictReader"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with open_csv_text(path, threaded=threaded) as file:
+            for _ in csv.DictReader(file):
+                pass
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=300_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'employees.csv')
+        write_synthetic_csv(path, args.rows)
+        size_mb = os.path.getsize(path) / 1024 / 1024
+
+        elapsed = measure(path, args.repeat)
+        print(f"Процессоров: {os.cpu_count()}")
+        print(f"{'csv':>8}: {size_mb:6.1f} МБ, "
+              f"{args.rows / elapsed:,.0f} строк/с")
+
+        for suffix, open_compressed in COMPRESSORS.items():
+            compressed = path + suffix
+            with open(path, 'rb') as source:
+                with open_compressed(compressed, 'wb') as target:
+                    shutil.copyfileobj(source, target)
+            compressed_mb = os.path.getsize(compressed) / 1024 / 1024
+
+            elapsed = measure(compressed, args.repeat)
+            threaded = measure_reader(compressed, args.repeat, True)
+            inline = measure_reader(compressed, args.repeat, False)
+
+            print(f"{'csv' + suffix:>8}: {compressed_mb:6.1f} МБ, "
+                  f"{args.rows / elapsed:,.0f} строк/с; DictReader: "
+                  f"поток распаковки {args.rows / threaded:,.0f} строк/с, "
+                  f"без потока {args.rows / inline:,.0f} строк/с")
+
+
+if __name__ == '__main__':
+    main()
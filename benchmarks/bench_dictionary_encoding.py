@@ -0,0 +1,83 @@
+"""
+Микробенчмарк общих строк для колонок position и team
+
+Для записей-словарей и Employee сравнивает загрузку с общими строками
+(CSVProcessor.DICTIONARY_COLUMNS) и без них: память, удерживаемую
+загруженным списком (байт на строку, через tracemalloc), и время
+группировки отчета performance. Для сравнения приводится группировка
+по кодам позиций в EmployeeTable.
+
+Запуск:
+    python -m benchmarks.bench_dictionary_encoding --rows 300000
+"""
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Sequence, Tuple
+
+from benchmarks.bench_chunked_reader import write_synthetic_csv
+from src.csv_processor import CSVProcessor
+from src.employee_table import EmployeeData
+from src.report_generator import PerformanceReport
+
+
+def load(record_format: str,
+         path: str,
+         dictionary_columns: Sequence[str]) -> Tuple[EmployeeData, int]:
+    """Загружает файл и возвращает данные и удерживаемую ими память"""
+    processor = CSVProcessor(
+        record_format=record_format, cache_enabled=False)
+    processor.DICTIONARY_COLUMNS = tuple(dictionary_columns)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    data = processor.load_data([path])
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return data, after - before
+
+
+def measure_grouping(data: EmployeeData, repeat: int) -> float:
+    """Возвращает лучшее время группировки по позициям в секундах"""
+    report = PerformanceReport()
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        report.accumulate(data)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=300_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'employees.csv')
+        write_synthetic_csv(path, args.rows)
+
+        cases = [
+            ('dict', ()),
+            ('dict', CSVProcessor.DICTIONARY_COLUMNS),
+            ('employee', ()),
+            ('employee', CSVProcessor.DICTIONARY_COLUMNS),
+            ('table', ()),
+        ]
+        for record_format, dictionary_columns in cases:
+            data, used = load(record_format, path, dictionary_columns)
+            elapsed = measure_grouping(data, args.repeat)
+            label = record_format
+            if record_format != 'table':
+                label += ' +общие' if dictionary_columns else ' копии'
+            print(f"{label:>16}: {used / args.rows:.0f} байт/строку, "
+                  f"группировка {elapsed:.3f} с")
+            del data
+
+
+if __name__ == '__main__':
+    main()
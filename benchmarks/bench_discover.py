@@ -0,0 +1,229 @@
+"""
+Бенчмарк поиска CSV файлов (discover_csv_files)
+
+Создает синтетическое дерево папок с CSV и посторонними файлами
+и сравнивает прежний поиск (os.walk или os.listdir с вызовами
+os.path.isfile() и os.access() для каждой записи), прежний поиск
+с получением размеров файлов и поиск через os.scandir, который берет
+тип записи из списка папки, а размер и права - из одного stat на файл.
+Варианты чередуются, печатается лучшее время.
+
+С --exclude дополнительно сравнивается отбор найденных файлов после
+полного обхода с исключением папок во время обхода (шаблоны exclude
+в scan_csv_files()).
+
+Затем сравнивается последовательный обход с обходом подпапок в пуле
+из --threads потоков. С --latency к каждому чтению папки добавляется
+задержка (мс), как у запросов метаданных на сетевом диске.
+
+С --manifest сравнивается полный обход с повторным поиском через
+манифест папок (manifest_dir в scan_csv_files()), когда дерево
+не изменилось: вместо чтения каждой папки выполняется один stat.
+
+Запуск:
+    python -m benchmarks.bench_discover --depth 4 --fanout 6 --files 40
+    python -m benchmarks.bench_discover --depth 0 --files 100000
+    python -m benchmarks.bench_discover --exclude d0 --exclude d1
+    python -m benchmarks.bench_discover --threads 16 --latency 2
+    python -m benchmarks.bench_discover --manifest
+"""
+import argparse
+import fnmatch
+import os
+import tempfile
+import time
+from functools import partial
+from typing import Callable, List, Sequence, Tuple
+
+from src.utils.compression import is_csv_file
+from src.utils import discover as discover_module
+from src.utils.discover import scan_csv_files
+
+
+def build_tree(root: str, depth: int, fanout: int, files: int) -> int:
+    """Создает дерево папок; возвращает количество CSV файлов"""
+    created = 0
+    folders = [root]
+    for level in range(depth + 1):
+        next_folders = []
+        for folder in folders:
+            for index in range(files):
+                # Каждый четвертый файл - не CSV
+                suffix = '.txt' if index % 4 == 3 else '.csv'
+                with open(os.path.join(folder, f"f{index}{suffix}"), 'w'):
+                    pass
+                created += suffix == '.csv'
+            if level < depth:
+                for index in range(fanout):
+                    child = os.path.join(folder, f"d{index}")
+                    os.mkdir(child)
+                    next_folders.append(child)
+        folders = next_folders
+    return created
+
+
+def legacy_discover(folder_path: str, include_subfolders: bool) -> List[str]:
+    """Прежняя реализация поиска (без проверок аргументов)"""
+    csv_files = []
+    if include_subfolders:
+        for root, _, files in os.walk(folder_path):
+            for file in files:
+                if is_csv_file(file):
+                    full_path = os.path.join(root, file)
+                    if os.access(full_path, os.R_OK):
+                        csv_files.append(full_path)
+    else:
+        for file in os.listdir(folder_path):
+            file_path = os.path.join(folder_path, file)
+            if os.path.isfile(file_path) and os.access(file_path, os.R_OK):
+                if is_csv_file(file):
+                    csv_files.append(file_path)
+    csv_files.sort()
+    return csv_files
+
+
+def legacy_discover_sizes(folder_path: str,
+                          include_subfolders: bool) -> List[str]:
+    """Прежняя реализация с размерами файлов через os.path.getsize()"""
+    paths = legacy_discover(folder_path, include_subfolders)
+    sizes = [os.path.getsize(path) for path in paths]
+    assert len(sizes) == len(paths)
+    return paths
+
+
+def scandir_discover(folder_path: str, include_subfolders: bool) -> List[str]:
+    """Поиск через os.scandir с размерами файлов"""
+    return [path for path, _ in scan_csv_files(
+        folder_path, include_subfolders)]
+
+
+# Исходная функция: при --latency os.scandir подменяется
+SCANDIR = os.scandir
+
+CASES = (('os.walk/os.listdir', legacy_discover),
+         ('os.walk/os.listdir + getsize()', legacy_discover_sizes),
+         ('os.scandir', scandir_discover))
+
+
+def filtered_discover(folder_path: str,
+                      exclude: Sequence[str]) -> List[str]:
+    """Полный обход с отбором путей после него"""
+    found = []
+    for path, _ in scan_csv_files(folder_path, True):
+        parts = os.path.relpath(path, folder_path).split(os.sep)
+        if not any(fnmatch.fnmatch(part, pattern)
+                   for part in parts for pattern in exclude):
+            found.append(path)
+    return found
+
+
+def pruned_discover(folder_path: str,
+                    exclude: Sequence[str]) -> List[str]:
+    """Обход с исключением папок по шаблонам"""
+    return [path for path, _ in scan_csv_files(
+        folder_path, True, exclude=exclude)]
+
+
+def threaded_discover(folder_path: str, threads: int) -> List[str]:
+    """Обход подпапок в пуле потоков"""
+    return [path for path, _ in scan_csv_files(
+        folder_path, True, threads=threads)]
+
+
+def manifest_discover(folder_path: str, manifest_dir: str) -> List[str]:
+    """Обход с манифестом папок"""
+    return [path for path, _ in scan_csv_files(
+        folder_path, True, manifest_dir=manifest_dir)]
+
+
+def age_folders(root: str, seconds: float = 60) -> None:
+    """Сдвигает время изменения папок, чтобы они попали в манифест"""
+    stamp = time.time() - seconds
+    for folder, _, _ in os.walk(root):
+        os.utime(folder, (stamp, stamp))
+
+
+def delayed_scandir(latency: float, path: str):
+    """os.scandir с задержкой перед чтением папки"""
+    time.sleep(latency)
+    return SCANDIR(path)
+
+
+def compare(cases: Sequence[Tuple[str, Callable[..., List[str]]]],
+            args: tuple,
+            repeat: int) -> None:
+    """Печатает лучшее время вариантов и проверяет их совпадение"""
+    best = [float('inf')] * len(cases)
+    results = []
+    for _ in range(repeat):
+        results = []
+        for index, (_, discover) in enumerate(cases):
+            started = time.perf_counter()
+            results.append(discover(*args))
+            best[index] = min(best[index], time.perf_counter() - started)
+        assert all(found == results[0] for found in results)
+
+    for (name, _), elapsed in zip(cases, best):
+        print(f"{name}: {elapsed:.3f} с ({best[0] / elapsed:.2f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--depth', type=int, default=4,
+                        help='Глубина дерева (0 - одна папка)')
+    parser.add_argument('--fanout', type=int, default=6,
+                        help='Подпапок в каждой папке')
+    parser.add_argument('--files', type=int, default=40,
+                        help='Файлов в каждой папке')
+    parser.add_argument('--exclude', action='append', default=[],
+                        help='Шаблон исключаемых папок (например, d0)')
+    parser.add_argument('--threads', type=int, default=8,
+                        help='Потоки параллельного обхода')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='Задержка чтения папки, мс')
+    parser.add_argument('--manifest', action='store_true',
+                        help='Сравнить повторный поиск через манифест')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        created = build_tree(root, args.depth, args.fanout, args.files)
+        include_subfolders = args.depth > 0
+        print(f"CSV файлов: {created}")
+
+        compare(CASES, (root, include_subfolders), args.repeat)
+
+        if args.exclude:
+            print(f"исключение {', '.join(args.exclude)}:")
+            compare((('отбор после обхода', filtered_discover),
+                     ('исключение при обходе', pruned_discover)),
+                    (root, args.exclude), args.repeat)
+
+        if args.depth > 0:
+            print(f"потоки обхода, задержка {args.latency} мс:")
+            if args.latency:
+                discover_module.os.scandir = partial(
+                    delayed_scandir, args.latency / 1000)
+            try:
+                compare((('1 поток', partial(threaded_discover, threads=1)),
+                         (f'{args.threads} потоков', partial(
+                             threaded_discover, threads=args.threads))),
+                        (root,), args.repeat)
+            finally:
+                discover_module.os.scandir = SCANDIR
+
+        if args.manifest and args.depth > 0:
+            print("повторный поиск без изменений:")
+            age_folders(root)
+            with tempfile.TemporaryDirectory() as manifest_dir:
+                # Первый обход создает манифест
+                manifest_discover(root, manifest_dir)
+                compare((('полный обход', partial(
+                            scandir_discover, include_subfolders=True)),
+                         ('манифест', partial(
+                             manifest_discover, manifest_dir=manifest_dir))),
+                        (root,), args.repeat)
+
+
+if __name__ == '__main__':
+    main()
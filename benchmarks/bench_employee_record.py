@@ -0,0 +1,75 @@
+"""
+Микробенчмарк построчного представления: словари против Employee
+
+Для каждого формата записей измеряет скорость загрузки синтетического
+CSV файла через CSVProcessor (строк в секунду) и память, удерживаемую
+загруженным списком (байт на строку, через tracemalloc).
+
+Запуск:
+    python -m benchmarks.bench_employee_record --rows 300000
+    python -m benchmarks.bench_employee_record --numeric-backend numpy
+"""
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.bench_chunked_reader import write_synthetic_csv
+from src.csv_processor import CSVProcessor
+
+
+def measure_speed(record_format: str,
+                  path: str,
+                  repeat: int,
+                  numeric_backend: str = 'python') -> float:
+    """Возвращает лучшее время загрузки файла в секундах"""
+    processor = CSVProcessor(
+        record_format=record_format, numeric_backend=numeric_backend,
+        cache_enabled=False)
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        processor.load_data([path])
+        best = min(best, time.perf_counter() - started)
+        processor.data = []
+    return best
+
+
+def measure_memory(record_format: str, path: str) -> int:
+    """Возвращает память, удерживаемую загруженными данными, в байтах"""
+    processor = CSVProcessor(
+        record_format=record_format, cache_enabled=False)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    data = processor.load_data([path])
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del data
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=300_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument(
+        '--numeric-backend', choices=['python', 'numpy'], default='python')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'employees.csv')
+        write_synthetic_csv(path, args.rows)
+
+        for record_format in ('dict', 'employee'):
+            elapsed = measure_speed(
+                record_format, path, args.repeat, args.numeric_backend)
+            used = measure_memory(record_format, path)
+            print(f"{record_format:>8}: {args.rows / elapsed:,.0f} строк/с, "
+                  f"{used / args.rows:.0f} байт/строку")
+
+
+if __name__ == '__main__':
+    main()
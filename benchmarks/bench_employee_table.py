@@ -0,0 +1,71 @@
+"""
+Бенчмарк потребления памяти: список словарей против EmployeeTable
+
+Строит синтетический набор записей в том виде, в каком их создает
+CSVProcessor (новые строковые объекты на каждую строку), и измеряет
+память, удерживаемую каждым представлением, через tracemalloc.
+
+Запуск:
+    python -m benchmarks.bench_employee_table --rows 10000000 --layout table
+    python -m benchmarks.bench_employee_table --rows 1000000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any, Dict, Iterator
+
+from src.employee_table import EmployeeTable
+
+
+def synthetic_records(rows: int) -> Iterator[Dict[str, Any]]:
+    """Генерирует записи: 40 должностей, 12 команд, 200 наборов навыков"""
+    for i in range(rows):
+        yield {
+            'name': f"Employee {i}",
+            'position': f"Developer {i % 40}",
+            'skills': f"Python, Django, Skill {i % 200}",
+            'team': f"Team {i % 12}",
+            'completed_tasks': i % 100,
+            'performance': (i % 50) / 10,
+            'experience_years': i % 30,
+        }
+
+
+def measure(layout: str, rows: int) -> None:
+    """Строит представление и печатает удерживаемую им память"""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+
+    if layout == 'table':
+        data = EmployeeTable()
+        data.extend(synthetic_records(rows))
+        data.freeze()
+    else:
+        data = list(synthetic_records(rows))
+
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{layout:>5}: {rows:,} строк, {current / 2**20:,.1f} МБ "
+          f"({current / rows:.0f} байт/строку), пик {peak / 2**20:,.1f} МБ, "
+          f"{elapsed:.1f} с")
+    del data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument(
+        '--layout', choices=['dict', 'table', 'both'], default='both')
+    args = parser.parse_args()
+
+    layouts = ['dict', 'table'] if args.layout == 'both' else [args.layout]
+    for layout in layouts:
+        measure(layout, args.rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Микробенчмарк отбора строк во время разбора (--filter)
+
+Сравнивает два способа получить отчет performance по части строк
+синтетического CSV файла: загрузка всех строк с отбором готовых
+записей перед отчетом и отбор условиями CSVProcessor до проверки
+строк и построения записей.
+
+Запуск:
+    python -m benchmarks.bench_filter_pushdown --rows 300000
+    python -m benchmarks.bench_filter_pushdown --numeric-backend numpy
+"""
+import argparse
+import os
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from benchmarks.bench_chunked_reader import write_synthetic_csv
+from src.csv_processor import CSVProcessor
+from src.report_generator import PerformanceReport
+
+# Условия отбора и эквивалентная проверка готовой записи
+CASES: Sequence[Tuple[str, Callable[[Dict[str, Any]], bool]]] = [
+    ('team=Team 3', lambda record: record['team'] == 'Team 3'),
+    ('experience_years>=20', lambda record: record['experience_years'] >= 20),
+    ('position in (Developer 1, Developer 2)',
+     lambda record: record['position'] in ('Developer 1', 'Developer 2')),
+]
+
+
+def run_after_load(path: str,
+                   keep: Callable[[Dict[str, Any]], bool],
+                   numeric_backend: str) -> Tuple[float, int]:
+    """Загружает все строки и отбирает записи перед отчетом"""
+    started = time.perf_counter()
+    processor = CSVProcessor(
+        numeric_backend=numeric_backend, cache_enabled=False)
+    records: List[Dict[str, Any]] = [
+        record for record in processor.load_data([path]) if keep(record)]
+    PerformanceReport().generate(records)
+    return time.perf_counter() - started, len(records)
+
+
+def run_pushdown(path: str,
+                 expression: str,
+                 numeric_backend: str) -> Tuple[float, int]:
+    """Отбирает строки условием во время разбора"""
+    started = time.perf_counter()
+    processor = CSVProcessor(
+        numeric_backend=numeric_backend, filters=[expression],
+        cache_enabled=False)
+    records = processor.load_data([path])
+    PerformanceReport().generate(records)
+    return time.perf_counter() - started, len(records)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=300_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument(
+        '--numeric-backend', choices=['python', 'numpy'], default='python')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'employees.csv')
+        write_synthetic_csv(path, args.rows)
+
+        for expression, keep in CASES:
+            # Варианты чередуются, чтобы колебания нагрузки машины
+            # одинаково влияли на оба
+            after_load = pushdown = float('inf')
+            for _ in range(args.repeat):
+                elapsed, selected = run_after_load(
+                    path, keep, args.numeric_backend)
+                after_load = min(after_load, elapsed)
+                elapsed, pushed = run_pushdown(
+                    path, expression, args.numeric_backend)
+                pushdown = min(pushdown, elapsed)
+            assert selected == pushed
+            print(f"{expression} ({selected} строк): после загрузки "
+                  f"{after_load:.3f} с, при разборе {pushdown:.3f} с "
+                  f"({after_load / pushdown:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Бенчмарк предварительной проверки заголовков (--header-check)
+
+Создает набор синтетических файлов, последний из которых содержит
+некорректный заголовок, и печатает время до ошибки без проверки
+(ошибка находится после разбора всех предыдущих файлов) и с
+проверкой заголовков, а также время загрузки набора корректных
+файлов с проверкой и без нее.
+
+Запуск:
+    python -m benchmarks.bench_header_check --files 300 --rows 2000
+"""
+import argparse
+import os
+import tempfile
+import time
+from typing import List
+
+from benchmarks.bench_chunked_reader import write_synthetic_csv
+from src.csv_processor import CSVProcessor
+
+CASES = ('off', 'fail')
+
+
+def write_files(folder: str, count: int, rows: int) -> List[str]:
+    """Создает count файлов по rows строк"""
+    paths = []
+    for index in range(count):
+        path = os.path.join(folder, f"part_{index:04d}.csv")
+        write_synthetic_csv(path, rows)
+        paths.append(path)
+    return paths
+
+
+def measure(header_check: str, paths: List[str]) -> float:
+    """Время загрузки файлов (или до ошибки) в секундах"""
+    processor = CSVProcessor(header_check=header_check, cache_enabled=False)
+    started = time.perf_counter()
+    try:
+        processor.load_data(paths)
+    except ValueError:
+        pass
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--files', type=int, default=300)
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        paths = write_files(folder, args.files, args.rows)
+        bad = os.path.join(folder, 'zz_bad.csv')
+        with open(bad, 'w', encoding='utf-8') as f:
+            f.write('name,position,performance\n')
+
+        for title, files in (("некорректный последний файл", paths + [bad]),
+                             ("все файлы корректны", paths)):
+            best = [float('inf')] * len(CASES)
+            # Варианты чередуются, чтобы кэш ОС влиял на них одинаково
+            for _ in range(args.repeat):
+                for index, header_check in enumerate(CASES):
+                    best[index] = min(best[index],
+                                      measure(header_check, files))
+            print(f"{title}:")
+            for header_check, elapsed in zip(CASES, best):
+                print(f"  header_check={header_check}: {elapsed:.3f} с "
+                      f"({best[0] / elapsed:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
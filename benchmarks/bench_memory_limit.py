@@ -0,0 +1,74 @@
+"""
+Бенчмарк памяти агрегатов отчета со сбросом на диск (--memory-limit)
+
+Сворачивает поток синтетических записей в накопитель отчета без
+ограничения и с пределом памяти и печатает время и пиковую память,
+выделенную при накоплении (tracemalloc). Записи генерируются
+на лету, поэтому в пик попадают только агрегаты накопителя.
+
+Запуск:
+    python -m benchmarks.bench_memory_limit --rows 1000000
+    python -m benchmarks.bench_memory_limit --report skills --skills 500000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Iterator
+
+from src.employee import Employee
+from src.report_generator import PerformanceReport, SkillsReport
+
+
+def synthetic_records(rows: int, skills: int) -> Iterator[Employee]:
+    """Генерирует записи: 40 должностей, skills различных навыков"""
+    for i in range(rows):
+        yield Employee(
+            name=f"Employee {i}",
+            position=f"Developer {i % 40}",
+            completed_tasks=i % 100,
+            performance=(i % 50) / 10,
+            skills=f"Python, Skill {i % skills}",
+            team=f"Team {i % 12}",
+            experience_years=i % 30)
+
+
+def measure(report_type: str, rows: int, skills: int,
+            memory_limit: int) -> None:
+    """Накопливает агрегаты и печатает время и пик памяти"""
+    report = (PerformanceReport() if report_type == 'performance'
+              else SkillsReport())
+    report.memory_limit = memory_limit
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    accumulator = report.accumulate(synthetic_records(rows, skills))
+    accumulated = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    try:
+        groups = sum(1 for _ in accumulator.groups())
+    finally:
+        accumulator.close()
+    limit = f"{memory_limit >> 20} МБ" if memory_limit else "нет"
+    print(f"{report_type}, предел {limit}: {accumulated:.2f} с, "
+          f"пик {peak / 2 ** 20:.1f} МБ, групп {groups}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--skills', type=int, default=200)
+    parser.add_argument(
+        '--report', choices=['performance', 'skills'],
+        default='performance')
+    parser.add_argument('--memory-limit', type=int, default=16,
+                        help='Предел памяти в МБ')
+    args = parser.parse_args()
+
+    for memory_limit in (0, args.memory_limit * 1024 * 1024):
+        measure(args.report, args.rows, args.skills, memory_limit)
+
+
+if __name__ == '__main__':
+    main()
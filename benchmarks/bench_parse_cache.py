@@ -0,0 +1,89 @@
+"""
+Бенчмарк кэша разобранных файлов
+
+Сравнивает загрузку синтетического CSV файла через CSVProcessor
+с разбором и проверкой строк (без кэша) и чтение того же файла
+из кэша для каждого формата записей. Затем дописывает в файл
+--append строк и сравнивает полный разбор с дочитыванием хвоста
+(incremental=True).
+
+Запуск:
+    python -m benchmarks.bench_parse_cache --rows 300000 --append 3000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.bench_chunked_reader import write_synthetic_csv
+from src.csv_processor import CSVProcessor
+
+
+def measure(processor: CSVProcessor, path: str, repeat: int) -> float:
+    """Возвращает лучшее время загрузки файла в секундах"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        processor.load_data([path])
+        best = min(best, time.perf_counter() - started)
+        processor.data = []
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=300_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--append', type=int, default=3000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'employees.csv')
+        cache_dir = os.path.join(temp_dir, 'cache')
+        write_synthetic_csv(path, args.rows)
+
+        for record_format in ('dict', 'employee', 'table'):
+            parsing = measure(
+                CSVProcessor(record_format=record_format,
+                             cache_enabled=False),
+                path, args.repeat)
+
+            processor = CSVProcessor(
+                record_format=record_format,
+                cache_enabled=True, cache_dir=cache_dir)
+            # Первая загрузка заполняет кэш
+            processor.load_data([path])
+            cached = measure(processor, path, args.repeat)
+
+            print(f"{record_format:>8}: разбор {parsing:.2f} с, "
+                  f"кэш {cached:.2f} с ({parsing / cached:.1f}x)")
+
+        size = sum(
+            os.path.getsize(os.path.join(cache_dir, name))
+            for name in os.listdir(cache_dir))
+        print(f"Запись кэша: {size / 1024 / 1024:.1f} МБ, "
+              f"CSV: {os.path.getsize(path) / 1024 / 1024:.1f} МБ")
+
+        tail_path = os.path.join(temp_dir, 'tail.csv')
+        write_synthetic_csv(tail_path, args.append)
+        with open(tail_path, encoding='utf-8') as file:
+            tail = file.read().split('\n', 1)[1]
+
+        processor = CSVProcessor(
+            record_format='table', cache_enabled=True,
+            cache_dir=cache_dir, incremental=True)
+        processor.load_data([path])
+        with open(path, 'a', encoding='utf-8') as file:
+            file.write(tail)
+
+        parsing = measure(
+            CSVProcessor(record_format='table', cache_enabled=False),
+            path, 1)
+        # Одно измерение: следующая загрузка уже найдет хвост в кэше
+        appended = measure(processor, path, 1)
+        print(f"+{args.append} строк, table: разбор {parsing:.2f} с, "
+              f"дочитывание {appended:.2f} с ({parsing / appended:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Бенчмарк загрузки папки с разбором во время обхода (--pipeline)
+
+Создает дерево папок с синтетическими CSV файлами и сравнивает
+загрузку после полного обхода (load_data(discover_and_validate_files()))
+с load_folder() при pipeline=True. С --latency к каждому чтению папки
+добавляется задержка (мс), как у запросов метаданных на сетевом диске:
+без конвейера разбор ждет весь обход, с конвейером обход и разбор
+перекрываются. Варианты чередуются, печатается лучшее время.
+
+Запуск:
+    python -m benchmarks.bench_pipeline --folders 40 --files 5 --latency 20
+    python -m benchmarks.bench_pipeline --workers 4 --latency 20
+"""
+import argparse
+import os
+import tempfile
+import time
+from functools import partial
+
+from benchmarks.bench_chunked_reader import write_synthetic_csv
+from src.config import config
+from src.csv_processor import CSVProcessor
+from src.utils import discover as discover_module
+
+# Исходная функция: при --latency os.scandir подменяется
+SCANDIR = os.scandir
+
+
+def delayed_scandir(latency: float, path):
+    """os.scandir с задержкой перед чтением папки"""
+    time.sleep(latency)
+    return SCANDIR(path)
+
+
+def build_tree(root: str, folders: int, files: int, rows: int) -> None:
+    """Создает folders папок по files файлов"""
+    for folder in range(folders):
+        path = os.path.join(root, f"d{folder:03d}")
+        os.mkdir(path)
+        for index in range(files):
+            write_synthetic_csv(
+                os.path.join(path, f"part_{index}.csv"), rows)
+
+
+def measure(root: str, workers: int, pipeline: bool) -> float:
+    """Время загрузки папки в секундах"""
+    processor = CSVProcessor(
+        workers=workers, pipeline=pipeline, cache_enabled=False)
+    started = time.perf_counter()
+    if pipeline:
+        processor.load_folder(root)
+    else:
+        processor.load_data(processor.discover_and_validate_files(root))
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--folders', type=int, default=40)
+    parser.add_argument('--files', type=int, default=5,
+                        help='Файлов в каждой папке')
+    parser.add_argument('--rows', type=int, default=2000,
+                        help='Строк в каждом файле')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--latency', type=float, default=20.0,
+                        help='Задержка чтения папки, мс')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    # Поиск в подпапках включается для бенчмарка независимо от .env
+    get = config.get
+    config.get = lambda key, default=None: (
+        True if key == 'INCLUDE_SUBFOLDERS' else get(key, default))
+    with tempfile.TemporaryDirectory() as root:
+        build_tree(root, args.folders, args.files, args.rows)
+        if args.latency:
+            discover_module.os.scandir = partial(
+                delayed_scandir, args.latency / 1000)
+        try:
+            best = [float('inf')] * 2
+            for _ in range(args.repeat):
+                for index, pipeline in enumerate((False, True)):
+                    best[index] = min(best[index],
+                                      measure(root, args.workers, pipeline))
+        finally:
+            discover_module.os.scandir = SCANDIR
+            config.get = get
+
+    for name, elapsed in zip(("после обхода", "во время обхода"), best):
+        print(f"{name}: {elapsed:.3f} с ({best[0] / elapsed:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Бенчмарк разбора строк: csv.reader с индексами колонок против DictReader
+
+Создает синтетические CSV файлы с обязательными колонками и --extra
+лишними колонками и измеряет скорость загрузки через CSVProcessor
+(строк в секунду) для parser='dict' и parser='positional'.
+
+Запуск:
+    python -m benchmarks.bench_positional_parser --rows 200000
+    python -m benchmarks.bench_positional_parser --extra 0 10 50
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from src.csv_processor import CSVProcessor
+
+
+def write_wide_csv(path: str, rows: int, extra: int) -> None:
+    """Создает CSV файл с лишними колонками между обязательными"""
+    extra_header = ''.join(f',extra_{i}' for i in range(extra))
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(f"name,position,completed_tasks{extra_header},"
+                   f"performance,skills,team,experience_years\n")
+        for i in range(rows):
+            extra_values = ''.join(f',value {i % 97}' for _ in range(extra))
+            file.write(
+                f'Employee {i},Developer {i % 40},{i % 100}{extra_values},'
+                f'{(i % 50) / 10},"Python, Django",Team {i % 12},{i % 30}\n'
+            )
+
+
+def measure(parser: str, path: str, repeat: int) -> float:
+    """Возвращает лучшее время загрузки файла в секундах"""
+    processor = CSVProcessor(parser=parser, cache_enabled=False)
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        processor.load_data([path])
+        best = min(best, time.perf_counter() - started)
+        processor.data = []
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--extra', type=int, nargs='+', default=[0, 10, 50])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for extra in args.extra:
+            path = os.path.join(temp_dir, f'wide_{extra}.csv')
+            write_wide_csv(path, args.rows, extra)
+
+            dict_time = measure('dict', path, args.repeat)
+            positional_time = measure('positional', path, args.repeat)
+            print(f"{7 + extra:>3} колонок: "
+                  f"DictReader {args.rows / dict_time:,.0f} строк/с, "
+                  f"csv.reader {args.rows / positional_time:,.0f} строк/с "
+                  f"({dict_time / positional_time:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Микробенчмарк отчетов по выборке строк (--sample-rate, --sample-size)
+
+Сравнивает время отчета performance по всем строкам синтетического
+CSV файла со временем отчетов по выборкам и показывает наибольшее
+отклонение оценок средней эффективности позиций от точных значений.
+
+Запуск:
+    python -m benchmarks.bench_sampling --rows 300000
+    python -m benchmarks.bench_sampling --numeric-backend numpy
+"""
+import argparse
+import os
+import tempfile
+import time
+from typing import Any, Dict, Sequence, Tuple
+
+from benchmarks.bench_chunked_reader import write_synthetic_csv
+from src.csv_processor import CSVProcessor
+from src.report_generator import PerformanceReport
+
+# Параметры выборки CSVProcessor для каждого варианта
+CASES: Sequence[Tuple[str, Dict[str, Any]]] = [
+    ('все строки', {}),
+    ('--sample-rate 0.1', {'sample_rate': 0.1}),
+    ('--sample-rate 0.01', {'sample_rate': 0.01}),
+    ('--sample-size 10000', {'sample_size': 10_000}),
+]
+
+
+def run(path: str,
+        options: Dict[str, Any],
+        numeric_backend: str) -> Tuple[float, Dict[str, float]]:
+    """Строит отчет и возвращает время и средние по позициям"""
+    started = time.perf_counter()
+    processor = CSVProcessor(
+        numeric_backend=numeric_backend, cache_enabled=False,
+        sample_seed=1, **options)
+    data = processor.load_data([path])
+    report = PerformanceReport()
+    accumulator = report.accumulate(data)
+    report.render(accumulator, processor.get_load_summary().get('sample'))
+    elapsed = time.perf_counter() - started
+    means = {
+        position: (stats['total'] + stats['error']) / stats['count']
+        for position, stats in accumulator.positions.items()}
+    return elapsed, means
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=300_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument(
+        '--numeric-backend', choices=['python', 'numpy'], default='python')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'employees.csv')
+        write_synthetic_csv(path, args.rows)
+
+        # Варианты чередуются, чтобы колебания нагрузки машины
+        # одинаково влияли на все
+        best = [float('inf')] * len(CASES)
+        means = [{}] * len(CASES)
+        for _ in range(args.repeat):
+            for index, (_, options) in enumerate(CASES):
+                elapsed, means[index] = run(
+                    path, options, args.numeric_backend)
+                best[index] = min(best[index], elapsed)
+
+        exact = means[0]
+        for (name, _), elapsed, estimated in zip(CASES, best, means):
+            error = max(abs(estimated[position] - exact[position])
+                        for position in estimated)
+            print(f"{name}: {elapsed:.3f} с ({best[0] / elapsed:.2f}x), "
+                  f"наибольшее отклонение среднего {error:.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Микробенчмарк свертки отчета по навыкам
+
+Для каждого формата записей измеряет время свертки отчета skills:
+записи-словари и Employee разбирают строки навыков через кэш разбора
+накопителя, EmployeeTable - читает разобранную при загрузке колонку
+skill_lists (CSR). Для таблицы также выводится память колонки
+skill_lists в байтах на строку.
+
+Запуск:
+    python -m benchmarks.bench_skills_report --rows 300000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_chunked_reader import write_synthetic_csv
+from src.csv_processor import CSVProcessor
+from src.employee_table import EmployeeData, SkillsColumn
+from src.report_generator import SkillsReport
+
+
+def measure_accumulate(data: EmployeeData, repeat: int) -> float:
+    """Возвращает лучшее время свертки отчета в секундах"""
+    report = SkillsReport()
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        report.accumulate(data)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def skill_lists_size(column: SkillsColumn) -> int:
+    """Возвращает размер массивов и словаря навыков в байтах"""
+    return (sys.getsizeof(column.offsets) + sys.getsizeof(column.ids)
+            + sys.getsizeof(column.skills)
+            + sum(map(sys.getsizeof, column.skills)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=300_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'employees.csv')
+        write_synthetic_csv(path, args.rows)
+
+        for record_format in ('dict', 'employee', 'table'):
+            data = CSVProcessor(
+                record_format=record_format,
+                cache_enabled=False).load_data([path])
+            elapsed = measure_accumulate(data, args.repeat)
+            line = f"{record_format:>8}: свертка {elapsed:.3f} с"
+            if record_format == 'table':
+                size = skill_lists_size(data.skill_lists)
+                line += f", skill_lists {size / args.rows:.1f} байт/строку"
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
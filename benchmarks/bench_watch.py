@@ -0,0 +1,110 @@
+"""
+Бенчмарк обновления отчета в режиме --watch
+
+Создает папку с синтетическими CSV файлами и сравнивает время
+получения нового отчета после изменения одного файла: повторный
+запуск (поиск, загрузка всех файлов и отчет) и обновление --watch
+(stat всех файлов, загрузка измененного файла и объединение агрегатов
+файлов). Кэш разобранных файлов отключен, чтобы повторный запуск
+разбирал файлы заново, как без --watch. Варианты чередуются,
+печатается лучшее время. Отдельно печатается время построения
+таблицы отчета по агрегатам: оно одинаково в обоих вариантах
+и в отчете по эффективности с большим числом сотрудников на позицию
+занимает большую часть обновления.
+
+Запуск:
+    python -m benchmarks.bench_watch --files 50 --rows 5000
+    python -m benchmarks.bench_watch --report skills
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from benchmarks.bench_chunked_reader import write_synthetic_csv
+from src.adapters.csv_processor_adapter import CSVProcessorAdapter
+from src.adapters.report_generator_adapter import ReportGeneratorAdapter
+from src.application import Application
+from src.quarantine import QuarantineParts
+from src.services.data_service import DataService
+from src.services.report_service import ReportService
+from src.utils.watch import FileWatcher
+
+
+def create_application(report_type: str) -> Application:
+    """Создает приложение, как main.py"""
+    data_service = DataService(CSVProcessorAdapter())
+    report_service = ReportService(ReportGeneratorAdapter())
+    data_service.configure_loader(
+        cache_enabled=False,
+        columns=report_service.get_report_columns(report_type))
+    return Application(data_service, report_service)
+
+
+def full_run(app: Application, root: str, report_type: str) -> str:
+    """Повторный запуск: загрузка всех файлов и отчет"""
+    data = app._data_service.load_data(folder_path=root)
+    return app._report_service.generate_report(report_type, data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--files', type=int, default=50)
+    parser.add_argument('--rows', type=int, default=5000,
+                        help='Строк в каждом файле')
+    parser.add_argument('--report', default='performance',
+                        choices=['performance', 'skills'])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        for index in range(args.files):
+            write_synthetic_csv(
+                os.path.join(root, f"part_{index:03d}.csv"), args.rows)
+        changed = os.path.join(root, f"part_{args.files // 2:03d}.csv")
+
+        app = create_application(args.report)
+        watcher = FileWatcher()
+        parts = {}
+        quarantine = QuarantineParts(os.path.join(root, 'quarantine.jsonl'))
+        files = app._data_service.list_files(folder_path=root)
+        with contextlib.redirect_stdout(io.StringIO()), \
+                contextlib.redirect_stderr(io.StringIO()):
+            app._refresh(args.report, files, parts, watcher.poll(files),
+                         time.perf_counter(), quarantine)
+
+        best_full = best_watch = best_render = float('inf')
+        for attempt in range(args.repeat):
+            write_synthetic_csv(changed, args.rows + attempt + 1)
+
+            started = time.perf_counter()
+            full_run(app, root, args.report)
+            best_full = min(best_full, time.perf_counter() - started)
+
+            started = time.perf_counter()
+            files = app._data_service.list_files(folder_path=root)
+            changes = watcher.poll(files)
+            with contextlib.redirect_stdout(io.StringIO()), \
+                    contextlib.redirect_stderr(io.StringIO()):
+                app._refresh(args.report, files, parts, changes, started,
+                             quarantine)
+            best_watch = min(best_watch, time.perf_counter() - started)
+            assert changes.changed == [changed]
+
+            started = time.perf_counter()
+            app._report_service.render_aggregates(
+                args.report, [parts[path][0] for path in files])
+            best_render = min(best_render, time.perf_counter() - started)
+        quarantine.close()
+
+        print(f"файлов: {args.files}, строк в файле: {args.rows}")
+        print(f"повторный запуск: {best_full:.3f} с (1.00x)")
+        print(f"обновление --watch: {best_watch:.3f} с "
+              f"({best_full / best_watch:.2f}x)")
+        print(f"из них таблица отчета: {best_render:.3f} с")
+
+
+if __name__ == '__main__':
+    main()
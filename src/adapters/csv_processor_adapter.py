@@ -1,22 +1,48 @@
 """
 Адаптер для CSVProcessor
 """
-from typing import List, Dict, Any
-from src.interfaces.data_loader import DataLoaderInterface
+from typing import List, Dict, Any, Iterator
+from src.interfaces.data_loader import (
+    DataLoaderInterface, DiscoveringDataLoaderInterface,
+    StreamingDataLoaderInterface)
 from src.csv_processor import CSVProcessor
+from src.employee_table import EmployeeData
 
 
-class CSVProcessorAdapter(DataLoaderInterface):
-    """Адаптер для CSVProcessor, реализующий DataLoaderInterface"""
+class CSVProcessorAdapter(DataLoaderInterface, StreamingDataLoaderInterface,
+                          DiscoveringDataLoaderInterface):
+    """Адаптер для CSVProcessor, реализующий интерфейсы загрузчиков"""
 
     def __init__(self):
         self._processor = CSVProcessor()
 
-    def load_from_files(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+    def configure(self, **options: Any) -> None:
+        """Передает параметры загрузки в CSVProcessor"""
+        self._processor.configure(**options)
+
+    def get_load_summary(self) -> Dict[str, Any]:
+        """Возвращает итоги последней загрузки CSVProcessor"""
+        return self._processor.get_load_summary()
+
+    def discover_files(self, folder_path: str) -> List[str]:
+        """Реализация поиска CSV файлов в папке"""
+        return self._processor.discover_files(folder_path)
+
+    def load_from_files(self, file_paths: List[str]) -> EmployeeData:
         """Реализация загрузки из файлов"""
         return self._processor.load_data(file_paths)
 
-    def load_from_folder(self, folder_path: str) -> List[Dict[str, Any]]:
-        """Реализация загрузки из папки"""
+    def load_from_folder(self, folder_path: str) -> EmployeeData:
+        """Реализация загрузки из папки (с pipeline - во время обхода)"""
+        return self._processor.load_folder(folder_path)
+
+    def iter_from_files(
+            self,
+            file_paths: List[str]) -> Iterator[Dict[str, Any]]:
+        """Реализация потокового чтения из файлов"""
+        return self._processor.iter_records(file_paths)
+
+    def iter_from_folder(self, folder_path: str) -> Iterator[Dict[str, Any]]:
+        """Реализация потокового чтения из папки"""
         csv_files = self._processor.discover_and_validate_files(folder_path)
-        return self._processor.load_data(csv_files)
+        return self._processor.iter_records(csv_files)
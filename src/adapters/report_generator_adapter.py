@@ -1,19 +1,59 @@
 """
 Адаптер для ReportGenerator
 """
-from typing import List, Dict, Any
-from src.interfaces.report_generator import ReportGeneratorInterface
+from typing import List, Dict, Any, Iterable, Optional, Sequence
+from src.interfaces.report_generator import (
+    IncrementalReportGeneratorInterface, ReportGeneratorInterface,
+    StreamingReportGeneratorInterface)
 from src.report_generator import ReportGenerator
+from src.employee_table import EmployeeData
+from src.sampling import SampleInfo
 
 
-class ReportGeneratorAdapter(ReportGeneratorInterface):
-    """Адаптер для ReportGenerator, реализующий ReportGeneratorInterface"""
+class ReportGeneratorAdapter(ReportGeneratorInterface,
+                             StreamingReportGeneratorInterface,
+                             IncrementalReportGeneratorInterface):
+    """Адаптер для ReportGenerator, реализующий интерфейсы генераторов"""
 
     def __init__(self):
         self._generator = ReportGenerator()
 
+    def configure(self, **options: Any) -> None:
+        """Передает параметры генерации в ReportGenerator"""
+        self._generator.configure(**options)
+
     def generate_report(self,
                         report_type: str,
-                        data: List[Dict[str, Any]]) -> str:
+                        data: EmployeeData) -> str:
         """Реализация генерации отчета"""
         return self._generator.generate_report(report_type, data)
+
+    def generate_sampled_report(self,
+                                report_type: str,
+                                data: EmployeeData,
+                                sample: SampleInfo) -> str:
+        """Реализация генерации отчета по выборке"""
+        return self._generator.generate_sampled_report(
+            report_type, data, sample)
+
+    def generate_report_stream(self,
+                               report_type: str,
+                               records: Iterable[Dict[str, Any]]) -> str:
+        """Реализация генерации отчета по потоку записей"""
+        return self._generator.generate_report_stream(report_type, records)
+
+    def aggregate(self, report_type: str, data: EmployeeData) -> Any:
+        """Реализация свертки части данных в агрегаты"""
+        return self._generator.aggregate(report_type, data)
+
+    def render_aggregates(self,
+                          report_type: str,
+                          parts: Sequence[Any]) -> str:
+        """Реализация отчета по агрегатам частей"""
+        return self._generator.render_aggregates(report_type, parts)
+
+    def get_report_columns(
+            self,
+            report_type: str) -> Optional[Sequence[str]]:
+        """Возвращает колонки отчета ReportGenerator"""
+        return self._generator.get_report_columns(report_type)
@@ -3,11 +3,15 @@
 """
 import argparse
 import sys
-from typing import List, Dict, Any
+import time
+from typing import List, Dict, Any, Iterator, Optional
 
 from src.services.data_service import DataService
 from src.services.report_service import ReportService
 from src.config import config
+from src.employee_table import EmployeeData
+from src.quarantine import QuarantineParts
+from src.utils.watch import FileChanges, FileWatcher
 
 
 class Application:
@@ -33,16 +37,205 @@ class Application:
         Args:
             args: Аргументы командной строки
         """
-        # Загружаем данные
-        data = self._load_data(args)
-
         # Генерируем отчет (используем конфигурацию по умолчанию)
         report_type = args.report or config.get(
             'DEFAULT_REPORT_TYPE', 'performance')
-        report = self._report_service.generate_report(report_type, data)
+
+        memory_limit = getattr(args, 'memory_limit', None)
+        if memory_limit is not None:
+            self._report_service.configure_generator(
+                memory_limit=memory_limit * 1024 * 1024)
+
+        # Загрузчик проверяет только колонки, нужные отчету
+        self._data_service.configure_loader(
+            columns=self._report_service.get_report_columns(report_type),
+            **self._loader_options(args))
+
+        if getattr(args, 'watch', False):
+            if getattr(args, 'stream', False) or self._samples(args):
+                raise ValueError(
+                    "--stream, --sample-rate, --sample-size и --deadline "
+                    "не поддерживаются вместе с --watch")
+            interval = getattr(args, 'watch_interval', None)
+            self._watch(args, report_type, interval if interval is not None
+                        else config.get('WATCH_INTERVAL', 2.0))
+            return
+
+        if getattr(args, 'stream', False):
+            if self._samples(args):
+                raise ValueError(
+                    "--sample-rate, --sample-size и --deadline "
+                    "не поддерживаются вместе с --stream")
+            # Сворачиваем записи по мере чтения, не храня весь набор
+            records = self._iter_data(args)
+            report = self._report_service.generate_report_stream(
+                report_type, records)
+        else:
+            # Загружаем данные; по выборке отчет показывает оценки
+            data = self._load_data(args)
+            sample = self._data_service.get_load_summary().get('sample')
+            report = self._report_service.generate_report(
+                report_type, data, sample)
 
         # Выводим результат
         print(report)
+        self._print_load_summary()
+
+    def _watch(self,
+               args: argparse.Namespace,
+               report_type: str,
+               interval: float) -> None:
+        """
+        Перестраивает отчет при изменении файлов, пока не прерван (Ctrl+C)
+
+        Каждые interval секунд файлы ищутся заново (для --folder)
+        и проверяются одним stat на файл. Заново загружаются только
+        добавленные и измененные файлы: отчет хранит агрегаты каждого
+        файла отдельно и объединяет их в порядке файлов, поэтому
+        данные неизмененных файлов не читаются и не сворачиваются
+        повторно. Файл, который не удалось загрузить (например,
+        записанный не до конца), пропускается до следующего изменения.
+        Карантин и итоги загрузки после каждого обновления описывают
+        все текущие файлы, а не только загруженные заново.
+
+        Args:
+            args: Аргументы командной строки
+            report_type: Тип отчета
+            interval: Пауза между проверками в секундах
+        """
+        watcher = FileWatcher()
+        # Агрегаты отчета и итоги загрузки по файлам
+        parts: Dict[str, Any] = {}
+        quarantine = QuarantineParts(
+            getattr(args, 'quarantine_file', None)
+            or config.get('QUARANTINE_FILE', 'quarantine.jsonl'))
+        # Ошибка первого поиска файлов прерывает запуск, в цикле она
+        # только выводится
+        started = time.perf_counter()
+        files = self._data_service.list_files(args.files, args.folder)
+        last_error = None
+        try:
+            self._refresh(report_type, files, parts, watcher.poll(files),
+                          started, quarantine)
+            while True:
+                time.sleep(interval)
+                started = time.perf_counter()
+                try:
+                    files = self._data_service.list_files(
+                        args.files, args.folder)
+                    last_error = None
+                except (OSError, ValueError) as e:
+                    # Проверяются прежние файлы; ошибка выводится один раз
+                    if str(e) != last_error:
+                        print(f"Ошибка поиска файлов: {e}", file=sys.stderr)
+                    last_error = str(e)
+                changes = watcher.poll(files)
+                if changes:
+                    self._refresh(report_type, files, parts, changes,
+                                  started, quarantine)
+        except KeyboardInterrupt:
+            return
+        finally:
+            quarantine.close()
+
+    def _refresh(self,
+                 report_type: str,
+                 files: List[str],
+                 parts: Dict[str, Any],
+                 changes: FileChanges,
+                 started: float,
+                 quarantine: QuarantineParts) -> None:
+        """
+        Обновляет агрегаты измененных файлов и выводит отчет
+
+        Args:
+            report_type: Тип отчета
+            files: Текущие файлы в порядке загрузки
+            parts: Агрегаты и итоги загрузки по файлам (обновляются)
+            changes: Изменения с прошлой проверки
+            started: Время начала проверки (time.perf_counter())
+            quarantine: Карантин сессии (переписывается)
+        """
+        for path in changes.removed:
+            parts.pop(path, None)
+        for path in changes.added + changes.changed:
+            # Каждая загрузка начинает карантин заново, поэтому строки
+            # файла пишутся в его собственный карантин
+            self._data_service.configure_loader(
+                quarantine_file=quarantine.part_path(path))
+            try:
+                data = self._data_service.load_data(file_paths=[path])
+            except (OSError, ValueError) as e:
+                parts.pop(path, None)
+                print(f"Файл пропущен до следующего изменения: {e}",
+                      file=sys.stderr)
+                continue
+            parts[path] = (
+                self._report_service.aggregate(report_type, data),
+                self._data_service.get_load_summary())
+
+        loaded = [path for path in files if path in parts]
+        quarantine.write(loaded)
+        report = self._report_service.render_aggregates(
+            report_type, [parts[path][0] for path in loaded])
+        if sys.stdout.isatty():
+            # Новый отчет заменяет прежний на экране
+            print("\033[2J\033[H", end='')
+        print(report, flush=True)
+        self._print_load_summary(self._merge_summaries(
+            [parts[path][1] for path in loaded], quarantine.path))
+        print(f"Отчет обновлен за {time.perf_counter() - started:.3f} с: "
+              f"файлов {len(parts)}, добавлено {len(changes.added)}, "
+              f"изменено {len(changes.changed)}, "
+              f"удалено {len(changes.removed)}", file=sys.stderr)
+
+    @staticmethod
+    def _merge_summaries(summaries: List[Dict[str, Any]],
+                         quarantine_file: str) -> Dict[str, Any]:
+        """
+        Объединяет итоги загрузок отдельных файлов
+
+        Args:
+            summaries: Итоги загрузки каждого файла
+            quarantine_file: Общий файл карантина
+
+        Returns:
+            Итоги, как у загрузки всех файлов одним вызовом
+        """
+        merged: Dict[str, Any] = {}
+        for summary in summaries:
+            for key in ('rejected_rows', 'filtered_rows'):
+                if key in summary:
+                    merged[key] = merged.get(key, 0) + summary[key]
+            if 'excluded_files' in summary:
+                merged.setdefault('excluded_files', []).extend(
+                    summary['excluded_files'])
+            if summary.get('quarantine_file'):
+                merged['quarantine_file'] = quarantine_file
+        return merged
+
+    def _print_load_summary(
+            self, summary: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Выводит исключенные файлы и количество пропущенных строк
+
+        Args:
+            summary: Итоги загрузки (по умолчанию - последней загрузки)
+        """
+        if summary is None:
+            summary = self._data_service.get_load_summary()
+        for _, error in summary.get('excluded_files', []):
+            print(f"Файл исключен из загрузки: {error}", file=sys.stderr)
+        if 'filtered_rows' in summary:
+            print(f"Отброшено условиями отбора строк: "
+                  f"{summary['filtered_rows']}", file=sys.stderr)
+        if 'rejected_rows' not in summary:
+            return
+
+        message = f"Пропущено некорректных строк: {summary['rejected_rows']}"
+        if summary['rejected_rows'] and summary.get('quarantine_file'):
+            message += f" (сохранены в {summary['quarantine_file']})"
+        print(message, file=sys.stderr)
 
     def run_with_args(self) -> None:
         """
@@ -60,7 +253,54 @@ class Application:
 
         self.run(args)
 
-    def _load_data(self, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _samples(args: argparse.Namespace) -> bool:
+        """Проверяет, заданы ли выборка строк или срок загрузки"""
+        return any(getattr(args, name, None) for name in (
+            'sample_rate', 'sample_size', 'deadline'))
+
+    @staticmethod
+    def _loader_options(args: argparse.Namespace) -> Dict[str, Any]:
+        """
+        Собирает параметры загрузки из аргументов
+
+        Args:
+            args: Аргументы командной строки
+
+        Returns:
+            Словарь параметров (None - значение из конфигурации)
+        """
+        return {
+            'workers': getattr(args, 'workers', None),
+            'chunk_size': getattr(args, 'chunk_size', None),
+            'record_format': getattr(args, 'record_format', None),
+            'numeric_backend': getattr(args, 'numeric_backend', None),
+            'parser': getattr(args, 'parser', None),
+            'on_error': getattr(args, 'on_error', None),
+            'quarantine_file': getattr(args, 'quarantine_file', None),
+            'cache_enabled': False if getattr(args, 'no_cache', False)
+            else None,
+            'cache_dir': getattr(args, 'cache_dir', None),
+            'incremental': True if getattr(args, 'incremental', False)
+            else None,
+            'always_validate': getattr(args, 'always_validate', None),
+            'filters': getattr(args, 'filters', None),
+            'header_check': getattr(args, 'header_check', None),
+            'include_patterns': getattr(args, 'include', None),
+            'exclude_patterns': getattr(args, 'exclude', None),
+            'max_depth': getattr(args, 'max_depth', None),
+            'discovery_threads': getattr(args, 'discovery_threads', None),
+            'pipeline': True if getattr(args, 'pipeline', False) else None,
+            'discovery_manifest': True if getattr(args, 'manifest', False)
+            else None,
+            'rescan': True if getattr(args, 'rescan', False) else None,
+            'sample_rate': getattr(args, 'sample_rate', None),
+            'sample_size': getattr(args, 'sample_size', None),
+            'sample_seed': getattr(args, 'sample_seed', None),
+            'deadline': getattr(args, 'deadline', None),
+        }
+
+    def _load_data(self, args: argparse.Namespace) -> EmployeeData:
         """
         Загружает данные на основе аргументов
 
@@ -68,13 +308,28 @@ class Application:
             args: Аргументы командной строки
 
         Returns:
-            Список словарей с данными
+            Список словарей с данными или EmployeeTable
         """
         if args.folder:
             return self._data_service.load_data(folder_path=args.folder)
         else:
             return self._data_service.load_data(file_paths=args.files)
 
+    def _iter_data(self, args: argparse.Namespace) -> Iterator[Dict[str, Any]]:
+        """
+        Лениво читает данные на основе аргументов
+
+        Args:
+            args: Аргументы командной строки
+
+        Returns:
+            Итератор словарей с данными
+        """
+        if args.folder:
+            return self._data_service.iter_data(folder_path=args.folder)
+        else:
+            return self._data_service.iter_data(file_paths=args.files)
+
     @staticmethod
     def create_parser() -> argparse.ArgumentParser:
         """Создает парсер аргументов командной строки"""
@@ -93,6 +348,13 @@ class Application:
   python main.py --folder data --report performance
   python main.py --folder data --report skills
   python main.py --files data/employees1.csv --report performance
+  python main.py --folder data --filter "team=API Team" \\
+      --filter "experience_years>=3"
+  python main.py --folder data --sample-rate 0.05 --deadline 10
+  python main.py --folder data --stream --memory-limit 256
+  python main.py --folder data --exclude archive --exclude "backup*" \\
+      --max-depth 3
+  python main.py --folder data --watch --watch-interval 5
             """
         )
 
@@ -107,6 +369,61 @@ class Application:
             '--folder',
             help='Папка для автоматического поиска CSV файлов'
         )
+        parser.add_argument(
+            '--include',
+            action='append',
+            metavar='GLOB',
+            help='Шаблон файлов, которые ищутся в --folder: без "/" '
+                 'сравнивается с именем, с "/" - с путем относительно '
+                 'папки; можно указать несколько раз '
+                 '(по умолчанию: INCLUDE_PATTERNS из конфигурации)'
+        )
+        parser.add_argument(
+            '--exclude',
+            action='append',
+            metavar='GLOB',
+            help='Шаблон исключаемых файлов и папок в --folder; '
+                 'исключенные папки не обходятся. Пример: '
+                 '--exclude archive --exclude "*.bak.csv" '
+                 '(по умолчанию: EXCLUDE_PATTERNS из конфигурации)'
+        )
+        parser.add_argument(
+            '--max-depth',
+            type=_non_negative_int,
+            metavar='N',
+            help='Сколько уровней папок читается при поиске в подпапках: '
+                 '1 - только --folder; 0 - без ограничения '
+                 '(по умолчанию: MAX_DEPTH из конфигурации)'
+        )
+        parser.add_argument(
+            '--discovery-threads',
+            type=_positive_int,
+            metavar='N',
+            help='Количество потоков для параллельного чтения подпапок '
+                 '--folder (ускоряет поиск на сетевых дисках); '
+                 '1 - последовательный обход '
+                 '(по умолчанию: DISCOVERY_THREADS из конфигурации)'
+        )
+        parser.add_argument(
+            '--pipeline',
+            action='store_true',
+            help='Начинать разбор файлов --folder до окончания обхода '
+                 'папки; порядок данных не меняется '
+                 '(по умолчанию: PIPELINE_LOAD из конфигурации)'
+        )
+        parser.add_argument(
+            '--manifest',
+            action='store_true',
+            help='Запоминать содержимое папок --folder и не читать '
+                 'повторно папки, которые не изменились '
+                 '(по умолчанию: DISCOVERY_MANIFEST из конфигурации)'
+        )
+        parser.add_argument(
+            '--rescan',
+            action='store_true',
+            help='Прочитать все папки --folder заново, не используя '
+                 'сохраненный манифест'
+        )
 
         parser.add_argument(
             '--report',
@@ -114,4 +431,214 @@ class Application:
             choices=['performance', 'skills'],
             help=f'Тип отчета для генерации (по умолчанию: {default_report})'
         )
+        parser.add_argument(
+            '--stream',
+            action='store_true',
+            help='Потоковая обработка без хранения всех данных в памяти'
+        )
+        parser.add_argument(
+            '--workers',
+            type=_positive_int,
+            help='Количество процессов для параллельного разбора файлов '
+                 '(по умолчанию: LOAD_WORKERS из конфигурации)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=_non_negative_int,
+            help='Размер диапазона в байтах, на которые делятся большие '
+                 'файлы при параллельной загрузке; 0 - не делить '
+                 '(по умолчанию: CHUNK_SIZE из конфигурации)'
+        )
+        parser.add_argument(
+            '--record-format',
+            choices=['dict', 'employee', 'table'],
+            help='Представление данных в памяти: dict - список словарей, '
+                 'employee - список записей Employee, '
+                 'table - колоночная таблица '
+                 '(по умолчанию: RECORD_FORMAT из конфигурации)'
+        )
+        parser.add_argument(
+            '--numeric-backend',
+            choices=['python', 'numpy'],
+            help='Проверка числовых колонок: python - построчно, '
+                 'numpy - пакетами через numpy, если он установлен '
+                 '(по умолчанию: NUMERIC_BACKEND из конфигурации)'
+        )
+        parser.add_argument(
+            '--parser',
+            choices=['positional', 'dict'],
+            help='Разбор строк CSV: positional - csv.reader с индексами '
+                 'колонок из заголовка, dict - csv.DictReader '
+                 '(по умолчанию: CSV_PARSER из конфигурации)'
+        )
+        parser.add_argument(
+            '--on-error',
+            choices=['fail', 'collect', 'skip'],
+            help='Реакция на некорректную строку: fail - остановить '
+                 'загрузку, collect - пропустить строку и записать ее '
+                 'с причиной в файл карантина, skip - пропустить '
+                 '(по умолчанию: ON_ERROR из конфигурации)'
+        )
+        parser.add_argument(
+            '--quarantine-file',
+            help='Файл карантина для --on-error collect: .csv или .jsonl '
+                 '(по умолчанию: QUARANTINE_FILE из конфигурации)'
+        )
+        parser.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='Разбирать все файлы заново, не используя кэш '
+                 'разобранных файлов'
+        )
+        parser.add_argument(
+            '--cache-dir',
+            help='Папка кэша разобранных файлов '
+                 '(по умолчанию: CACHE_DIR из конфигурации)'
+        )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='У файлов, дополненных с конца после прошлого запуска, '
+                 'разбирать только новые строки и объединять их с кэшем '
+                 '(по умолчанию: INCREMENTAL_LOAD из конфигурации)'
+        )
+        parser.add_argument(
+            '--always-validate',
+            type=_column_list,
+            metavar='COLUMNS',
+            help='Колонки через запятую, которые проверяются при любом '
+                 'отчете; остальные колонки проверяются, только если '
+                 'они нужны отчету '
+                 '(по умолчанию: ALWAYS_VALIDATE_COLUMNS из конфигурации)'
+        )
+        parser.add_argument(
+            '--header-check',
+            choices=['fail', 'exclude', 'off'],
+            help='Проверка заголовков всех файлов до разбора: fail - '
+                 'прервать загрузку на первом файле без нужных колонок, '
+                 'exclude - исключить такие файлы, off - не проверять '
+                 'заранее (по умолчанию: HEADER_CHECK из конфигурации)'
+        )
+        parser.add_argument(
+            '--filter',
+            dest='filters',
+            action='append',
+            metavar='EXPR',
+            help='Условие отбора строк: "колонка оператор значение" '
+                 '(=, !=, <, <=, >, >=; сравнение - только для числовых '
+                 'колонок) или "колонка in (значение, ...)" / "not in"; '
+                 'можно указать несколько раз, строка должна пройти все '
+                 'условия. Пример: --filter "team=API Team" '
+                 '--filter "experience_years>=3"'
+        )
+        parser.add_argument(
+            '--memory-limit',
+            type=_non_negative_int,
+            metavar='MB',
+            help='Предел памяти агрегатов отчета в мегабайтах: при '
+                 'превышении частичные агрегаты сбрасываются во временные '
+                 'файлы и объединяются при построении отчета; '
+                 '0 - без ограничения '
+                 '(по умолчанию: MEMORY_LIMIT_MB из конфигурации)'
+        )
+        parser.add_argument(
+            '--watch',
+            action='store_true',
+            help='Следить за файлами и перестраивать отчет при их '
+                 'изменении, пока не прерван (Ctrl+C); заново '
+                 'загружаются только добавленные и измененные файлы'
+        )
+        parser.add_argument(
+            '--watch-interval',
+            type=_positive_float,
+            metavar='SECONDS',
+            help='Пауза между проверками файлов в режиме --watch '
+                 '(по умолчанию: WATCH_INTERVAL из конфигурации)'
+        )
+        sample_group = parser.add_mutually_exclusive_group()
+        sample_group.add_argument(
+            '--sample-rate',
+            type=_fraction,
+            metavar='RATE',
+            help='Доля строк (0..1), которые случайно отбираются '
+                 'в выборку; отчет показывает оценки средних и количеств '
+                 'с доверительными интервалами'
+        )
+        sample_group.add_argument(
+            '--sample-size',
+            type=_positive_int,
+            metavar='ROWS',
+            help='Размер простой случайной выборки строк всего набора '
+                 '(reservoir sampling); отчет показывает оценки '
+                 'с доверительными интервалами'
+        )
+        parser.add_argument(
+            '--sample-seed',
+            type=int,
+            metavar='SEED',
+            help='Начальное значение генератора случайных чисел '
+                 'для воспроизводимой выборки'
+        )
+        parser.add_argument(
+            '--deadline',
+            type=_positive_float,
+            metavar='SECONDS',
+            help='Срок загрузки в секундах: по его истечении чтение '
+                 'останавливается, и отчет строится по уже прочитанным '
+                 'строкам'
+        )
         return parser
+
+
+def _positive_int(value: str) -> int:
+    """Преобразует аргумент в положительное целое число"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"ожидается целое число: {value}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            f"ожидается положительное число: {value}")
+    return number
+
+
+def _fraction(value: str) -> float:
+    """Преобразует аргумент в долю из интервала (0, 1]"""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"ожидается число: {value}")
+    if not 0 < number <= 1:
+        raise argparse.ArgumentTypeError(
+            f"ожидается доля от 0 до 1: {value}")
+    return number
+
+
+def _positive_float(value: str) -> float:
+    """Преобразует аргумент в положительное число"""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"ожидается число: {value}")
+    if not number > 0:
+        raise argparse.ArgumentTypeError(
+            f"ожидается положительное число: {value}")
+    return number
+
+
+def _column_list(value: str) -> List[str]:
+    """Преобразует аргумент в список колонок через запятую"""
+    return [column.strip() for column in value.split(',')
+            if column.strip()]
+
+
+def _non_negative_int(value: str) -> int:
+    """Преобразует аргумент в неотрицательное целое число"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"ожидается целое число: {value}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(
+            f"ожидается неотрицательное число: {value}")
+    return number
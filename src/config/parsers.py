@@ -2,7 +2,7 @@
 Парсеры конфигурации
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 from .interfaces import ConfigurationParser
 
 
@@ -30,6 +30,11 @@ class TypeConverter:
         """Преобразует строку в булево значение"""
         return value.lower() in ('true', '1', 'yes', 'on')
 
+    @staticmethod
+    def to_list(value: str) -> List[str]:
+        """Преобразует строку значений через запятую в список"""
+        return [item.strip() for item in value.split(',') if item.strip()]
+
 
 class SimpleParser(ConfigurationParser):
     """Простой парсер конфигурации"""
@@ -57,7 +62,31 @@ class SimpleParser(ConfigurationParser):
             'AUTO_DISCOVER_CSV_FOLDER': TypeConverter.to_bool,
             'CSV_FOLDER_PATH': str,
             'INCLUDE_SUBFOLDERS': TypeConverter.to_bool,
+            'INCLUDE_PATTERNS': TypeConverter.to_list,
+            'EXCLUDE_PATTERNS': TypeConverter.to_list,
+            'MAX_DEPTH': TypeConverter.to_int,
+            'DISCOVERY_THREADS': TypeConverter.to_int,
+            'PIPELINE_LOAD': TypeConverter.to_bool,
+            'DISCOVERY_MANIFEST': TypeConverter.to_bool,
             'AUTO_DISCOVER_FOLDER': TypeConverter.to_bool,
+            # Ключи для загрузки данных
+            'LOAD_WORKERS': TypeConverter.to_int,
+            'CHUNK_SIZE': TypeConverter.to_int,
+            'RECORD_FORMAT': str,
+            'NUMERIC_BACKEND': str,
+            'CSV_PARSER': str,
+            'ON_ERROR': str,
+            'QUARANTINE_FILE': str,
+            'CACHE_ENABLED': TypeConverter.to_bool,
+            'CACHE_DIR': str,
+            'CACHE_MAX_SIZE_MB': TypeConverter.to_int,
+            'INCREMENTAL_LOAD': TypeConverter.to_bool,
+            'ALWAYS_VALIDATE_COLUMNS': TypeConverter.to_list,
+            'SAMPLE_CONFIDENCE': TypeConverter.to_float,
+            'MEMORY_LIMIT_MB': TypeConverter.to_int,
+            'WATCH_INTERVAL': TypeConverter.to_float,
+            'HEADER_CHECK': str,
+            'HEADER_CHECK_THREADS': TypeConverter.to_int,
         }
 
     def parse(self, raw_config: Dict[str, str]) -> Dict[str, Any]:
@@ -2,11 +2,67 @@
 Модуль для обработки CSV файлов
 """
 import csv
-from typing import List, Dict, Any
+import io
+import lzma
+import random
+import threading
+import time
+from functools import partial
+from itertools import islice
+from operator import itemgetter
+from concurrent.futures import (
+    FIRST_EXCEPTION, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait)
+from typing import (
+    List, Dict, Any, Callable, Iterable, Iterator, Optional, Sequence,
+    Tuple)
 import os
 
 from src.config import config
-from src.utils.discover import discover_csv_files
+from src.employee_table import EmployeeData, EmployeeTable, Record
+from src.filters import Condition, RowFilter
+from src.parse_cache import CacheEntry, FileStamp, ParseCache
+from src.quarantine import Quarantine
+from src.sampling import (
+    Deadline, Reservoir, SampleInfo, SampleMerger, sample_population)
+from src.schema import (
+    EmployeeSchema, Row, RowError, RowValidator, StringPools)
+from src.utils.chunking import split_record_ranges
+from src.utils.compression import compression_of, open_csv_text
+from src.utils.discover import (
+    DiscoveryQueue, discover_csv_files, iter_csv_files)
+
+
+# Отклоненная строка: номер строки, причина, исходная строка
+Rejection = Tuple[int, str, Row]
+
+# Функция учета отклоненной строки
+RejectRow = Callable[[int, str, Row], None]
+
+# Результат разбора файла или диапазона: данные, отклоненные строки,
+# число строк, отброшенных условиями отбора, и число строк, не попавших
+# в выборку (ни те, ни другие не проверялись)
+ParsedPart = Tuple[EmployeeData, List[Rejection], int, int]
+
+# Способ чтения файла с учетом кэша: ключ записи, размер и время
+# изменения файла, 'hit', 'append' или 'parse'
+CachePlan = Tuple[Optional[str], Optional[FileStamp], str]
+
+
+class _RangeRowError(Exception):
+    """Ошибка в записи диапазона с номером записи внутри диапазона"""
+
+    def __init__(self, index: int, message: str):
+        super().__init__(index, message)
+        self.index = index
+        self.message = message
+
+
+class _DeadlineReached(Exception):
+    """Чтение файла или диапазона остановлено по сроку deadline"""
+
+    def __init__(self, part: ParsedPart):
+        super().__init__(part)
+        self.part = part
 
 
 class CSVProcessor:
@@ -17,39 +73,1442 @@ class CSVProcessor:
         'performance', 'skills', 'team', 'experience_years'
     ]
 
-    def __init__(self):
-        self.data: List[Dict[str, Any]] = []
+    RECORD_FORMATS = ('dict', 'employee', 'table')
+
+    NUMERIC_BACKENDS = ('python', 'numpy')
+
+    # Разбор строк: csv.reader с индексами колонок из заголовка
+    # или csv.DictReader со словарем на каждую строку
+    PARSERS = ('positional', 'dict')
+
+    # Реакция на некорректную строку: прервать загрузку, пропустить
+    # строку с записью в файл карантина или просто пропустить
+    ON_ERROR_MODES = ('fail', 'collect', 'skip')
+
+    # Проверка заголовков всех файлов до разбора: прервать загрузку
+    # на первом некорректном файле, исключить такие файлы или
+    # не проверять заранее
+    HEADER_CHECKS = ('fail', 'exclude', 'off')
+
+    # Сколько найденных файлов может ждать разбора при load_folder()
+    # с pipeline=True
+    PIPELINE_QUEUE_SIZE = 256
+
+    # Количество строк в пакете для векторной проверки
+    BATCH_SIZE = 4096
+
+    # Колонки с небольшим числом различных значений: в записях
+    # словарей и Employee одинаковые значения ссылаются на одну строку
+    # из общего словаря загрузки (в EmployeeTable все строковые
+    # колонки и так хранятся кодами)
+    DICTIONARY_COLUMNS = ('position', 'team')
+
+    def __init__(self,
+                 workers: int = None,
+                 chunk_size: int = None,
+                 record_format: str = None,
+                 numeric_backend: str = None,
+                 on_error: str = None,
+                 quarantine_file: str = None,
+                 cache_enabled: bool = None,
+                 cache_dir: str = None,
+                 cache_max_size: int = None,
+                 incremental: bool = None,
+                 parser: str = None,
+                 columns: Sequence[str] = None,
+                 always_validate: Sequence[str] = None,
+                 filters: Sequence[str] = None,
+                 sample_rate: float = None,
+                 sample_size: int = None,
+                 sample_seed: int = None,
+                 deadline: float = None,
+                 header_check: str = None,
+                 header_threads: int = None,
+                 include_patterns: Sequence[str] = None,
+                 exclude_patterns: Sequence[str] = None,
+                 max_depth: int = None,
+                 discovery_threads: int = None,
+                 pipeline: bool = None,
+                 discovery_manifest: bool = None,
+                 rescan: bool = None):
+        """
+        Инициализация обработчика
+
+        Args:
+            workers: Количество процессов для параллельной загрузки
+                (берется из конфигурации если None)
+            chunk_size: Размер диапазона в байтах, на которые делятся
+                большие файлы при параллельной загрузке; 0 - не делить
+                (берется из конфигурации если None)
+            record_format: Представление результата load_data():
+                'dict' - список словарей, 'employee' - список Employee,
+                'table' - EmployeeTable (берется из конфигурации если None)
+            numeric_backend: Проверка числовых колонок: 'python' -
+                построчно, 'numpy' - пакетами через numpy, если он
+                установлен (берется из конфигурации если None)
+            on_error: Реакция на некорректную строку: 'fail' - ошибка,
+                'collect' - пропустить строку и записать ее в файл
+                карантина, 'skip' - только пропустить
+                (берется из конфигурации если None)
+            quarantine_file: Файл карантина для on_error='collect',
+                .csv или .jsonl (берется из конфигурации если None)
+            cache_enabled: Использовать кэш разобранных файлов
+                в load_data() (берется из конфигурации если None)
+            cache_dir: Папка кэша (берется из конфигурации если None)
+            cache_max_size: Максимальный размер кэша в байтах; 0 - без
+                ограничения (берется из конфигурации если None)
+            incremental: Разбирать у дополненных файлов только новые
+                записи, объединяя их с кэшем (берется из конфигурации
+                если None)
+            parser: Разбор строк: 'positional' - csv.reader с индексами
+                колонок, 'dict' - csv.DictReader (берется из
+                конфигурации если None)
+            columns: Колонки, которые проверяются и переносятся
+                в записи; остальные поля записей получают пустые
+                значения (по умолчанию - все REQUIRED_COLUMNS)
+            always_validate: Колонки, которые проверяются всегда,
+                даже если их нет в columns (берется из конфигурации
+                если None)
+            filters: Условия отбора строк, например 'team=API Team',
+                'experience_years>=3' или 'position in (Developer, QA)';
+                строки, не прошедшие все условия, пропускаются до
+                проверки и построения записи
+            sample_rate: Доля строк случайной выборки (каждая строка
+                берется с этой вероятностью); 0 - без выборки
+            sample_size: Размер простой случайной выборки строк
+                (reservoir sampling по всем файлам); 0 - без выборки
+            sample_seed: Начальное значение генератора случайных чисел
+                для воспроизводимой выборки (None - случайное)
+            deadline: Время загрузки в секундах, после которого чтение
+                останавливается и данные строятся по прочитанным
+                строкам; 0 - без ограничения
+            header_check: Проверка заголовков всех файлов до разбора:
+                'fail' - ошибка на первом некорректном файле,
+                'exclude' - исключить некорректные файлы из загрузки,
+                'off' - не проверять заранее (берется из конфигурации
+                если None)
+            header_threads: Количество потоков для чтения заголовков
+                (берется из конфигурации если None)
+            include_patterns: Glob шаблоны файлов, которые находит
+                discover_and_validate_files(); пустой список - все CSV
+                файлы (берется из конфигурации если None)
+            exclude_patterns: Glob шаблоны исключаемых файлов и папок;
+                исключенные папки не обходятся (берется из конфигурации
+                если None)
+            max_depth: Сколько уровней папок читается при поиске файлов;
+                0 - без ограничения (берется из конфигурации если None)
+            discovery_threads: Количество потоков чтения подпапок при
+                поиске файлов; 1 - последовательный обход (берется
+                из конфигурации если None)
+            pipeline: Начинать разбор файлов в load_folder() до
+                окончания обхода папки (берется из конфигурации если
+                None)
+            discovery_manifest: Сохранять результаты чтения папок
+                в манифест в cache_dir и не читать повторно папки
+                с прежним временем изменения (берется из конфигурации
+                если None)
+            rescan: Прочитать при поиске все папки, обновив манифест
+        """
+        self.data: EmployeeData = []
+        self.workers = 1
+        self.chunk_size = 0
+        self.record_format = 'dict'
+        self.numeric_backend = 'python'
+        self.on_error = 'fail'
+        self.quarantine_file = 'quarantine.jsonl'
+        self._quarantine: Optional[Quarantine] = None
+        self._string_pools: Optional[StringPools] = None
+        self.cache_enabled = False
+        self.cache_dir = '.csv_cache'
+        self.cache_max_size = 0
+        self.incremental = False
+        self.parser = 'positional'
+        self.columns = tuple(self.REQUIRED_COLUMNS)
+        self.always_validate: Tuple[str, ...] = ()
+        self.row_filter: Optional[RowFilter] = None
+        self._filtered_rows = 0
+        self.sample_rate = 0.0
+        self.sample_size = 0
+        self.sample_seed: Optional[int] = None
+        self.deadline = 0.0
+        self._deadline: Optional[Deadline] = None
+        self._deadline_reached = False
+        self._unsampled_rows = 0
+        self._sample: Optional[SampleInfo] = None
+        self.header_check = 'fail'
+        self.header_threads = 8
+        self._excluded_files: List[Tuple[str, str]] = []
+        self.include_patterns: Tuple[str, ...] = ()
+        self.exclude_patterns: Tuple[str, ...] = ()
+        self.max_depth = 0
+        self.discovery_threads = 1
+        self.pipeline = False
+        self.discovery_manifest = False
+        self.rescan = False
+        self.configure(
+            workers=workers if workers is not None
+            else config.get('LOAD_WORKERS', 1),
+            chunk_size=chunk_size if chunk_size is not None
+            else config.get('CHUNK_SIZE', 0),
+            record_format=record_format if record_format is not None
+            else config.get('RECORD_FORMAT', 'dict'),
+            numeric_backend=numeric_backend if numeric_backend is not None
+            else config.get('NUMERIC_BACKEND', 'python'),
+            on_error=on_error if on_error is not None
+            else config.get('ON_ERROR', 'fail'),
+            quarantine_file=quarantine_file if quarantine_file is not None
+            else config.get('QUARANTINE_FILE', 'quarantine.jsonl'),
+            cache_enabled=cache_enabled if cache_enabled is not None
+            else config.get('CACHE_ENABLED', False),
+            cache_dir=cache_dir if cache_dir is not None
+            else config.get('CACHE_DIR', '.csv_cache'),
+            cache_max_size=cache_max_size if cache_max_size is not None
+            else config.get('CACHE_MAX_SIZE_MB', 0) * 1024 * 1024,
+            incremental=incremental if incremental is not None
+            else config.get('INCREMENTAL_LOAD', False),
+            parser=parser if parser is not None
+            else config.get('CSV_PARSER', 'positional'),
+            columns=columns,
+            always_validate=always_validate if always_validate is not None
+            else config.get('ALWAYS_VALIDATE_COLUMNS', []),
+            filters=filters,
+            sample_rate=sample_rate,
+            sample_size=sample_size,
+            sample_seed=sample_seed,
+            deadline=deadline,
+            header_check=header_check if header_check is not None
+            else config.get('HEADER_CHECK', 'fail'),
+            header_threads=header_threads if header_threads is not None
+            else config.get('HEADER_CHECK_THREADS', 8),
+            include_patterns=include_patterns
+            if include_patterns is not None
+            else config.get('INCLUDE_PATTERNS', []),
+            exclude_patterns=exclude_patterns
+            if exclude_patterns is not None
+            else config.get('EXCLUDE_PATTERNS', []),
+            max_depth=max_depth if max_depth is not None
+            else config.get('MAX_DEPTH', 0),
+            discovery_threads=discovery_threads
+            if discovery_threads is not None
+            else config.get('DISCOVERY_THREADS', 1),
+            pipeline=pipeline if pipeline is not None
+            else config.get('PIPELINE_LOAD', False),
+            discovery_manifest=discovery_manifest
+            if discovery_manifest is not None
+            else config.get('DISCOVERY_MANIFEST', False),
+            rescan=rescan)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Не передает уже загруженные данные в дочерние процессы"""
+        state = self.__dict__.copy()
+        state['data'] = []
+        state['_quarantine'] = None
+        state['_string_pools'] = None
+        return state
+
+    def configure(self,
+                  workers: int = None,
+                  chunk_size: int = None,
+                  record_format: str = None,
+                  numeric_backend: str = None,
+                  on_error: str = None,
+                  quarantine_file: str = None,
+                  cache_enabled: bool = None,
+                  cache_dir: str = None,
+                  cache_max_size: int = None,
+                  incremental: bool = None,
+                  parser: str = None,
+                  columns: Sequence[str] = None,
+                  always_validate: Sequence[str] = None,
+                  filters: Sequence[str] = None,
+                  sample_rate: float = None,
+                  sample_size: int = None,
+                  sample_seed: int = None,
+                  deadline: float = None,
+                  header_check: str = None,
+                  header_threads: int = None,
+                  include_patterns: Sequence[str] = None,
+                  exclude_patterns: Sequence[str] = None,
+                  max_depth: int = None,
+                  discovery_threads: int = None,
+                  pipeline: bool = None,
+                  discovery_manifest: bool = None,
+                  rescan: bool = None) -> None:
+        """
+        Изменяет параметры загрузки
+
+        Args:
+            workers: Количество процессов для параллельной загрузки
+            chunk_size: Размер диапазона для разбиения больших файлов
+            record_format: Представление результата load_data()
+            numeric_backend: Способ проверки числовых колонок
+            on_error: Реакция на некорректную строку
+            quarantine_file: Файл карантина для on_error='collect'
+            cache_enabled: Использовать кэш разобранных файлов
+            cache_dir: Папка кэша
+            cache_max_size: Максимальный размер кэша в байтах
+            incremental: Дочитывать дополненные файлы через кэш
+            parser: Способ разбора строк CSV
+            columns: Колонки, которые проверяются и переносятся в записи
+            always_validate: Колонки, которые проверяются всегда
+            filters: Условия отбора строк (пустой список - без отбора)
+            sample_rate: Доля строк случайной выборки (0 - без выборки)
+            sample_size: Размер случайной выборки (0 - без выборки)
+            sample_seed: Начальное значение генератора выборки
+            deadline: Время загрузки в секундах (0 - без ограничения)
+            header_check: Проверка заголовков всех файлов до разбора
+            header_threads: Количество потоков для чтения заголовков
+            include_patterns: Шаблоны файлов для поиска в папке
+            exclude_patterns: Шаблоны исключаемых файлов и папок
+            max_depth: Глубина поиска файлов (0 - без ограничения)
+            discovery_threads: Количество потоков чтения подпапок
+            pipeline: Разбирать файлы папки во время ее обхода
+            discovery_manifest: Использовать манифест обхода папок
+            rescan: Читать все папки, не используя манифест
+
+        Raises:
+            ValueError: Если параметр имеет недопустимое значение
+        """
+        if workers is not None:
+            if workers < 1:
+                raise ValueError(
+                    "Количество процессов должно быть положительным")
+            self.workers = workers
+
+        if chunk_size is not None:
+            if chunk_size < 0:
+                raise ValueError(
+                    "Размер диапазона не может быть отрицательным")
+            self.chunk_size = chunk_size
+
+        if record_format is not None:
+            if record_format not in self.RECORD_FORMATS:
+                raise ValueError(
+                    f"Неподдерживаемый формат записей: '{record_format}'. "
+                    f"Доступные форматы: {', '.join(self.RECORD_FORMATS)}"
+                )
+            self.record_format = record_format
+
+        if numeric_backend is not None:
+            if numeric_backend not in self.NUMERIC_BACKENDS:
+                raise ValueError(
+                    f"Неподдерживаемый способ проверки чисел: "
+                    f"'{numeric_backend}'. Доступные способы: "
+                    f"{', '.join(self.NUMERIC_BACKENDS)}"
+                )
+            self.numeric_backend = numeric_backend
+
+        if on_error is not None:
+            if on_error not in self.ON_ERROR_MODES:
+                raise ValueError(
+                    f"Неподдерживаемый режим обработки ошибок: "
+                    f"'{on_error}'. Доступные режимы: "
+                    f"{', '.join(self.ON_ERROR_MODES)}"
+                )
+            self.on_error = on_error
+
+        if quarantine_file is not None:
+            self.quarantine_file = quarantine_file
+
+        if cache_enabled is not None:
+            self.cache_enabled = cache_enabled
+
+        if cache_dir is not None:
+            self.cache_dir = cache_dir
+
+        if cache_max_size is not None:
+            if cache_max_size < 0:
+                raise ValueError(
+                    "Размер кэша не может быть отрицательным")
+            self.cache_max_size = cache_max_size
+
+        if incremental is not None:
+            self.incremental = incremental
+
+        if parser is not None:
+            if parser not in self.PARSERS:
+                raise ValueError(
+                    f"Неподдерживаемый способ разбора: '{parser}'. "
+                    f"Доступные способы: {', '.join(self.PARSERS)}"
+                )
+            self.parser = parser
+
+        if columns is not None:
+            self.columns = self._known_columns(columns)
+
+        if always_validate is not None:
+            self.always_validate = self._known_columns(always_validate)
+
+        if filters is not None:
+            conditions = [
+                Condition.parse(expression, self.REQUIRED_COLUMNS)
+                for expression in filters]
+            self.row_filter = RowFilter(conditions) if conditions else None
+
+        if sample_rate is not None:
+            if not 0 <= sample_rate <= 1:
+                raise ValueError(
+                    "Доля выборки должна быть в диапазоне от 0 до 1")
+            self.sample_rate = sample_rate
+
+        if sample_size is not None:
+            if sample_size < 0:
+                raise ValueError(
+                    "Размер выборки не может быть отрицательным")
+            self.sample_size = sample_size
+
+        if self.sample_rate and self.sample_size:
+            raise ValueError(
+                "Долю выборки и размер выборки нельзя задать одновременно")
+
+        if sample_seed is not None:
+            self.sample_seed = sample_seed
+
+        if deadline is not None:
+            if deadline < 0:
+                raise ValueError(
+                    "Время загрузки не может быть отрицательным")
+            self.deadline = deadline
+
+        if header_check is not None:
+            if header_check not in self.HEADER_CHECKS:
+                raise ValueError(
+                    f"Неподдерживаемый режим проверки заголовков: "
+                    f"'{header_check}'. Доступные режимы: "
+                    f"{', '.join(self.HEADER_CHECKS)}"
+                )
+            self.header_check = header_check
+
+        if header_threads is not None:
+            if header_threads < 1:
+                raise ValueError(
+                    "Количество потоков должно быть положительным")
+            self.header_threads = header_threads
+
+        if include_patterns is not None:
+            self.include_patterns = tuple(include_patterns)
+
+        if exclude_patterns is not None:
+            self.exclude_patterns = tuple(exclude_patterns)
+
+        if max_depth is not None:
+            if max_depth < 0:
+                raise ValueError(
+                    "Глубина обхода не может быть отрицательной")
+            self.max_depth = max_depth
+
+        if discovery_threads is not None:
+            if discovery_threads < 1:
+                raise ValueError(
+                    "Количество потоков должно быть положительным")
+            self.discovery_threads = discovery_threads
+
+        if pipeline is not None:
+            self.pipeline = pipeline
+
+        if discovery_manifest is not None:
+            self.discovery_manifest = discovery_manifest
+
+        if rescan is not None:
+            self.rescan = rescan
+
+    def _known_columns(self, columns: Sequence[str]) -> Tuple[str, ...]:
+        """
+        Проверяет, что колонки входят в REQUIRED_COLUMNS
+
+        Raises:
+            ValueError: Если колонка неизвестна
+        """
+        unknown = [
+            column for column in columns
+            if column not in self.REQUIRED_COLUMNS]
+        if unknown:
+            raise ValueError(
+                f"Неизвестные колонки: {', '.join(unknown)}. "
+                f"Доступные колонки: {', '.join(self.REQUIRED_COLUMNS)}")
+        return tuple(columns)
+
+    def _schema(self) -> EmployeeSchema:
+        """
+        Создает схему, проверяющую columns, always_validate и колонки
+        условий отбора
+
+        Условие пропускает значение, которое не удается преобразовать,
+        поэтому такую строку должна отклонить проверка схемы.
+        """
+        validated = self.columns + self.always_validate
+        if self.row_filter is not None:
+            validated += self.row_filter.columns
+        return EmployeeSchema.from_config(self.REQUIRED_COLUMNS, validated)
+
+    def _filtered_count(self) -> int:
+        """Возвращает число строк, отброшенных условиями отбора"""
+        if self.row_filter is None:
+            return 0
+        return self.row_filter.filtered
+
+    def _approximate(self) -> bool:
+        """Загрузка строит выборку или ограничена по времени"""
+        return bool(self.sample_rate or self.sample_size or self.deadline)
+
+    def _random(self, source: str) -> random.Random:
+        """
+        Создает генератор случайных чисел для части данных
+
+        С sample_seed выборка части зависит только от начального
+        значения и source, а не от порядка выполнения задач в пуле.
+        """
+        if self.sample_seed is None:
+            return random.Random()
+        return random.Random(f"{self.sample_seed}:{source}")
+
+    def _start_deadline(self) -> None:
+        """Начинает отсчет времени загрузки"""
+        self._deadline = None
+        if self.deadline:
+            self._deadline = Deadline(time.time() + self.deadline)
+        self._deadline_reached = False
+
+    def _until_deadline(self, task: Callable[..., ParsedPart],
+                        *args: Any) -> ParsedPart:
+        """Выполняет задачу разбора, принимая ее частичный результат"""
+        try:
+            return task(*args)
+        except _DeadlineReached as e:
+            self._deadline_reached = True
+            return e.part
+
+    def _finish_part(self,
+                     data: EmployeeData,
+                     rejected: List[Rejection],
+                     filtered: int,
+                     unsampled: int) -> ParsedPart:
+        """
+        Возвращает результат разбора части
+
+        Raises:
+            _DeadlineReached: Если чтение части остановлено по deadline
+        """
+        part = (data, rejected, filtered, unsampled)
+        if self._deadline is not None and self._deadline.stopped:
+            raise _DeadlineReached(part)
+        return part
 
-    def load_data(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+    def get_load_summary(self) -> Dict[str, Any]:
+        """
+        Возвращает итоги последней загрузки
+
+        Returns:
+            Для on_error='collect' или 'skip' - количество отклоненных
+            строк (rejected_rows) и файл карантина (quarantine_file,
+            None если строки не сохранялись); с условиями отбора -
+            количество отброшенных ими строк (filtered_rows); если
+            load_data() вернул выборку или остановился по deadline -
+            SampleInfo (sample); с header_check='exclude' - список
+            исключенных файлов с причинами (excluded_files); иначе
+            пустой словарь
+        """
+        summary: Dict[str, Any] = {}
+        if self._quarantine is not None:
+            summary['rejected_rows'] = self._quarantine.count
+            summary['quarantine_file'] = self._quarantine.path
+        if self.row_filter is not None:
+            summary['filtered_rows'] = self._filtered_rows
+        if self._sample is not None:
+            summary['sample'] = self._sample
+        if self.header_check == 'exclude':
+            summary['excluded_files'] = list(self._excluded_files)
+        return summary
+
+    def load_data(self, file_paths: List[str]) -> EmployeeData:
         """
         Загружает и объединяет данные из нескольких CSV файлов
 
+        При включенном кэше неизмененные файлы читаются из кэша
+        без разбора, а разобранные файлы сохраняются в него.
+
+        С sample_rate или sample_size возвращается случайная выборка
+        строк, с deadline - строки, прочитанные до истечения срока
+        (файлы читаются по порядку). В обоих случаях кэш не
+        используется, а get_load_summary() описывает выборку.
+        Невыбранные строки не проверяются.
+
+        До разбора заголовки всех файлов проверяются согласно
+        header_check (см. _check_headers()).
+
         Args:
             file_paths: Список путей к CSV файлам
 
         Returns:
-            Список словарей с данными сотрудников
+            Список записей сотрудников (словарей или Employee)
+            или EmployeeTable, согласно record_format
 
         Raises:
             FileNotFoundError: Если файл не найден
             ValueError: Если файл имеет некорректную структуру
         """
-        all_data: List[Dict[str, Any]] = []
+        file_paths = self._check_headers(file_paths)
+        return self._load(partial(self._load_files, file_paths))
 
-        for file_path in file_paths:
-            self._validate_file_exists(file_path)
-            file_data = self._load_single_file(file_path)
-            all_data.extend(file_data)
+    def load_folder(self, folder_path: str) -> EmployeeData:
+        """
+        Находит CSV файлы в папке и загружает их
+
+        Без pipeline равносилен load_data(discover_and_validate_files()).
+        С pipeline=True разбор начинается до окончания обхода папки:
+        обход идет в фоновом потоке (DiscoveryQueue), а каждый
+        найденный файл сразу проверяется по заголовку и отправляется
+        на разбор (в пул процессов при workers > 1). Результаты
+        объединяются в порядке путей, как у discover_and_validate_files(),
+        поэтому данные, ошибки и итоги загрузки совпадают с обычным
+        режимом. Выборка, deadline и chunk_size конвейером
+        не поддерживаются: с ними файлы загружаются после обхода.
+
+        Args:
+            folder_path: Путь к папке для поиска CSV файлов
+
+        Returns:
+            Данные всех найденных файлов, как у load_data()
+
+        Raises:
+            FileNotFoundError: Если папка или файл не найдены
+            NotADirectoryError: Если путь не является папкой
+            PermissionError: Если нет доступа к папке
+            ValueError: Если в папке нет CSV файлов или файл имеет
+                некорректную структуру
+        """
+        if not self.pipeline or self._approximate() or self.chunk_size:
+            return self.load_data(
+                self.discover_and_validate_files(folder_path))
+
+        entries = iter_csv_files(
+            folder_path, **self._discovery_options())
+        return self._load(partial(
+            self._load_pipelined, folder_path, entries))
+
+    def _load(
+            self,
+            load_files: Callable[
+                [Optional[ParseCache]], Iterator[Tuple[EmployeeData, float]]]
+    ) -> EmployeeData:
+        """
+        Объединяет данные файлов в результат загрузки
+
+        Args:
+            load_files: Функция, которая по кэшу отдает данные файлов
+                в порядке загрузки (см. _load_files())
+
+        Returns:
+            Данные всех файлов или их выборка
+        """
+        all_data = self._new_container()
+        self._open_quarantine()
+        self._string_pools = self._new_string_pools()
+        self._filtered_rows = 0
+        self._sample = None
+        self._start_deadline()
+        merger = None
+        if self._approximate():
+            merger = SampleMerger(
+                self.sample_size or None, self._random('merge'), all_data)
+        cache = self._open_cache()
+
+        try:
+            for file_data, population in load_files(cache):
+                if merger is None:
+                    all_data.extend(file_data)
+                else:
+                    merger.add(file_data, population)
+        finally:
+            self._close_quarantine()
+            self._string_pools = None
+            self._deadline = None
+            if cache is not None:
+                cache.close()
+
+        if merger is not None:
+            all_data = merger.result()
+            sample = SampleInfo(
+                merger.population, len(all_data),
+                complete=not self._deadline_reached,
+                confidence=config.get('SAMPLE_CONFIDENCE', 0.95))
+            if not (sample.exact and sample.complete):
+                self._sample = sample
+
+        if isinstance(all_data, EmployeeTable):
+            all_data.freeze()
 
         self.data = all_data
         return all_data
 
+    def load_table(self, file_paths: List[str]) -> EmployeeTable:
+        """
+        Загружает данные из нескольких CSV файлов в колоночную таблицу
+
+        Args:
+            file_paths: Список путей к CSV файлам
+
+        Returns:
+            EmployeeTable с данными сотрудников
+
+        Raises:
+            FileNotFoundError: Если файл не найден
+            ValueError: Если файл имеет некорректную структуру
+        """
+        record_format = self.record_format
+        self.record_format = 'table'
+        try:
+            return self.load_data(file_paths)
+        finally:
+            self.record_format = record_format
+
+    def _open_quarantine(self) -> None:
+        """Начинает учет отклоненных строк для новой загрузки"""
+        if self.on_error == 'fail':
+            self._quarantine = None
+            return
+        path = self.quarantine_file if self.on_error == 'collect' else None
+        self._quarantine = Quarantine(self.REQUIRED_COLUMNS, path)
+
+    def _close_quarantine(self) -> None:
+        """Закрывает файл карантина, сохраняя итоги загрузки"""
+        if self._quarantine is not None:
+            self._quarantine.close()
+
+    def _reject(self, file_path: str, row_num: int,
+                error: str, row: Row) -> None:
+        """Передает отклоненную строку в карантин"""
+        self._quarantine.add(file_path, row_num, error, row)
+
+    def _new_string_pools(self) -> StringPools:
+        """
+        Создает словари строк для колонок DICTIONARY_COLUMNS
+
+        Для формата 'table' словари не нужны: StringColumn сам
+        кодирует значения.
+        """
+        if self.record_format == 'table':
+            return {}
+        return {column: {} for column in self.DICTIONARY_COLUMNS}
+
+    def _open_cache(self) -> Optional[ParseCache]:
+        """
+        Создает кэш для загрузки, если он включен
+
+        Выборки и загрузки до deadline в кэш не попадают.
+        """
+        if not self.cache_enabled or self._approximate():
+            return None
+        # Записи с отбором строк хранят только прошедшие его строки
+        key = self._schema().fingerprint()
+        if self.row_filter is not None:
+            key += self.row_filter.fingerprint()
+        return ParseCache(self.cache_dir, self.cache_max_size, key)
+
+    def _load_files(
+            self,
+            file_paths: List[str],
+            cache: Optional[ParseCache],
+            plans: Optional[List[CachePlan]] = None,
+            parsed: Optional[Iterator[ParsedPart]] = None
+    ) -> Iterator[Tuple[EmployeeData, float]]:
+        """
+        Загружает файлы по порядку, используя кэш
+
+        Файлы без актуальной записи в кэше разбираются (параллельно при
+        workers > 1) и сохраняются в кэш; остальные читаются из кэша.
+        С incremental=True у дополненного с конца файла разбирается
+        только новый хвост. Отклоненные строки из кэша учитываются так же,
+        как при разборе, поэтому результат и ошибки не зависят от наличия
+        записи в кэше. Файлы после остановленного по deadline не читаются.
+
+        Args:
+            file_paths: Список путей к CSV файлам
+            cache: Кэш разобранных файлов или None
+            plans: Готовые планы чтения файлов (_plan_cached())
+            parsed: Результаты разбора файлов с планом 'parse' в порядке
+                file_paths, если файлы уже разбираются (конвейер)
+
+        Yields:
+            Данные файлов (выборки, если она задана) в исходном порядке
+            и оценка числа корректных строк, из которых взяты данные
+        """
+        if plans is None:
+            plans = [self._plan_cached(file_path, cache)
+                     for file_path in file_paths]
+
+        if parsed is None:
+            misses = [
+                file_path
+                for file_path, (_, _, mode) in zip(file_paths, plans)
+                if mode == 'parse'
+            ]
+            if self.workers > 1:
+                parsed = self._load_parallel(misses)
+            else:
+                parsed = (
+                    self._until_deadline(self._load_file_task, file_path)
+                    for file_path in misses)
+
+        for file_path, (key, stamp, mode) in zip(file_paths, plans):
+            entry = cache.load(key) if mode != 'parse' else None
+            if entry is not None and mode == 'hit':
+                table, rejected, state = entry
+                self._filtered_rows += (
+                    state['rows'] - len(table) - len(rejected))
+                yield self._from_cache(file_path, table, rejected), len(table)
+                continue
+
+            unsampled = 0
+            if entry is not None:
+                data, rejected, rows = self._load_appended(
+                    file_path, entry, stamp[0])
+                filtered = rows - len(data) - len(rejected)
+            else:
+                if mode == 'parse':
+                    data, rejected, filtered, unsampled = next(parsed)
+                else:
+                    # Запись удалена или повреждена: разбираем файл заново
+                    data, rejected, filtered, unsampled = (
+                        self._load_file_task(file_path))
+                rows = len(data) + len(rejected) + filtered + unsampled
+            self._filtered_rows += filtered
+
+            # Файл мог измениться во время разбора
+            if key is not None and ParseCache.stamp(file_path) == stamp:
+                cache.store(key, data, rejected, file_path, stamp, rows)
+
+            if entry is not None:
+                data = self._records_from_table(data)
+            self._apply_rejections(file_path, rejected)
+            yield data, sample_population(
+                len(data), len(rejected), unsampled)
+            if self._deadline_reached:
+                return
+
+    def _load_pipelined(
+            self,
+            folder_path: str,
+            entries: Iterator[Tuple[str, int]],
+            cache: Optional[ParseCache]
+    ) -> Iterator[Tuple[EmployeeData, float]]:
+        """
+        Разбирает файлы по мере обхода папки
+
+        Файлы разбираются в порядке обхода, а данные отдаются в порядке
+        путей. Заголовки проверяются до разбора файла; после первой
+        ошибки (заголовка при header_check='fail' или разбора при
+        on_error='fail') новые файлы на разбор не отправляются, но
+        обход продолжается: ошибкой загрузки становится ошибка первого
+        по порядку путей файла, как в load_data(). Неразобранные файлы
+        перед ним разбираются при объединении.
+
+        Args:
+            folder_path: Путь к папке
+            entries: Файлы папки в порядке обхода (iter_csv_files())
+            cache: Кэш разобранных файлов или None
+
+        Yields:
+            Данные файлов в порядке путей, как у _load_files()
+        """
+        feed = DiscoveryQueue(entries, self.PIPELINE_QUEUE_SIZE)
+        executor = None
+        if self.workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+        plans: Dict[str, CachePlan] = {}
+        header_errors: Dict[str, str] = {}
+        futures: Dict[str, Future] = {}
+        failed = threading.Event()
+
+        def note_failure(future: Future) -> None:
+            if not future.cancelled() and future.exception() is not None:
+                failed.set()
+
+        try:
+            for file_path, _ in feed:
+                error = None
+                if self.header_check != 'off':
+                    error = self._check_header(file_path)
+                if error is not None:
+                    header_errors[file_path] = error
+                    if self.header_check == 'fail':
+                        failed.set()
+                    continue
+                plans[file_path] = self._plan_cached(file_path, cache)
+                if plans[file_path][2] != 'parse' or failed.is_set():
+                    continue
+                if executor is not None:
+                    future = executor.submit(
+                        self._load_file_task, file_path)
+                else:
+                    future = Future()
+                    try:
+                        future.set_result(self._load_file_task(file_path))
+                    except Exception as e:
+                        future.set_exception(e)
+                future.add_done_callback(note_failure)
+                futures[file_path] = future
+
+            file_paths = sorted(plans.keys() | header_errors.keys())
+            if not file_paths:
+                raise ValueError(
+                    f"В папке {folder_path} не найдено CSV файлов")
+            self._excluded_files = [
+                (file_path, header_errors[file_path])
+                for file_path in file_paths if file_path in header_errors]
+            if self._excluded_files and self.header_check == 'fail':
+                raise ValueError(self._excluded_files[0][1])
+            if len(self._excluded_files) == len(file_paths):
+                raise ValueError(
+                    f"Все файлы исключены проверкой заголовков. "
+                    f"{self._excluded_files[0][1]}")
+            if self.header_check != 'exclude':
+                self._excluded_files = []
+
+            selected = [file_path for file_path in file_paths
+                        if file_path in plans]
+
+            def parsed() -> Iterator[ParsedPart]:
+                for file_path in selected:
+                    if plans[file_path][2] != 'parse':
+                        continue
+                    future = futures.get(file_path)
+                    if future is None:
+                        yield self._load_file_task(file_path)
+                    else:
+                        yield future.result()
+
+            yield from self._load_files(
+                selected, cache, [plans[path] for path in selected],
+                parsed())
+        finally:
+            feed.close()
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+    def _plan_cached(
+            self,
+            file_path: str,
+            cache: Optional[ParseCache]
+    ) -> CachePlan:
+        """
+        Выбирает способ загрузки файла по записи кэша
+
+        Returns:
+            Ключ записи, размер и время изменения файла и способ:
+            'hit' - запись актуальна, 'append' - файл дополнен и
+            разбирается только хвост, 'parse' - полный разбор
+        """
+        stamp = ParseCache.stamp(file_path) if cache is not None else None
+        if stamp is None:
+            # Без кэша или без файла: ошибку выбросит разбор
+            return None, None, 'parse'
+
+        key = cache.key(file_path)
+        state = cache.peek(key)
+        if state is None:
+            return key, stamp, 'parse'
+        if ParseCache.is_current(state, stamp):
+            return key, stamp, 'hit'
+        if self.incremental and ParseCache.resume_point(
+                file_path, state, stamp) is not None:
+            return key, stamp, 'append'
+        return key, stamp, 'parse'
+
+    def _from_cache(self,
+                    file_path: str,
+                    table: EmployeeTable,
+                    rejected: List[Rejection]) -> EmployeeData:
+        """Отдает данные актуальной записи кэша"""
+        self._apply_rejections(file_path, rejected)
+        return self._records_from_table(table)
+
+    def _load_appended(
+            self,
+            file_path: str,
+            entry: CacheEntry,
+            size: int) -> Tuple[EmployeeTable, List[Rejection], int]:
+        """
+        Дочитывает дополненный файл, начиная с конца разобранной части
+
+        Args:
+            file_path: Путь к CSV файлу
+            entry: Запись кэша с данными разобранной части
+            size: Размер файла, до которого читаются новые записи
+
+        Returns:
+            Данные всего файла, его отклоненные строки и число
+            разобранных записей (вместе с отброшенными отбором)
+
+        Raises:
+            ValueError: Если новая строка некорректна при on_error='fail'
+        """
+        table, rejected, state = entry
+        offset, rows = state['offset'], state['rows']
+
+        with open(file_path, 'r', encoding='utf-8', newline='') as file:
+            fieldnames = next(csv.reader(file), [])
+        self._validate_columns(fieldnames, file_path)
+
+        # Номер строки первой новой записи: после заголовка и rows записей
+        first_row = rows + 2
+        try:
+            tail, tail_rejected, filtered, _ = self._load_range(
+                file_path, fieldnames, offset, size)
+        except _RangeRowError as e:
+            raise ValueError(self._format_row_error(
+                first_row + e.index, file_path, e.message))
+
+        data = EmployeeTable()
+        data.extend(table)
+        data.extend(tail)
+        rejected = list(rejected) + [
+            (first_row + row_num, error, row)
+            for row_num, error, row in tail_rejected
+        ]
+        return data, rejected, (
+            rows + len(tail) + len(tail_rejected) + filtered)
+
+    def _apply_rejections(self,
+                          file_path: str,
+                          rejected: List[Rejection]) -> None:
+        """
+        Учитывает отклоненные строки файла
+
+        Raises:
+            ValueError: Если on_error='fail' - для первой строки
+        """
+        if not rejected:
+            return
+        if self.on_error == 'fail':
+            row_num, error, _ = rejected[0]
+            raise ValueError(
+                self._format_row_error(row_num, file_path, error))
+        for row_num, error, row in rejected:
+            self._reject(file_path, row_num, error, row)
+
+    def _records_from_table(self, table: EmployeeTable) -> EmployeeData:
+        """Преобразует таблицу из кэша в записи согласно record_format"""
+        if self.record_format == 'table':
+            return table
+
+        make_record = EmployeeSchema.RECORD_FACTORIES[self.record_format]
+        return list(map(
+            make_record, table.name, table.position,
+            table.completed_tasks, table.performance,
+            table.skills, table.team, table.experience_years))
+
+    def _new_container(self) -> EmployeeData:
+        """Создает пустой контейнер записей согласно record_format"""
+        if self.record_format == 'table':
+            return EmployeeTable()
+        return []
+
+    def _load_parallel(
+            self,
+            file_paths: List[str]
+    ) -> Iterator[ParsedPart]:
+        """
+        Загружает файлы в пуле процессов
+
+        Файлы больше chunk_size делятся на диапазоны по границам записей,
+        остальные разбираются целиком. Результаты отдаются в порядке
+        file_paths, номера строк в ошибках совпадают с последовательной
+        загрузкой. Выборки диапазонов файла объединяются в выборку файла.
+        После первой части, остановленной по deadline, результаты
+        следующих частей не используются: данные остаются началом
+        набора в порядке файлов.
+
+        Args:
+            file_paths: Список путей к CSV файлам
+
+        Yields:
+            Результат разбора каждого файла (номера отклоненных строк -
+            в файле) в исходном порядке
+        """
+        tasks: List[Tuple[Callable, tuple]] = []
+        # Для каждого файла: путь и число диапазонов (0 - файл целиком)
+        plan: List[Tuple[str, int]] = []
+        planning_error = None
+
+        for file_path in file_paths:
+            try:
+                ranges = self._plan_file_ranges(file_path)
+            except (OSError, ValueError) as e:
+                # Последовательная загрузка остановилась бы на этом
+                # файле: ошибку выбрасываем после предыдущих задач
+                planning_error = e
+                break
+
+            if ranges is None:
+                tasks.append((self._load_file_task, (file_path,)))
+                plan.append((file_path, 0))
+                continue
+
+            fieldnames, byte_ranges = ranges
+            for start, end in byte_ranges:
+                tasks.append((
+                    self._load_range, (file_path, fieldnames, start, end)))
+            plan.append((file_path, len(byte_ranges)))
+
+        results = iter(self._run_ordered(tasks))
+
+        for file_path, range_count in plan:
+            if not range_count:
+                yield self._until_deadline(next(results).result)
+                if self._deadline_reached:
+                    return
+                continue
+
+            data = self._new_container()
+            merger = None
+            if self.sample_size:
+                merger = SampleMerger(
+                    self.sample_size, self._random(f"{file_path}:merge"),
+                    data)
+            rejected: List[Rejection] = []
+            offset = 2
+            file_filtered = 0
+            # Строки, прошедшие отбор: из них взята выборка файла
+            offered = 0
+            for _ in range(range_count):
+                try:
+                    records, range_rejected, filtered, unsampled = (
+                        self._until_deadline(next(results).result))
+                except _RangeRowError as e:
+                    raise ValueError(
+                        self._format_row_error(
+                            offset + e.index, file_path, e.message))
+
+                # Номера отклоненных строк диапазона считаются от его начала
+                rejected.extend(
+                    (offset + row_num, error, row)
+                    for row_num, error, row in range_rejected)
+                offset += (len(records) + len(range_rejected)
+                           + filtered + unsampled)
+                offered += len(records) + len(range_rejected) + unsampled
+                file_filtered += filtered
+                if merger is None:
+                    data.extend(records)
+                else:
+                    merger.add(records, sample_population(
+                        len(records), len(range_rejected), unsampled))
+                if self._deadline_reached:
+                    break
+
+            if merger is not None:
+                data = merger.result()
+            yield (data, rejected, file_filtered,
+                   offered - len(data) - len(rejected))
+            if self._deadline_reached:
+                return
+
+        if planning_error is not None:
+            raise planning_error
+
+    def _run_ordered(self, tasks: List[Tuple[Callable, tuple]]) -> list:
+        """
+        Выполняет задачи в пуле процессов с отменой при первой ошибке
+
+        Задачи из очереди отменяются, как только одна из них завершилась
+        с ошибкой; уже запущенные задачи дожидаются завершения.
+        Отмененные задачи всегда идут в очереди после запущенных,
+        поэтому при обходе результатов по порядку первой встретится
+        ошибка самой ранней задачи - та же, что и при последовательной
+        загрузке.
+
+        Args:
+            tasks: Список пар (функция, аргументы)
+
+        Returns:
+            Завершенные futures в порядке задач
+        """
+        if len(tasks) < 2:
+            # Для одной задачи пул процессов не нужен
+            futures = []
+            for func, args in tasks:
+                future: Future = Future()
+                try:
+                    future.set_result(func(*args))
+                except Exception as e:
+                    future.set_exception(e)
+                futures.append(future)
+            return futures
+
+        max_workers = min(self.workers, len(tasks))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(func, *args) for func, args in tasks]
+            _, pending = wait(futures, return_when=FIRST_EXCEPTION)
+
+            if pending:
+                for future in pending:
+                    future.cancel()
+                wait(pending)
+
+        return futures
+
+    def _plan_file_ranges(
+            self,
+            file_path: str
+    ) -> Optional[Tuple[List[str], List[Tuple[int, int]]]]:
+        """
+        Планирует разбиение файла на диапазоны байтов
+
+        Args:
+            file_path: Путь к CSV файлу
+
+        Returns:
+            Заголовки и диапазоны данных или None, если файл
+            разбирается целиком (в том числе сжатый файл)
+
+        Raises:
+            FileNotFoundError: Если файл не найден
+            ValueError: Если файл имеет некорректную структуру
+        """
+        self._validate_file_exists(file_path)
+        if not self.chunk_size or compression_of(file_path) or (
+                os.path.getsize(file_path) <= self.chunk_size):
+            return None
+
+        header_end, byte_ranges = split_record_ranges(
+            file_path, self.chunk_size)
+
+        with open(file_path, 'rb') as file:
+            header = file.read(header_end).decode('utf-8')
+        fieldnames = next(
+            csv.reader(io.StringIO(header, newline=None)), [])
+        self._validate_columns(fieldnames, file_path)
+
+        return fieldnames, byte_ranges
+
+    def _load_range(
+            self,
+            file_path: str,
+            fieldnames: List[str],
+            start: int,
+            end: int) -> ParsedPart:
+        """
+        Загружает записи из диапазона байтов файла
+
+        Args:
+            file_path: Путь к CSV файлу
+            fieldnames: Заголовки файла
+            start: Начало диапазона (граница записи)
+            end: Конец диапазона (граница записи)
+
+        Returns:
+            Данные диапазона, отклоненные строки (с номером записи
+            внутри диапазона), если on_error не 'fail', и число
+            отброшенных отбором и не попавших в выборку строк
+
+        Raises:
+            _RangeRowError: С номером записи внутри диапазона
+            _DeadlineReached: С прочитанной до срока частью диапазона
+        """
+        with open(file_path, 'rb') as file:
+            file.seek(start)
+            text = file.read(end - start).decode('utf-8')
+
+        stream = io.StringIO(text, newline=None)
+        keys = None
+        if self.parser == 'positional':
+            # Пустые строки пропускаются, как в csv.DictReader
+            reader = filter(None, csv.reader(stream))
+            keys = self._column_keys(fieldnames)
+        else:
+            reader = csv.DictReader(stream, fieldnames=fieldnames)
+        data = self._new_container()
+        rejected: List[Rejection] = []
+        reject = None
+        if self.on_error != 'fail':
+            reject = self._collect_into(rejected, fieldnames)
+
+        filtered, unsampled = self._filtered_count(), self._unsampled_rows
+        try:
+            data.extend(self._iter_valid_records(
+                reader, reject, keys, f"{file_path}:{start}"))
+        except RowError as e:
+            raise _RangeRowError(e.index, e.message)
+
+        return self._finish_part(
+            data, rejected, self._filtered_count() - filtered,
+            self._unsampled_rows - unsampled)
+
+    def _load_file_task(
+            self,
+            file_path: str) -> ParsedPart:
+        """
+        Загружает один файл, откладывая учет отклоненных строк
+
+        Отклоненные строки возвращаются вместе с данными: карантин
+        ведется в основном процессе после сохранения файла в кэш.
+
+        Returns:
+            Данные файла, отклоненные строки (с номером строки в файле)
+            и число отброшенных отбором и не попавших в выборку строк
+
+        Raises:
+            _DeadlineReached: С прочитанной до срока частью файла
+        """
+        self._validate_file_exists(file_path)
+        rejected: List[Rejection] = []
+        reject = None
+        if self.on_error != 'fail':
+            def reject(row_num: int, error: str, row: Row) -> None:
+                rejected.append((row_num, error, row))
+
+        filtered, unsampled = self._filtered_count(), self._unsampled_rows
+        data = self._new_container()
+        data.extend(self._iter_single_file(file_path, reject))
+        return self._finish_part(
+            data, rejected, self._filtered_count() - filtered,
+            self._unsampled_rows - unsampled)
+
+    def _collect_into(self,
+                      rejected: List[Rejection],
+                      fieldnames: List[str]) -> RejectRow:
+        """Возвращает функцию, собирающую отклоненные строки в список"""
+        def reject(row_num: int, error: str, row: Row) -> None:
+            rejected.append(
+                (row_num, error, self._row_dict(row, fieldnames)))
+        return reject
+
+    @staticmethod
+    def _row_dict(row: Row, fieldnames: List[str]) -> Dict[str, Any]:
+        """Представляет строку csv.reader или DictReader словарем"""
+        if isinstance(row, dict):
+            return dict(row)
+        return dict(zip(fieldnames, row))
+
+    def iter_records(
+            self,
+            file_paths: Iterable[str]) -> Iterator[Record]:
+        """
+        Лениво читает записи сотрудников из нескольких CSV файлов
+
+        В отличие от load_data() не накапливает данные в памяти:
+        каждая строка валидируется и отдается по мере чтения файла.
+        Выборка с sample_rate и остановка по deadline поддерживаются,
+        выборка фиксированного размера (sample_size) - нет: она
+        известна только после чтения всех файлов.
+
+        Args:
+            file_paths: Пути к CSV файлам
+
+        Yields:
+            Записи сотрудников (словари или Employee согласно record_format)
+
+        Raises:
+            FileNotFoundError: Если файл не найден
+            ValueError: Если файл имеет некорректную структуру или
+                задан sample_size
+        """
+        if self.sample_size:
+            raise ValueError(
+                "Выборка фиксированного размера не поддерживается "
+                "при потоковом чтении")
+        file_paths = self._check_headers(file_paths)
+        self._open_quarantine()
+        self._string_pools = self._new_string_pools()
+        self._filtered_rows = 0
+        self._sample = None
+        self._start_deadline()
+        filtered = self._filtered_count()
+        try:
+            for file_path in file_paths:
+                self._validate_file_exists(file_path)
+                yield from self._iter_single_file(file_path)
+                if self._deadline is not None and self._deadline.stopped:
+                    break
+        finally:
+            self._close_quarantine()
+            self._string_pools = None
+            self._deadline = None
+            self._filtered_rows = self._filtered_count() - filtered
+
+    def _check_headers(self, file_paths: List[str]) -> List[str]:
+        """
+        Проверяет заголовки всех файлов до начала разбора
+
+        Читается только первая строка каждого файла; файлы читаются
+        параллельно в пуле из header_threads потоков, так как проверка
+        упирается в открытие файлов и ввод-вывод. С header_check='fail'
+        выбрасывается ошибка первого по порядку файла с некорректным
+        заголовком, и ни один файл не разбирается; с 'exclude' такие
+        файлы исключаются из загрузки.
+
+        Args:
+            file_paths: Список путей к CSV файлам
+
+        Returns:
+            Файлы для загрузки в исходном порядке
+
+        Raises:
+            FileNotFoundError: Если файл не найден
+            ValueError: Если заголовок некорректен при header_check='fail'
+                или с 'exclude' исключены все файлы
+        """
+        self._excluded_files = []
+        if self.header_check == 'off' or not file_paths:
+            return file_paths
+
+        threads = min(self.header_threads, len(file_paths))
+        selected: List[str] = []
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            futures = [executor.submit(self._check_header, file_path)
+                       for file_path in file_paths]
+            try:
+                for file_path, future in zip(file_paths, futures):
+                    error = future.result()
+                    if error is None:
+                        selected.append(file_path)
+                    elif self.header_check == 'fail':
+                        raise ValueError(error)
+                    else:
+                        self._excluded_files.append((file_path, error))
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        if not selected:
+            raise ValueError(
+                f"Все файлы исключены проверкой заголовков. "
+                f"{self._excluded_files[0][1]}")
+        return selected
+
+    def _check_header(self, file_path: str) -> Optional[str]:
+        """
+        Проверяет заголовок одного файла
+
+        Returns:
+            Описание ошибки или None, если заголовок корректен
+
+        Raises:
+            FileNotFoundError: Если файл не найден
+        """
+        self._validate_file_exists(file_path)
+        try:
+            with open_csv_text(file_path, threaded=False) as file:
+                fieldnames = next(csv.reader(file), [])
+            self._validate_columns(fieldnames, file_path)
+        except UnicodeDecodeError as e:
+            return f"Файл {file_path} не является текстом в UTF-8: {e}"
+        except (ValueError, csv.Error) as e:
+            return str(e)
+        except FileNotFoundError:
+            raise
+        except (OSError, EOFError, lzma.LZMAError) as e:
+            # Поврежденный или обрезанный сжатый файл
+            return f"Файл {file_path} не удалось прочитать: {e}"
+        return None
+
     def _validate_file_exists(self, file_path: str) -> None:
         """Проверяет существование файла"""
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Файл не найден: {file_path}")
 
-    def _load_single_file(self, file_path: str) -> List[Dict[str, Any]]:
+    def _load_single_file(self, file_path: str) -> EmployeeData:
         """
         Загружает данные из одного CSV файла
 
@@ -57,27 +1516,81 @@ class CSVProcessor:
             file_path: Путь к CSV файлу
 
         Returns:
-            Список словарей с данными
+            Список словарей с данными или EmployeeTable
 
         Raises:
             ValueError: Если файл имеет некорректную структуру
         """
-        data: List[Dict[str, Any]] = []
+        data = self._new_container()
+        data.extend(self._iter_single_file(file_path))
+        return data
 
-        with open(file_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            # Приводим тип fieldnames к List[str]
-            fieldnames = list(reader.fieldnames) if reader.fieldnames else []
-            self._validate_columns(fieldnames, file_path)
+    def _iter_single_file(
+            self,
+            file_path: str,
+            reject: Optional[RejectRow] = None) -> Iterator[Record]:
+        """
+        Построчно читает и валидирует один CSV файл
 
-            for row_num, row in enumerate(reader, start=2):
-                processed_row = self._process_row(row, row_num, file_path)
-                data.append(processed_row)
+        Сжатые файлы (.csv.gz, .csv.bz2, .csv.xz) распаковываются
+        потоково в отдельном потоке.
 
-        return data
+        Args:
+            file_path: Путь к CSV файлу
+            reject: Функция учета отклоненной строки (номер строки
+                в файле, причина, строка-словарь); по умолчанию при
+                on_error='fail' выбрасывается ошибка, иначе строка
+                передается в карантин
 
-    def _validate_columns(self, columns: List[str], file_path: str) -> None:
-        """Проверяет наличие всех обязательных колонок"""
+        Yields:
+            Обработанные записи
+
+        Raises:
+            ValueError: Если файл имеет некорректную структуру
+        """
+        with open_csv_text(file_path) as file:
+            if self.parser == 'positional':
+                rows = csv.reader(file)
+                fieldnames = next(rows, [])
+                # Пустые строки пропускаются, как в csv.DictReader
+                reader = filter(None, rows)
+            else:
+                reader = csv.DictReader(file)
+                # Приводим тип fieldnames к List[str]
+                fieldnames = (
+                    list(reader.fieldnames) if reader.fieldnames else [])
+            keys = self._validate_columns(fieldnames, file_path)
+            if self.parser != 'positional':
+                keys = None
+
+            if reject is None and self.on_error != 'fail':
+                reject = partial(self._reject, file_path)
+
+            on_row_error = None
+            if reject is not None:
+                def on_row_error(index: int, error: str, row: Row) -> None:
+                    reject(index + 2, error, self._row_dict(row, fieldnames))
+
+            try:
+                yield from self._iter_valid_records(
+                    reader, on_row_error, keys, file_path)
+            except RowError as e:
+                # Нумерация строк файла начинается после заголовка
+                raise ValueError(self._format_row_error(
+                    e.index + 2, file_path, e.message))
+
+    def _validate_columns(self,
+                          columns: List[str],
+                          file_path: str) -> Dict[str, int]:
+        """
+        Проверяет наличие всех обязательных колонок
+
+        Returns:
+            Индекс каждой обязательной колонки в строке csv.reader
+
+        Raises:
+            ValueError: Если заголовков нет или не хватает колонок
+        """
         if not columns:
             raise ValueError(f"Файл {file_path} не содержит заголовков")
 
@@ -87,6 +1600,17 @@ class CSVProcessor:
                 f"Файл {file_path} содержит некорректные колонки. "
                 f"Отсутствуют: {', '.join(missing_columns)}"
             )
+        return self._column_keys(columns)
+
+    def _column_keys(self, columns: List[str]) -> Dict[str, int]:
+        """
+        Возвращает индексы обязательных колонок в заголовке
+
+        При повторяющихся заголовках берется последняя колонка,
+        как и в csv.DictReader. Остальные колонки не читаются.
+        """
+        positions = {column: index for index, column in enumerate(columns)}
+        return {column: positions[column] for column in self.REQUIRED_COLUMNS}
 
     def discover_and_validate_files(self, folder_path: str) -> List[str]:
         """
@@ -103,19 +1627,50 @@ class CSVProcessor:
             NotADirectoryError: Если путь не является папкой
             PermissionError: Если нет доступа к папке
         """
-        # Находим все CSV файлы в папке с учетом конфигурации
-        csv_files = discover_csv_files(folder_path)
-
-        # TODO: Здесь можно добавить валидацию структуры CSV файлов:
-        # - проверка наличия нужных колонок
-        # - валидация формата данных
-        # - фильтрация невалидных файлов
+        csv_files = self.discover_files(folder_path)
 
+        # Заголовки найденных файлов проверяются перед разбором
+        # в load_data() и iter_records() (header_check), данные строк -
+        # при разборе
         if not csv_files:
             raise ValueError(f"В папке {folder_path} не найдено CSV файлов")
 
         return csv_files
 
+    def discover_files(self, folder_path: str) -> List[str]:
+        """
+        Находит CSV файлы в папке с учетом параметров поиска
+
+        В отличие от discover_and_validate_files() папка без CSV файлов
+        не считается ошибкой.
+
+        Args:
+            folder_path: Путь к папке для поиска CSV файлов
+
+        Returns:
+            Отсортированный список путей (может быть пустым)
+
+        Raises:
+            FileNotFoundError: Если папка не найдена
+            NotADirectoryError: Если путь не является папкой
+            PermissionError: Если нет доступа к папке
+        """
+        # Папки, подходящие под exclude_patterns, не обходятся
+        return discover_csv_files(folder_path, **self._discovery_options())
+
+    def _discovery_options(self) -> Dict[str, Any]:
+        """Параметры поиска файлов в папке для iter_csv_files()"""
+        return {
+            'include': self.include_patterns,
+            'exclude': self.exclude_patterns,
+            'max_depth': self.max_depth,
+            'threads': self.discovery_threads,
+            # Манифест хранится рядом с кэшем разобранных файлов
+            'manifest_dir': self.cache_dir if self.discovery_manifest
+            else None,
+            'rescan': self.rescan,
+        }
+
     def discover_default_folder(self) -> str:
         """
         Автоматически обнаруживает папку с CSV файлами на основе конфигурации
@@ -129,85 +1684,183 @@ class CSVProcessor:
         from src.utils.discover import discover_default_csv_folder
         return discover_default_csv_folder()
 
-    def _process_row(
+    def _iter_valid_records(
             self,
-            row: Dict[str, str],
-            row_num: int,
-            file_path: str) -> Dict[str, Any]:
+            rows: Iterable[Row],
+            reject: Optional[RejectRow] = None,
+            keys: Optional[Dict[str, int]] = None,
+            source: str = '') -> Iterator[Record]:
         """
-        Обрабатывает и валидирует одну строку данных
+        Проверяет строки одного файла и отдает записи
+
+        Схема записи собирается один раз на файл: границы значений
+        читаются из конфигурации один раз, а не для каждой строки.
+        С numeric_backend='numpy' строки проверяются пакетами
+        по BATCH_SIZE. Значения колонок DICTIONARY_COLUMNS берутся
+        из общего словаря загрузки, а вне load_data() и iter_records()
+        (в дочернем процессе) - из словаря этого файла.
+
+        Условия отбора row_filter и выборка проверяются по сырым
+        значениям до проверки строки: отброшенная строка не проверяется
+        и не становится записью. Номера строк при этом не сдвигаются.
+        С sample_size строки сначала отбираются в выборку и проверяются
+        после чтения всех строк. С deadline чтение останавливается
+        по истечении срока.
 
         Args:
-            row: Словарь с данными строки
-            row_num: Номер строки в файле
-            file_path: Путь к файлу
+            rows: Строки файла после заголовка
+            reject: Функция учета некорректной строки (номер от нуля,
+                причина, строка); если не задана, выбрасывается ошибка
+            keys: Индексы колонок для строк csv.reader (None - строки
+                csv.DictReader)
+            source: Имя части данных для генератора случайных чисел
 
-        Returns:
-            Обработанный словарь с правильными типами данных
+        Yields:
+            Записи согласно record_format
 
         Raises:
-            ValueError: Если данные некорректны
+            RowError: С номером первой некорректной строки (от нуля)
         """
-        try:
-            return {
-                **self._process_string_fields(row),
-                **self._process_numeric_fields(row)
-            }
-        except ValueError as e:
-            raise ValueError(
-                f"Ошибка в строке {row_num} файла {file_path}: {e}"
-            )
+        schema = self._schema()
+        pools = self._string_pools
+        if pools is None:
+            pools = self._new_string_pools()
+        validate = schema.compile(self.record_format, keys, pools)
+        rng = None
+        if self.sample_rate or self.sample_size:
+            rng = self._random(source)
+        keep = self._row_predicate(keys, rng)
+        if self._deadline is not None:
+            rows = self._deadline.rows(rows)
 
-    def _process_string_fields(self, row: Dict[str, str]) -> Dict[str, str]:
-        """Обрабатывает строковые поля"""
-        string_fields = ['name', 'position', 'skills', 'team']
-        processed: Dict[str, str] = {}
+        if self.sample_size:
+            reservoir = Reservoir(self.sample_size, rng)
+            offer = reservoir.offer
+            for index, row in enumerate(rows):
+                if keep is None or keep(row):
+                    offer((index, row))
+            self._unsampled_rows += reservoir.seen - len(reservoir.items)
+            yield from self._validate_indexed(
+                validate, sorted(reservoir.items, key=itemgetter(0)), reject)
+            return
 
-        for field in string_fields:
-            value = row.get(field, '').strip()
-            if not value:
-                raise ValueError(f"Пустое значение в поле '{field}'")
-            processed[field] = value
+        if self.numeric_backend == 'python':
+            indexed = enumerate(rows)
+            if keep is not None:
+                indexed = (
+                    (index, row) for index, row in indexed if keep(row))
+            yield from self._validate_indexed(validate, indexed, reject)
+            return
 
-        return processed
+        validate_batch = schema.compile_batch(
+            self.record_format, keys, backend=self.numeric_backend,
+            pools=pools)
+        rows = iter(rows)
+        offset = 0
+        while True:
+            batch = list(islice(rows, self.BATCH_SIZE))
+            if not batch:
+                return
+            kept, positions = batch, None
+            if keep is not None:
+                # Номера прошедших отбор строк внутри пакета
+                positions = [
+                    index for index, row in enumerate(batch) if keep(row)]
+                kept = [batch[index] for index in positions]
+            try:
+                records = validate_batch(kept) if kept else []
+            except RowError as e:
+                if reject is None:
+                    index = e.index if positions is None else (
+                        positions[e.index])
+                    raise RowError(offset + index, e.message)
+                # В пакете есть ошибки: проверяем его построчно
+                if positions is None:
+                    positions = range(len(batch))
+                records = self._validate_indexed(
+                    validate,
+                    zip([offset + index for index in positions], kept),
+                    reject)
+            yield from records
+            offset += len(batch)
 
-    def _process_numeric_fields(self, row: Dict[str, str]) -> Dict[str, Any]:
-        """Обрабатывает числовые поля"""
-        processed: Dict[str, Any] = {}
+    def _row_predicate(
+            self,
+            keys: Optional[Dict[str, int]],
+            rng: Optional[random.Random]
+    ) -> Optional[Callable[[Row], bool]]:
+        """
+        Собирает условие отбора строк файла
 
-        # completed_tasks
-        try:
-            completed_tasks = int(row['completed_tasks'])
-            if completed_tasks < 0:
-                raise ValueError("completed_tasks должно быть неотрицательным")
-            processed['completed_tasks'] = completed_tasks
-        except (ValueError, KeyError) as e:
-            raise ValueError(f"Некорректное значение completed_tasks: {e}")
-
-        # performance
-        try:
-            performance = float(row['performance'])
-            min_perf = float(config.get('MIN_PERFORMANCE'))
-            max_perf = float(config.get('MAX_PERFORMANCE'))
-            if not (min_perf <= performance <= max_perf):
-                raise ValueError(
-                    f"performance должно быть в диапазоне от "
-                    f"{min_perf} до {max_perf}"
-                )
-            processed['performance'] = performance
-        except (ValueError, KeyError) as e:
-            raise ValueError(f"Некорректное значение performance: {e}")
+        Строка проходит условия row_filter, а с sample_rate - еще
+        и попадает в выборку с этой вероятностью. Отброшенные строки
+        учитываются в row_filter.filtered и _unsampled_rows.
 
-        # experience_years
-        try:
-            experience_years = int(row['experience_years'])
-            min_exp = int(config.get('MIN_EXPERIENCE_YEARS'))
-            if experience_years < min_exp:
-                raise ValueError(
-                    f"experience_years должно быть не меньше {min_exp}"
-                )
-            processed['experience_years'] = experience_years
-        except (ValueError, KeyError) as e:
-            raise ValueError(f"Некорректное значение experience_years: {e}")
+        Returns:
+            Функция, возвращающая True для оставляемых строк, или None,
+            если оставляются все строки
+        """
+        row_filter = self.row_filter
+        matches = None
+        if row_filter is not None:
+            matches = row_filter.compile(keys)
+
+        rate = self.sample_rate
+        if not rate:
+            if matches is None:
+                return None
+
+            def keep(row: Row) -> bool:
+                if matches(row):
+                    return True
+                row_filter.filtered += 1
+                return False
+
+            return keep
+
+        uniform = rng.random
+
+        def keep(row: Row) -> bool:
+            if matches is not None and not matches(row):
+                row_filter.filtered += 1
+                return False
+            if uniform() < rate:
+                return True
+            self._unsampled_rows += 1
+            return False
+
+        return keep
+
+    @staticmethod
+    def _validate_indexed(
+            validate: RowValidator,
+            rows: Iterable[Tuple[int, Row]],
+            reject: Optional[RejectRow]) -> Iterator[Record]:
+        """
+        Построчно проверяет строки
+
+        Args:
+            validate: Функция проверки строки
+            rows: Пары (номер строки, строка)
+            reject: Функция учета некорректной строки или None
+
+        Yields:
+            Записи корректных строк
+
+        Raises:
+            RowError: Если строка некорректна и reject не задан
+        """
+        for index, row in rows:
+            try:
+                record = validate(row)
+            except ValueError as e:
+                if reject is None:
+                    raise RowError(index, str(e))
+                reject(index, str(e), row)
+                continue
+            yield record
 
-        return processed
+    @staticmethod
+    def _format_row_error(row_num: int, file_path: str, error: Any) -> str:
+        """Формирует сообщение об ошибке в строке файла"""
+        return f"Ошибка в строке {row_num} файла {file_path}: {error}"
@@ -0,0 +1,68 @@
+"""
+Компактная запись о сотруднике
+"""
+from typing import Any, Dict, Tuple
+
+
+class Employee:
+    """
+    Запись о сотруднике с доступом к полям через атрибуты
+
+    Занимает меньше памяти, чем словарь с теми же полями,
+    за счет __slots__.
+    """
+
+    __slots__ = (
+        'name', 'position', 'completed_tasks',
+        'performance', 'skills', 'team', 'experience_years'
+    )
+
+    FIELDS: Tuple[str, ...] = __slots__
+
+    def __init__(self,
+                 name: str,
+                 position: str,
+                 completed_tasks: int,
+                 performance: float,
+                 skills: str,
+                 team: str,
+                 experience_years: int):
+        self.name = name
+        self.position = position
+        self.completed_tasks = completed_tasks
+        self.performance = performance
+        self.skills = skills
+        self.team = team
+        self.experience_years = experience_years
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> 'Employee':
+        """
+        Создает запись из словаря
+
+        Отсутствующие поля получают значение None.
+
+        Args:
+            record: Словарь с данными сотрудника
+
+        Returns:
+            Экземпляр Employee
+        """
+        return cls(*map(record.get, cls.FIELDS))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Возвращает запись в виде словаря"""
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Employee):
+            return NotImplemented
+        return all(
+            getattr(self, field) == getattr(other, field)
+            for field in self.FIELDS
+        )
+
+    def __repr__(self) -> str:
+        fields = ', '.join(
+            f"{field}={getattr(self, field)!r}" for field in self.FIELDS)
+        return f"Employee({fields})"
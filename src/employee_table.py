@@ -0,0 +1,342 @@
+"""
+Колоночное хранилище данных сотрудников
+"""
+from array import array
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union)
+
+from src.employee import Employee
+
+# Запись о сотруднике: словарь или Employee
+Record = Union[Dict[str, Any], Employee]
+
+
+class StringColumn:
+    """Строковая колонка: массив кодов и таблица уникальных значений"""
+
+    def __init__(self):
+        self.codes = array('i')
+        self.values: List[str] = []
+        # Обратный индекс нужен только при добавлении значений
+        self._index: Optional[Dict[str, int]] = {}
+
+    @classmethod
+    def from_parts(cls, codes: array, values: List[str]) -> 'StringColumn':
+        """
+        Создает колонку из готовых кодов и таблицы значений
+
+        Обратный индекс не строится: он будет восстановлен при первом
+        добавлении значения.
+
+        Args:
+            codes: Массив кодов array('i')
+            values: Уникальные значения в порядке кодов
+
+        Returns:
+            Экземпляр StringColumn
+        """
+        column = cls()
+        column.codes = codes
+        column.values = values
+        column._index = None
+        return column
+
+    def append(self, value: str) -> None:
+        """Добавляет значение в конец колонки"""
+        self.codes.append(self.encode(value))
+
+    def encode(self, value: str) -> int:
+        """Возвращает код значения, добавляя новое значение в таблицу"""
+        index = self._get_index()
+        code = index.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            index[value] = code
+        return code
+
+    def extend(self, other: 'StringColumn') -> None:
+        """Добавляет значения другой колонки, перекодируя их"""
+        if not self.values:
+            # В пустой колонке коды другой колонки остаются прежними
+            self.values = list(other.values)
+            self.codes = array('i', other.codes)
+            self._index = None
+            return
+        mapping = [self.encode(value) for value in other.values]
+        self.codes.extend(array('i', (mapping[code] for code in other.codes)))
+
+    def freeze(self) -> None:
+        """Освобождает обратный индекс после окончания загрузки"""
+        self._index = None
+
+    def _get_index(self) -> Dict[str, int]:
+        """Возвращает обратный индекс, восстанавливая его при необходимости"""
+        if self._index is None:
+            self._index = {
+                value: code for code, value in enumerate(self.values)}
+        return self._index
+
+    def __getitem__(self, position: int) -> str:
+        return self.values[self.codes[position]]
+
+    def __iter__(self) -> Iterator[str]:
+        values = self.values
+        return (values[code] for code in self.codes)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+def parse_skills(skills_string: Optional[str]) -> List[str]:
+    """
+    Разбирает строку навыков в список
+
+    Навыки разделяются запятыми, пробелы по краям и пустые
+    навыки отбрасываются.
+
+    Args:
+        skills_string: Строка навыков (пустая строка или None - нет навыков)
+
+    Returns:
+        Список навыков в порядке строки
+    """
+    if not skills_string:
+        return []
+    skills = (skill.strip() for skill in skills_string.split(','))
+    return [skill for skill in skills if skill]
+
+
+class SkillsColumn:
+    """
+    Разобранные навыки сотрудников в сжатом строчном виде (CSR)
+
+    Навыки строки i - идентификаторы ids[offsets[i]:offsets[i + 1]],
+    имя навыка по идентификатору - skills[id]. Строка навыков
+    разбирается при добавлении; результаты разбора одинаковых строк
+    берутся из кэша ограниченного размера.
+    """
+
+    # Сколько различных строк навыков хранит кэш разбора
+    CACHE_SIZE = 4096
+
+    def __init__(self):
+        self.offsets = array('i', [0])
+        self.ids = array('i')
+        self.skills: List[str] = []
+        # Обратный индекс и кэш нужны только при добавлении значений
+        self._index: Optional[Dict[str, int]] = {}
+        self._cache: Dict[str, Tuple[int, ...]] = {}
+
+    @classmethod
+    def from_parts(cls,
+                   offsets: array,
+                   ids: array,
+                   skills: List[str]) -> 'SkillsColumn':
+        """
+        Создает колонку из готовых массивов и словаря навыков
+
+        Args:
+            offsets: Границы строк array('i') длиной строк + 1
+            ids: Идентификаторы навыков всех строк array('i')
+            skills: Навыки в порядке идентификаторов
+
+        Returns:
+            Экземпляр SkillsColumn
+        """
+        column = cls()
+        column.offsets = offsets
+        column.ids = ids
+        column.skills = skills
+        column._index = None
+        return column
+
+    def append(self, skills_string: str) -> None:
+        """Разбирает строку навыков и добавляет ее в конец колонки"""
+        ids = self._cache.get(skills_string)
+        if ids is None:
+            ids = self._tokenize(skills_string)
+        self.ids.extend(ids)
+        self.offsets.append(len(self.ids))
+
+    def _tokenize(self, skills_string: str) -> Tuple[int, ...]:
+        """Разбирает строку навыков в идентификаторы и кэширует их"""
+        index = self._get_index()
+        ids = []
+        for skill in parse_skills(skills_string):
+            skill_id = index.get(skill)
+            if skill_id is None:
+                skill_id = len(self.skills)
+                self.skills.append(skill)
+                index[skill] = skill_id
+            ids.append(skill_id)
+
+        cache = self._cache
+        if len(cache) >= self.CACHE_SIZE:
+            # Вытесняем самую старую строку
+            del cache[next(iter(cache))]
+        result = cache[skills_string] = tuple(ids)
+        return result
+
+    def extend(self, other: 'SkillsColumn') -> None:
+        """Добавляет строки другой колонки, перекодируя навыки"""
+        if len(self.offsets) == 1:
+            # В пустой колонке идентификаторы другой колонки те же
+            self.offsets = array('i', other.offsets)
+            self.ids = array('i', other.ids)
+            self.skills = list(other.skills)
+            self._index = None
+            self._cache = {}
+            return
+
+        index = self._get_index()
+        mapping = []
+        for skill in other.skills:
+            skill_id = index.get(skill)
+            if skill_id is None:
+                skill_id = len(self.skills)
+                self.skills.append(skill)
+                index[skill] = skill_id
+            mapping.append(skill_id)
+
+        base = len(self.ids)
+        self.ids.extend(array('i', (mapping[i] for i in other.ids)))
+        self.offsets.extend(array(
+            'i', (base + offset for offset in other.offsets[1:])))
+
+    def freeze(self) -> None:
+        """Освобождает обратный индекс и кэш после окончания загрузки"""
+        self._index = None
+        self._cache = {}
+
+    def _get_index(self) -> Dict[str, int]:
+        """Возвращает обратный индекс, восстанавливая его при необходимости"""
+        if self._index is None:
+            self._index = {
+                skill: skill_id for skill_id, skill in enumerate(self.skills)}
+        return self._index
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Не передает индекс и кэш разбора между процессами"""
+        state = self.__dict__.copy()
+        state['_index'] = None
+        state['_cache'] = {}
+        return state
+
+    def __getitem__(self, position: int) -> List[str]:
+        skills = self.skills
+        return [skills[skill_id] for skill_id in
+                self.ids[self.offsets[position]:self.offsets[position + 1]]]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+
+class EmployeeTable:
+    """
+    Колоночное хранилище данных сотрудников
+
+    Числовые колонки хранятся в массивах array, строковые - в виде
+    массивов кодов со списком уникальных значений. Навыки, кроме
+    исходной строки, хранятся разобранными в skill_lists. Итерация
+    по таблице отдает строки в виде словарей, как и List[Dict[str, Any]].
+    """
+
+    STRING_COLUMNS = ('name', 'position', 'skills', 'team')
+    # Целые колонки - int64, как в numpy-проверке схемы; схема
+    # отклоняет значения вне этого диапазона
+    NUMERIC_COLUMNS = {
+        'completed_tasks': 'q',
+        'performance': 'd',
+        'experience_years': 'q',
+    }
+
+    def __init__(self):
+        self.name = StringColumn()
+        self.position = StringColumn()
+        self.skills = StringColumn()
+        self.team = StringColumn()
+        self.skill_lists = SkillsColumn()
+        self.completed_tasks = array('q')
+        self.performance = array('d')
+        self.experience_years = array('q')
+
+    def append(self, record: Record) -> None:
+        """
+        Добавляет запись сотрудника
+
+        Args:
+            record: Обработанная запись (Employee или словарь)
+        """
+        if isinstance(record, dict):
+            record = Employee.from_dict(record)
+
+        self.name.append(record.name)
+        self.position.append(record.position)
+        self.skills.append(record.skills)
+        self.skill_lists.append(record.skills)
+        self.team.append(record.team)
+        self.completed_tasks.append(record.completed_tasks)
+        self.performance.append(record.performance)
+        self.experience_years.append(record.experience_years)
+
+    def extend(
+            self,
+            records: Union['EmployeeTable', Iterable[Record]]
+    ) -> None:
+        """
+        Добавляет записи другой таблицы или последовательности записей
+
+        Args:
+            records: Таблица или итерируемый набор записей
+        """
+        if not isinstance(records, EmployeeTable):
+            for record in records:
+                self.append(record)
+            return
+
+        for column in self.STRING_COLUMNS:
+            getattr(self, column).extend(getattr(records, column))
+        self.skill_lists.extend(records.skill_lists)
+        for column in self.NUMERIC_COLUMNS:
+            getattr(self, column).extend(getattr(records, column))
+
+    def freeze(self) -> None:
+        """Освобождает вспомогательные индексы после загрузки"""
+        for column in self.STRING_COLUMNS:
+            getattr(self, column).freeze()
+        self.skill_lists.freeze()
+
+    def column(self, name: str) -> Union[StringColumn, array]:
+        """
+        Возвращает колонку по имени
+
+        Raises:
+            KeyError: Если колонки нет в таблице
+        """
+        if (name not in self.STRING_COLUMNS
+                and name not in self.NUMERIC_COLUMNS):
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def row(self, position: int) -> Dict[str, Any]:
+        """Возвращает строку таблицы в виде словаря"""
+        return {
+            'name': self.name[position],
+            'position': self.position[position],
+            'completed_tasks': self.completed_tasks[position],
+            'performance': self.performance[position],
+            'skills': self.skills[position],
+            'team': self.team[position],
+            'experience_years': self.experience_years[position],
+        }
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self.row(position) for position in range(len(self)))
+
+    def __len__(self) -> int:
+        return len(self.performance)
+
+
+# Данные сотрудников в строчном или колоночном представлении
+EmployeeData = Union[List[Record], EmployeeTable]
@@ -0,0 +1,227 @@
+"""
+Условия отбора строк CSV, проверяемые во время разбора
+"""
+import re
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+from src.schema import Row
+
+# Предикат строки: True - строка проходит все условия
+RowPredicate = Callable[[Row], bool]
+
+# Преобразователи числовых колонок; остальные колонки - строки
+NUMERIC_COLUMNS: Dict[str, Callable[[str], Any]] = {
+    'completed_tasks': int,
+    'performance': float,
+    'experience_years': int,
+}
+
+# Операторы сравнения в порядке разбора (двухсимвольные раньше)
+_COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    '>=': lambda value, bound: value >= bound,
+    '<=': lambda value, bound: value <= bound,
+    '!=': lambda value, bound: value != bound,
+    '==': lambda value, bound: value == bound,
+    '=': lambda value, bound: value == bound,
+    '>': lambda value, bound: value > bound,
+    '<': lambda value, bound: value < bound,
+}
+
+# Операторы, допустимые для строковых колонок
+_STRING_OPERATORS = ('=', '==', '!=', 'in', 'not in')
+
+_MEMBERSHIP = re.compile(
+    r'^\s*(\w+)\s+(not\s+in|in)\s*\((.*)\)\s*$', re.IGNORECASE)
+_COMPARISON = re.compile(r'^\s*(\w+)\s*(>=|<=|!=|==|=|>|<)\s*(.*?)\s*$')
+
+
+class Condition:
+    """Одно условие отбора: колонка, оператор и значения"""
+
+    __slots__ = ('column', 'operator', 'values')
+
+    def __init__(self, column: str, operator: str, values: Tuple[Any, ...]):
+        """
+        Инициализация условия
+
+        Args:
+            column: Колонка CSV
+            operator: Оператор сравнения, 'in' или 'not in'
+            values: Значения, приведенные к типу колонки
+        """
+        self.column = column
+        self.operator = operator
+        self.values = values
+
+    @classmethod
+    def parse(cls,
+              expression: str,
+              columns: Sequence[str]) -> 'Condition':
+        """
+        Разбирает выражение вида `team=API Team`, `experience_years>=3`
+        или `position in (Developer, QA Engineer)`
+
+        Строковые значения сравниваются после обрезки пробелов, как
+        при проверке строк; кавычки вокруг значения убираются.
+
+        Args:
+            expression: Текст условия
+            columns: Допустимые колонки
+
+        Returns:
+            Экземпляр Condition
+
+        Raises:
+            ValueError: Если выражение некорректно
+        """
+        match = _MEMBERSHIP.match(expression)
+        if match:
+            column, operator, raw_values = match.groups()
+            operator = ' '.join(operator.lower().split())
+            raw = [value for value in raw_values.split(',') if value.strip()]
+        else:
+            match = _COMPARISON.match(expression)
+            if not match:
+                raise ValueError(
+                    f"Некорректный фильтр '{expression}': ожидается "
+                    f"'колонка оператор значение' или "
+                    f"'колонка in (значение, ...)'")
+            column, operator, value = match.groups()
+            raw = [value]
+
+        if column not in columns:
+            raise ValueError(
+                f"Некорректный фильтр '{expression}': неизвестная "
+                f"колонка '{column}'")
+        convert = NUMERIC_COLUMNS.get(column, str)
+        if convert is str and operator not in _STRING_OPERATORS:
+            raise ValueError(
+                f"Некорректный фильтр '{expression}': оператор "
+                f"'{operator}' неприменим к строковой колонке '{column}'")
+
+        values = []
+        for value in raw:
+            value = _unquote(value.strip())
+            if not value:
+                raise ValueError(
+                    f"Некорректный фильтр '{expression}': пустое значение")
+            try:
+                values.append(convert(value))
+            except ValueError:
+                raise ValueError(
+                    f"Некорректный фильтр '{expression}': значение "
+                    f"'{value}' не является числом")
+        if not values:
+            raise ValueError(
+                f"Некорректный фильтр '{expression}': пустой список значений")
+        return cls(column, operator, tuple(values))
+
+    def compile(self, key: Any) -> RowPredicate:
+        """
+        Собирает предикат строки для ключа колонки
+
+        Значение, которое не удается преобразовать к типу колонки,
+        проходит условие: такую строку отклоняет проверка схемы.
+
+        Args:
+            key: Имя колонки (csv.DictReader) или индекс (csv.reader)
+
+        Returns:
+            Функция, которая принимает строку и возвращает True,
+            если строка проходит условие
+        """
+        convert = NUMERIC_COLUMNS.get(self.column)
+        if convert is None:
+            def convert(value: str) -> str:
+                return value.strip()
+
+        if self.operator in ('in', 'not in'):
+            allowed = frozenset(self.values)
+            expected = self.operator == 'in'
+
+            def test(value: Any) -> bool:
+                return (value in allowed) == expected
+        else:
+            compare = _COMPARISONS[self.operator]
+            bound = self.values[0]
+
+            def test(value: Any) -> bool:
+                return compare(value, bound)
+
+        def predicate(row: Row) -> bool:
+            try:
+                value = convert(row[key])
+            except (ValueError, TypeError, IndexError, AttributeError):
+                return True
+            return test(value)
+
+        return predicate
+
+    def __repr__(self) -> str:
+        return f"Condition({self.column!r}, {self.operator!r}, {self.values!r})"
+
+
+class RowFilter:
+    """
+    Набор условий отбора строк, объединенных через И
+
+    Условия проверяются по сырым значениям строки до проверки схемы
+    и построения записи: строки, не прошедшие отбор, не проверяются
+    и не попадают в данные. filtered - число отброшенных строк.
+    """
+
+    def __init__(self, conditions: Sequence[Condition]):
+        """
+        Инициализация фильтра
+
+        Args:
+            conditions: Условия отбора
+        """
+        self.conditions = tuple(conditions)
+        self.filtered = 0
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """Колонки, которые используют условия"""
+        return tuple(dict.fromkeys(
+            condition.column for condition in self.conditions))
+
+    def compile(self, keys: Optional[Mapping[str, Any]] = None) -> RowPredicate:
+        """
+        Собирает предикат строки для одного файла
+
+        Args:
+            keys: Ключ каждой колонки в строке: индекс для строк
+                csv.reader (по умолчанию - имена колонок)
+
+        Returns:
+            Функция, которая принимает строку и возвращает True,
+            если строка проходит все условия
+        """
+        predicates = tuple(
+            condition.compile(
+                keys[condition.column] if keys is not None
+                else condition.column)
+            for condition in self.conditions)
+
+        if len(predicates) == 1:
+            return predicates[0]
+
+        def predicate(row: Row) -> bool:
+            for test in predicates:
+                if not test(row):
+                    return False
+            return True
+
+        return predicate
+
+    def fingerprint(self) -> str:
+        """Возвращает строку, однозначно описывающую условия отбора"""
+        return repr(self.conditions)
+
+
+def _unquote(value: str) -> str:
+    """Убирает парные кавычки вокруг значения"""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+        return value[1:-1].strip()
+    return value
@@ -2,14 +2,36 @@
 Интерфейс для загрузки и обработки данных
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
+from src.employee_table import EmployeeData
 
 
 class DataLoaderInterface(ABC):
     """Интерфейс для загрузчиков данных"""
 
+    def configure(self, **options: Any) -> None:
+        """
+        Передает загрузчику параметры загрузки
+
+        По умолчанию параметры игнорируются.
+
+        Args:
+            **options: Параметры загрузки (None - оставить по умолчанию)
+        """
+
+    def get_load_summary(self) -> Dict[str, Any]:
+        """
+        Возвращает итоги последней загрузки
+
+        По умолчанию итогов нет.
+
+        Returns:
+            Словарь с итогами (например, rejected_rows) или пустой словарь
+        """
+        return {}
+
     @abstractmethod
-    def load_from_files(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+    def load_from_files(self, file_paths: List[str]) -> EmployeeData:
         """
         Загружает данные из списка файлов
 
@@ -17,12 +39,12 @@ class DataLoaderInterface(ABC):
             file_paths: Список путей к файлам
 
         Returns:
-            Список словарей с данными
+            Список словарей с данными или EmployeeTable
         """
         pass
 
     @abstractmethod
-    def load_from_folder(self, folder_path: str) -> List[Dict[str, Any]]:
+    def load_from_folder(self, folder_path: str) -> EmployeeData:
         """
         Загружает данные из всех файлов в папке
 
@@ -30,6 +52,55 @@ class DataLoaderInterface(ABC):
             folder_path: Путь к папке
 
         Returns:
-            Список словарей с данными
+            Список словарей с данными или EmployeeTable
+        """
+        pass
+
+
+class StreamingDataLoaderInterface(ABC):
+    """Интерфейс для загрузчиков, отдающих данные потоком"""
+
+    @abstractmethod
+    def iter_from_files(
+            self,
+            file_paths: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Лениво читает данные из списка файлов
+
+        Args:
+            file_paths: Список путей к файлам
+
+        Returns:
+            Итератор словарей с данными
+        """
+        pass
+
+    @abstractmethod
+    def iter_from_folder(self, folder_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Лениво читает данные из всех файлов в папке
+
+        Args:
+            folder_path: Путь к папке
+
+        Returns:
+            Итератор словарей с данными
+        """
+        pass
+
+
+class DiscoveringDataLoaderInterface(ABC):
+    """Интерфейс для загрузчиков, которые сами ищут файлы в папке"""
+
+    @abstractmethod
+    def discover_files(self, folder_path: str) -> List[str]:
+        """
+        Находит файлы данных в папке, не загружая их
+
+        Args:
+            folder_path: Путь к папке
+
+        Returns:
+            Отсортированный список путей (пустой, если файлов нет)
         """
         pass
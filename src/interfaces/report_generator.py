@@ -2,16 +2,44 @@
 Интерфейс для генерации отчетов
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional, Sequence
+from src.employee_table import EmployeeData
+from src.sampling import SampleInfo
 
 
 class ReportGeneratorInterface(ABC):
     """Интерфейс для генераторов отчетов"""
 
+    def configure(self, **options: Any) -> None:
+        """
+        Передает генератору параметры генерации отчетов
+
+        По умолчанию параметры игнорируются.
+
+        Args:
+            **options: Параметры генерации (None - оставить по умолчанию)
+        """
+
+    def get_report_columns(
+            self,
+            report_type: str) -> Optional[Sequence[str]]:
+        """
+        Возвращает колонки, которые использует отчет
+
+        По умолчанию отчету нужны все колонки.
+
+        Args:
+            report_type: Тип отчета
+
+        Returns:
+            Колонки отчета или None - все колонки
+        """
+        return None
+
     @abstractmethod
     def generate_report(self,
                         report_type: str,
-                        data: List[Dict[str, Any]]) -> str:
+                        data: EmployeeData) -> str:
         """
         Генерирует отчет указанного типа
 
@@ -23,3 +51,76 @@ class ReportGeneratorInterface(ABC):
             Отформатированный отчет
         """
         pass
+
+    def generate_sampled_report(self,
+                                report_type: str,
+                                data: EmployeeData,
+                                sample: SampleInfo) -> str:
+        """
+        Генерирует отчет по выборке строк
+
+        По умолчанию выборка считается полным набором данных.
+
+        Args:
+            report_type: Тип отчета
+            data: Записи выборки
+            sample: Описание выборки
+
+        Returns:
+            Отформатированный отчет
+        """
+        return self.generate_report(report_type, data)
+
+
+class StreamingReportGeneratorInterface(ABC):
+    """Интерфейс для генераторов отчетов по потоку записей"""
+
+    @abstractmethod
+    def generate_report_stream(self,
+                               report_type: str,
+                               records: Iterable[Dict[str, Any]]) -> str:
+        """
+        Генерирует отчет, сворачивая записи по мере поступления
+
+        Args:
+            report_type: Тип отчета
+            records: Поток записей для анализа
+
+        Returns:
+            Отформатированный отчет
+        """
+        pass
+
+
+class IncrementalReportGeneratorInterface(ABC):
+    """Интерфейс для генераторов отчетов по агрегатам частей данных"""
+
+    @abstractmethod
+    def aggregate(self, report_type: str, data: EmployeeData) -> Any:
+        """
+        Сворачивает данные одной части в агрегаты отчета
+
+        Args:
+            report_type: Тип отчета
+            data: Данные части
+
+        Returns:
+            Агрегаты части
+        """
+        pass
+
+    @abstractmethod
+    def render_aggregates(self,
+                          report_type: str,
+                          parts: Sequence[Any]) -> str:
+        """
+        Формирует отчет по агрегатам частей в переданном порядке
+
+        Args:
+            report_type: Тип отчета
+            parts: Агрегаты, возвращенные aggregate()
+
+        Returns:
+            Отформатированный отчет
+        """
+        pass
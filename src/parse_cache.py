@@ -0,0 +1,454 @@
+"""
+Кэш разобранных CSV файлов на диске
+"""
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.employee_table import (
+    EmployeeData, EmployeeTable, SkillsColumn, StringColumn)
+from src.utils.compression import compression_of
+
+# Отклоненная строка: номер строки в файле, причина, исходная строка
+CachedRejection = Tuple[int, str, Any]
+
+# Размер и время изменения файла (st_mtime_ns)
+FileStamp = Tuple[int, int]
+
+# Состояние файла на момент разбора: size, mtime_ns, rows (число
+# разобранных записей), offset (конец последней записи или None)
+# и prefix (хэш начала файла и байтов перед offset)
+FileState = Dict[str, Any]
+
+# Содержимое записи кэша: данные файла, отклоненные строки, состояние
+CacheEntry = Tuple[EmployeeTable, List[CachedRejection], FileState]
+
+
+class ParseCache:
+    """
+    Кэш проверенных данных CSV файлов
+
+    Каждый файл хранится отдельной записью в колоночном виде
+    EmployeeTable: числовые колонки и коды строковых колонок - байты
+    массивов array, уникальные строковые значения - одна строка UTF-8
+    с длинами значений; разобранные навыки - массивы CSR и словарь
+    навыков в том же виде. Загрузка записи сводится к чтению файла
+    и array.frombytes() без разбора и проверки CSV.
+
+    Ключ записи - хэш от абсолютного пути файла и правил проверки
+    (fingerprint() схемы): новые границы значений дают промах.
+    Запись хранит размер и время изменения файла на момент разбора;
+    актуальна только запись, у которой они совпадают с текущими.
+    Для дозаписанных файлов запись также хранит конец последней
+    разобранной записи и хэш начала файла и байтов перед ним:
+    resume_point() по ним определяет, что файл только дополнен
+    и можно разобрать лишь новый хвост.
+
+    Суммарный размер записей ограничен max_size: при превышении
+    удаляются записи, к которым дольше всего не обращались (время
+    изменения записи обновляется при каждом чтении).
+    """
+
+    # Версия формата записи: меняется при несовместимых изменениях
+    FORMAT_VERSION = 4
+
+    MAGIC = b'CSVPC' + bytes([FORMAT_VERSION])
+
+    SUFFIX = '.bin'
+
+    # Сколько байт начала файла и байт перед концом разобранной части
+    # сравнивается при проверке, что файл только дополнен
+    PREFIX_CHECK_SIZE = 64 * 1024
+    BOUNDARY_CHECK_SIZE = 4 * 1024
+
+    def __init__(self, directory: str, max_size: int, schema_key: str):
+        """
+        Инициализация кэша
+
+        Args:
+            directory: Папка для записей кэша (создается при необходимости)
+            max_size: Максимальный суммарный размер записей в байтах
+                (0 - без ограничения)
+            schema_key: Строка с правилами проверки строк
+        """
+        self.directory = directory
+        self.max_size = max_size
+        self._schema_key = schema_key
+        self._stored = False
+
+    def key(self, file_path: str) -> str:
+        """
+        Вычисляет ключ записи файла
+
+        Args:
+            file_path: Путь к CSV файлу
+
+        Returns:
+            Ключ записи
+        """
+        source = '\n'.join((
+            str(self.FORMAT_VERSION),
+            sys.byteorder,
+            os.path.abspath(file_path),
+            self._schema_key,
+        ))
+        return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def stamp(file_path: str) -> Optional[FileStamp]:
+        """
+        Возвращает размер и время изменения файла
+
+        Returns:
+            (size, mtime_ns) или None, если файл недоступен
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def is_current(state: FileState, stamp: FileStamp) -> bool:
+        """Проверяет, что файл не менялся после разбора"""
+        return (state['size'], state['mtime_ns']) == stamp
+
+    @classmethod
+    def resume_point(cls,
+                     file_path: str,
+                     state: FileState,
+                     stamp: FileStamp) -> Optional[Tuple[int, int]]:
+        """
+        Определяет, с какого места можно дочитать дополненный файл
+
+        Файл считается дополненным, если он вырос, а его начало и байты
+        перед концом разобранной части не изменились. Иначе (файл
+        обрезан или перезаписан) нужен полный разбор.
+
+        Args:
+            file_path: Путь к CSV файлу
+            state: Состояние файла из записи кэша
+            stamp: Текущие размер и время изменения файла
+
+        Returns:
+            Смещение начала новых записей и число уже разобранных
+            записей или None
+        """
+        offset = state.get('offset')
+        if offset is None or stamp[0] <= offset:
+            return None
+        try:
+            digest = cls._prefix_digest(file_path, offset)
+        except OSError:
+            return None
+        if digest != state.get('prefix'):
+            return None
+        return offset, state['rows']
+
+    def peek(self, key: str) -> Optional[FileState]:
+        """
+        Читает только состояние файла из записи кэша
+
+        Args:
+            key: Ключ записи
+
+        Returns:
+            Состояние файла или None, если записи нет или она
+            другого формата
+        """
+        try:
+            with open(self._entry_path(key), 'rb') as file:
+                if file.read(len(self.MAGIC)) != self.MAGIC:
+                    return None
+                size, = struct.unpack('<I', file.read(4))
+                return json.loads(file.read(size).decode('utf-8'))
+        except (OSError, ValueError, struct.error):
+            return None
+
+    def load(self, key: str) -> Optional[CacheEntry]:
+        """
+        Читает запись кэша
+
+        Поврежденная запись удаляется и считается промахом.
+
+        Args:
+            key: Ключ записи
+
+        Returns:
+            Таблица с данными файла, отклоненные строки и состояние
+            файла или None
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as file:
+                payload = file.read()
+            entry = self._decode(payload)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, struct.error):
+            self._remove(path)
+            return None
+
+        try:
+            # Отмечаем использование записи для вытеснения LRU
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def store(self,
+              key: str,
+              data: EmployeeData,
+              rejected: List[CachedRejection],
+              file_path: str,
+              stamp: FileStamp,
+              rows: int) -> None:
+        """
+        Сохраняет данные файла
+
+        Запись сначала пишется во временный файл и затем атомарно
+        переименовывается, поэтому параллельные запуски не увидят
+        частично записанную запись. Ошибки записи и значения, которые
+        не помещаются в колонки таблицы, не прерывают загрузку: файл
+        просто не сохраняется.
+
+        Args:
+            key: Ключ записи
+            data: Проверенные данные файла
+            rejected: Отклоненные строки файла
+            file_path: Путь к CSV файлу
+            stamp: Размер и время изменения файла до разбора
+            rows: Число разобранных записей (с отклоненными)
+        """
+        try:
+            if not isinstance(data, EmployeeTable):
+                table = EmployeeTable()
+                table.extend(data)
+                data = table
+            state = self._file_state(file_path, stamp, rows)
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    file.write(self._encode(data, rejected, state))
+                os.replace(temp_path, self._entry_path(key))
+            except BaseException:
+                self._remove(temp_path)
+                raise
+        except (OSError, OverflowError):
+            return
+        self._stored = True
+
+    def close(self) -> None:
+        """Применяет ограничение размера после загрузки"""
+        if self._stored:
+            self.evict()
+            self._stored = False
+
+    def evict(self) -> None:
+        """Удаляет самые давно использованные записи сверх max_size"""
+        if not self.max_size:
+            return
+
+        entries = []
+        total = 0
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if not name.endswith(self.SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            self._remove(path)
+            total -= size
+
+    def _entry_path(self, key: str) -> str:
+        """Возвращает путь к файлу записи"""
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        """Удаляет файл, не выбрасывая ошибку"""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @classmethod
+    def _file_state(cls,
+                    file_path: str,
+                    stamp: FileStamp,
+                    rows: int) -> FileState:
+        """
+        Собирает состояние разобранного файла
+
+        Дочитывать файл можно только с границы записи, поэтому offset
+        задается, лишь если файл заканчивается переводом строки.
+        Сжатые файлы всегда разбираются целиком.
+        """
+        size = stamp[0]
+        complete = False
+        if compression_of(file_path) is None:
+            with open(file_path, 'rb') as file:
+                file.seek(max(size - 1, 0))
+                complete = file.read(1) == b'\n'
+
+        state: FileState = {
+            'size': size,
+            'mtime_ns': stamp[1],
+            'rows': rows,
+            'offset': None,
+            'prefix': None,
+        }
+        if complete:
+            state['offset'] = size
+            state['prefix'] = cls._prefix_digest(file_path, size)
+        return state
+
+    @classmethod
+    def _prefix_digest(cls, file_path: str, offset: int) -> str:
+        """Хэш начала файла и байтов перед offset"""
+        boundary = max(offset - cls.BOUNDARY_CHECK_SIZE, 0)
+        digest = hashlib.sha256(struct.pack('<Q', offset))
+        with open(file_path, 'rb') as file:
+            digest.update(file.read(min(offset, cls.PREFIX_CHECK_SIZE)))
+            file.seek(boundary)
+            digest.update(file.read(offset - boundary))
+        return digest.hexdigest()
+
+    @classmethod
+    def _encode(cls,
+                table: EmployeeTable,
+                rejected: List[CachedRejection],
+                state: FileState) -> bytes:
+        """Сериализует состояние файла, таблицу и отклоненные строки"""
+        state_json = json.dumps(state).encode('utf-8')
+        parts = [
+            cls.MAGIC,
+            struct.pack('<I', len(state_json)),
+            state_json,
+            struct.pack('<Q', len(table)),
+        ]
+
+        for name in table.STRING_COLUMNS:
+            column = getattr(table, name)
+            parts.extend(cls._encode_strings(column.values))
+            parts.append(column.codes.tobytes())
+
+        skill_lists = table.skill_lists
+        parts.extend(cls._encode_strings(skill_lists.skills))
+        parts.append(struct.pack('<Q', len(skill_lists.ids)))
+        parts.append(skill_lists.offsets.tobytes())
+        parts.append(skill_lists.ids.tobytes())
+
+        for name in table.NUMERIC_COLUMNS:
+            parts.append(getattr(table, name).tobytes())
+
+        rejected_json = json.dumps(
+            [[row_num, error, cls._plain_row(row)]
+             for row_num, error, row in rejected],
+            ensure_ascii=False).encode('utf-8')
+        parts.append(struct.pack('<Q', len(rejected_json)))
+        parts.append(rejected_json)
+        return b''.join(parts)
+
+    @staticmethod
+    def _encode_strings(values: List[str]) -> List[bytes]:
+        """Сериализует список строк: длины значений и общий текст"""
+        lengths = array('I', map(len, values))
+        text = ''.join(values).encode('utf-8')
+        return [struct.pack('<IQ', len(lengths), len(text)),
+                lengths.tobytes(), text]
+
+    @classmethod
+    def _decode(cls, payload: bytes) -> CacheEntry:
+        """
+        Восстанавливает таблицу, отклоненные строки и состояние файла
+
+        Raises:
+            ValueError: Если запись повреждена или другого формата
+        """
+        if not payload.startswith(cls.MAGIC):
+            raise ValueError("Неизвестный формат записи кэша")
+        view = memoryview(payload)
+        position = len(cls.MAGIC)
+
+        def take(size: int) -> memoryview:
+            nonlocal position
+            if position + size > len(view):
+                raise ValueError("Запись кэша обрезана")
+            chunk = view[position:position + size]
+            position += size
+            return chunk
+
+        def take_array(typecode: str, count: int) -> array:
+            values = array(typecode)
+            values.frombytes(take(values.itemsize * count))
+            return values
+
+        state_size, = struct.unpack('<I', take(4))
+        state = json.loads(bytes(take(state_size)).decode('utf-8'))
+        rows, = struct.unpack('<Q', take(8))
+        table = EmployeeTable()
+
+        def take_strings() -> List[str]:
+            count, text_size = struct.unpack('<IQ', take(12))
+            lengths = take_array('I', count)
+            text = bytes(take(text_size)).decode('utf-8')
+            values = []
+            start = 0
+            for length in lengths:
+                values.append(text[start:start + length])
+                start += length
+            return values
+
+        for name in table.STRING_COLUMNS:
+            values = take_strings()
+            codes = take_array('i', rows)
+            setattr(table, name, StringColumn.from_parts(codes, values))
+
+        skills = take_strings()
+        ids_count, = struct.unpack('<Q', take(8))
+        offsets = take_array('i', rows + 1)
+        ids = take_array('i', ids_count)
+        table.skill_lists = SkillsColumn.from_parts(offsets, ids, skills)
+
+        for name, typecode in table.NUMERIC_COLUMNS.items():
+            setattr(table, name, take_array(typecode, rows))
+
+        rejected_size, = struct.unpack('<Q', take(8))
+        rejected = [
+            (row_num, error, row) for row_num, error, row
+            in json.loads(bytes(take(rejected_size)).decode('utf-8'))
+        ]
+        if position != len(view):
+            raise ValueError("Лишние данные в записи кэша")
+        return table, rejected, state
+
+    @staticmethod
+    def _plain_row(row: Any) -> Any:
+        """Убирает из строки DictReader ключ None лишних значений"""
+        if isinstance(row, dict):
+            return {
+                column: value for column, value in row.items()
+                if column is not None
+            }
+        return row
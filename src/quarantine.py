@@ -0,0 +1,139 @@
+"""
+Карантин строк, не прошедших проверку при загрузке
+"""
+import csv
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, Iterable, Optional, Sequence, TextIO
+
+from src.schema import Row
+
+
+class Quarantine:
+    """
+    Учет отклоненных строк при загрузке с on_error='collect' или 'skip'
+
+    Хранит только счетчик и открытый файл: стоимость учета зависит
+    от количества отклоненных строк, а не от размера загрузки.
+    Отклоненные строки с причиной записываются в файл, если он задан:
+    в формате CSV для файлов с расширением .csv, иначе в JSON Lines.
+    """
+
+    SERVICE_COLUMNS = ['file', 'row', 'error']
+
+    def __init__(self, columns: Sequence[str], path: Optional[str] = None):
+        """
+        Инициализация карантина
+
+        Args:
+            columns: Колонки исходных строк для записи в файл
+            path: Путь к файлу карантина (None - только подсчет)
+        """
+        self.columns = list(columns)
+        self.path = path
+        self.count = 0
+        self._file: Optional[TextIO] = None
+        self._csv_writer = None
+
+        if path is not None:
+            self._file = open(path, 'w', encoding='utf-8', newline='')
+            if path.lower().endswith('.csv'):
+                self._csv_writer = csv.writer(self._file)
+                self._csv_writer.writerow(self.SERVICE_COLUMNS + self.columns)
+
+    def add(self, file_path: str, row_num: int, error: str, row: Row) -> None:
+        """
+        Учитывает отклоненную строку
+
+        Args:
+            file_path: Путь к исходному файлу
+            row_num: Номер строки в файле
+            error: Причина отклонения
+            row: Исходная строка (словарь колонка -> значение)
+        """
+        self.count += 1
+        if self._file is None:
+            return
+
+        if self._csv_writer is not None:
+            self._csv_writer.writerow(
+                [file_path, row_num, error]
+                + [row.get(column) for column in self.columns])
+        else:
+            entry: Dict[str, Any] = {
+                'file': file_path,
+                'row': row_num,
+                'error': error,
+                'data': {
+                    column: value for column, value in row.items()
+                    if column is not None
+                },
+            }
+            self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def close(self) -> None:
+        """Закрывает файл карантина"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class QuarantineParts:
+    """
+    Файл карантина, собранный из карантинов отдельных загрузок
+
+    В режиме --watch файлы загружаются по одному, и каждая загрузка
+    начинает карантин заново. Поэтому у каждого файла данных свой
+    временный файл карантина (part_path()), а write() собирает из них
+    общий файл в порядке файлов: повторная загрузка файла заменяет
+    только его строки, строки удаленных файлов в общий файл не попадают.
+    """
+
+    def __init__(self, path: str):
+        """
+        Инициализация
+
+        Args:
+            path: Путь к общему файлу карантина (.csv или .jsonl)
+        """
+        self.path = path
+        self._suffix = '.csv' if path.lower().endswith('.csv') else '.jsonl'
+        self._directory = tempfile.mkdtemp(prefix='quarantine_')
+        self._written = False
+
+    def part_path(self, file_path: str) -> str:
+        """Возвращает путь к карантину одного файла данных"""
+        name = hashlib.sha256(
+            os.path.abspath(file_path).encode('utf-8')).hexdigest()
+        return os.path.join(self._directory, name + self._suffix)
+
+    def write(self, file_paths: Iterable[str]) -> None:
+        """
+        Переписывает общий файл карантина
+
+        Файл не создается, пока нет ни одного карантина файла
+        (on_error не равен 'collect').
+
+        Args:
+            file_paths: Загруженные файлы данных в порядке загрузки
+        """
+        parts = [part for part in map(self.part_path, file_paths)
+                 if os.path.exists(part)]
+        if not parts and not self._written:
+            return
+
+        with open(self.path, 'w', encoding='utf-8', newline='') as target:
+            for index, part in enumerate(parts):
+                with open(part, encoding='utf-8', newline='') as source:
+                    if index and self._suffix == '.csv':
+                        # Заголовок уже записан из первого файла
+                        source.readline()
+                    shutil.copyfileobj(source, target)
+        self._written = True
+
+    def close(self) -> None:
+        """Удаляет временные карантины файлов"""
+        shutil.rmtree(self._directory, ignore_errors=True)
@@ -1,41 +1,562 @@
 """
 Модуль для генерации отчетов
 """
+import heapq
+import sys
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, DefaultDict
-from collections import defaultdict
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple
 from tabulate import tabulate
 
 from src.config import config
+from src.employee import Employee
+from src.employee_table import (
+    EmployeeData, EmployeeTable, Record, parse_skills)
+from src.sampling import SampleInfo
+from src.spill import Group, SpillRuns
+
+
+def _compensated_add(
+        total: float,
+        error: float,
+        value: float) -> Tuple[float, float]:
+    """
+    Добавляет значение к сумме с компенсацией ошибки округления
+
+    Итоговая сумма total + error не зависит от того, по каким частям
+    данных она накапливалась и в каком порядке части объединялись.
+    """
+    new_total = total + value
+    if abs(total) >= abs(value):
+        error += (total - new_total) + value
+    else:
+        error += (value - new_total) + total
+    return new_total, error
+
+
+def _sample_note(sample: SampleInfo) -> str:
+    """Описывает выборку, по которой построен отчет"""
+    note = (f"Оценка по выборке: {sample.sampled} из ~"
+            f"{sample.population:.0f} строк ({sample.fraction:.1%}), "
+            f"доверительные интервалы {sample.confidence:.0%}")
+    if not sample.complete:
+        note += ("\nЧтение остановлено по сроку --deadline: "
+                 "оценки относятся только к прочитанным строкам")
+    return note + "\n"
+
+
+def _format_mean(sample: SampleInfo, stats: Dict[str, Any]) -> Any:
+    """
+    Оценка средней эффективности группы с полушириной интервала
+
+    Если интервал нулевой или не оценивается (одна запись группы),
+    показывается только среднее.
+    """
+    mean, half_width = sample.mean(
+        stats['total'] + stats['error'], stats['squares'], stats['count'])
+    if half_width is None or round(half_width, 2) == 0:
+        return round(mean, 2)
+    return f"{mean:.2f} ± {half_width:.2f}"
+
+
+def _format_count(sample: SampleInfo, count: int) -> Any:
+    """Оценка численности группы с полушириной интервала"""
+    estimate, half_width = sample.count(count)
+    if round(half_width) == 0:
+        return round(estimate)
+    return f"≈{estimate:.0f} ± {half_width:.0f}"
+
+
+def _add_position_stats(stats: Dict[str, Any],
+                        other: Dict[str, Any]) -> None:
+    """Добавляет к агрегатам позиции агрегаты следующей части данных"""
+    stats['total'], stats['error'] = _compensated_add(
+        stats['total'], stats['error'] + other['error'], other['total'])
+    stats['squares'] += other['squares']
+    stats['count'] += other['count']
+    stats['names'].extend(other['names'])
+
+
+def _combine_spilled_positions(stats: Dict[str, Any],
+                               other: Dict[str, Any]) -> None:
+    """Объединяет агрегаты позиции из разных серий сброса"""
+    _add_position_stats(stats, other)
+    stats['first'] = min(stats['first'], other['first'])
+
+
+class PerformanceAccumulator:
+    """
+    Накопитель агрегатов отчета по эффективности
+
+    С memory_limit накопитель оценивает размер агрегатов в памяти и при
+    его превышении сбрасывает группы на диск (SpillRuns); имена
+    сотрудников группы при этом склеиваются в одну строку, как в отчете.
+    groups() объединяет сброшенные группы с группами в памяти.
+    """
+
+    # Оценка размера новой группы в памяти (словарь агрегатов), байт
+    GROUP_SIZE = 600
+
+    def __init__(self, memory_limit: Optional[int] = None):
+        # позиция -> {'total', 'error' (компенсация суммы), 'squares'
+        # (сумма квадратов для оценок по выборке), 'count', 'names',
+        # 'first' (номер первой записи позиции)}
+        self.positions: Dict[str, Dict[str, Any]] = {}
+        self.memory_limit = memory_limit
+        self.seen = 0
+        self._size = 0
+        self._runs: Optional[SpillRuns] = None
+
+    def add(self, employee: Employee) -> None:
+        """Добавляет запись сотрудника в агрегаты"""
+        position = employee.position
+        stats = self.positions.get(position)
+        if stats is None:
+            stats = self._new_group(self.seen)
+            self.positions[position] = stats
+            self._size += self.GROUP_SIZE
+
+        performance = employee.performance
+        stats['total'], stats['error'] = _compensated_add(
+            stats['total'], stats['error'], performance)
+        stats['squares'] += performance * performance
+        stats['count'] += 1
+        stats['names'].append(employee.name)
+        self.seen += 1
+
+        if self.memory_limit:
+            self._size += sys.getsizeof(employee.name) + 8
+            if self._size > self.memory_limit:
+                self.spill()
+
+    def add_table(self, table: EmployeeTable) -> None:
+        """Добавляет записи колоночной таблицы, группируя по кодам позиций"""
+        part = PerformanceAccumulator()
+        positions = table.position.values
+        names = table.name.values
+        groups: List[Optional[Dict[str, Any]]] = [None] * len(positions)
+
+        for index, (position_code, performance, name_code) in enumerate(zip(
+                table.position.codes, table.performance, table.name.codes)):
+            stats = groups[position_code]
+            if stats is None:
+                stats = self._new_group(index)
+                groups[position_code] = stats
+                part.positions[positions[position_code]] = stats
+
+            stats['total'], stats['error'] = _compensated_add(
+                stats['total'], stats['error'], performance)
+            stats['squares'] += performance * performance
+            stats['count'] += 1
+            stats['names'].append(names[name_code])
+
+        part.seen = len(table)
+        self.merge(part)
+
+    def merge(self, other: 'PerformanceAccumulator') -> None:
+        """Объединяет агрегаты, накопленные по следующей части данных"""
+        offset = self.seen
+        for position, other_stats in other.groups():
+            stats = self.positions.get(position)
+            if stats is None:
+                stats = self._new_group(offset + other_stats['first'])
+                self.positions[position] = stats
+                self._size += self.GROUP_SIZE
+            _add_position_stats(stats, other_stats)
+
+            if self.memory_limit:
+                self._size += sum(map(sys.getsizeof, other_stats['names']))
+                self._size += 8 * len(other_stats['names'])
+                if self._size > self.memory_limit:
+                    self.spill()
+        self.seen += other.seen
+
+    def groups(self) -> Iterable[Group]:
+        """
+        Возвращает агрегаты позиций
+
+        Без сброса на диск позиции идут в порядке первого появления,
+        после сброса - в порядке названий (порядок появления - 'first').
+        """
+        if not self._runs:
+            return self.positions.items()
+        return self._runs.merge(self.positions)
+
+    def spill(self) -> None:
+        """Сбрасывает агрегаты из памяти на диск"""
+        if self._runs is None:
+            self._runs = SpillRuns(_combine_spilled_positions)
+        for stats in self.positions.values():
+            if stats['names']:
+                stats['names'] = [', '.join(stats['names'])]
+        self._runs.write(self.positions)
+        self.positions = {}
+        self._size = 0
+
+    def close(self) -> None:
+        """Удаляет сброшенные на диск агрегаты"""
+        if self._runs is not None:
+            self._runs.close()
+            self._runs = None
+
+    def is_empty(self) -> bool:
+        """Проверяет, были ли добавлены записи"""
+        return not self.positions and not self._runs
+
+    @staticmethod
+    def _new_group(first: int) -> Dict[str, Any]:
+        """Создает пустые агрегаты позиции"""
+        return {'total': 0.0, 'error': 0.0, 'squares': 0.0,
+                'count': 0, 'names': [], 'first': first}
+
+
+def _add_skill_stats(stats: Dict[str, Any],
+                     other: Dict[str, Any],
+                     preview_size: int) -> None:
+    """Добавляет к агрегатам навыка агрегаты следующей части данных"""
+    stats['count'] += other['count']
+    stats['total'], stats['error'] = _compensated_add(
+        stats['total'], stats['error'] + other['error'], other['total'])
+    stats['squares'] += other['squares']
+    free = preview_size - len(stats['employees'])
+    if free > 0:
+        stats['employees'].extend(other['employees'][:free])
+
+
+class SkillsAccumulator:
+    """
+    Накопитель агрегатов отчета по навыкам
+
+    Агрегаты навыков растут с числом различных навыков; с memory_limit
+    при превышении оценки их размера они сбрасываются на диск
+    (SpillRuns), как в PerformanceAccumulator. Топ сотрудников
+    ограничен TOP_EMPLOYEES и всегда хранится в памяти.
+    """
+
+    # Сколько сотрудников показывать в таблице навыков
+    PREVIEW_SIZE = 3
+    # Сколько сотрудников попадает в топ по количеству навыков
+    TOP_EMPLOYEES = 10
+    # Сколько различных строк навыков помнит кэш разбора записей
+    PARSE_CACHE_SIZE = 4096
+    # Оценка размера агрегатов одного навыка в памяти, байт
+    GROUP_SIZE = 800
+
+    def __init__(self,
+                 parse_skills: Callable[[str], List[str]],
+                 memory_limit: Optional[int] = None):
+        self._parse_skills_uncached = parse_skills
+        # Одинаковые строки навыков в записях разбираются один раз
+        self._parse_skills = lru_cache(maxsize=self.PARSE_CACHE_SIZE)(
+            parse_skills)
+        # навык -> {'count', 'total', 'error', 'squares',
+        # 'employees' (первые имена), 'first' (номер первой записи)}
+        self.skills: Dict[str, Dict[str, Any]] = {}
+        # Куча (кол-во навыков, -порядковый номер, данные сотрудника)
+        self._top: List[Tuple[int, int, Dict[str, Any]]] = []
+        self.seen = 0
+        self.memory_limit = memory_limit
+        self._size = 0
+        self._runs: Optional[SpillRuns] = None
+
+    def add(self, employee: Employee) -> None:
+        """Добавляет запись сотрудника в агрегаты"""
+        self._add(
+            employee.name,
+            employee.position,
+            employee.performance,
+            self._parse_skills(employee.skills))
+
+    def add_table(self, table: EmployeeTable) -> None:
+        """
+        Добавляет записи колоночной таблицы
+
+        Навыки берутся из разобранной при загрузке колонки skill_lists
+        и группируются по идентификаторам навыков; список имен навыков
+        строится только для сотрудников, попадающих в топ.
+        """
+        part = SkillsAccumulator(self._parse_skills_uncached)
+        skill_lists = table.skill_lists
+        skill_names = skill_lists.skills
+        ids = skill_lists.ids.tolist()
+        offsets = skill_lists.offsets.tolist()
+        names = table.name.values
+        positions = table.position.values
+        groups: List[Optional[Dict[str, Any]]] = [None] * len(skill_names)
+        preview_size = self.PREVIEW_SIZE
+        top = part._top
+
+        for index, (name_code, position_code, performance,
+                    start, end) in enumerate(zip(
+                        table.name.codes, table.position.codes,
+                        table.performance, offsets, islice(offsets, 1, None))):
+            name = names[name_code]
+            for skill_id in ids[start:end]:
+                stats = groups[skill_id]
+                if stats is None:
+                    stats = self._new_group(index)
+                    groups[skill_id] = stats
+                    part.skills[skill_names[skill_id]] = stats
+                stats['count'] += 1
+                stats['total'], stats['error'] = _compensated_add(
+                    stats['total'], stats['error'], performance)
+                stats['squares'] += performance * performance
+                if len(stats['employees']) < preview_size:
+                    stats['employees'].append(name)
+
+            skills_count = end - start
+            if (len(top) < self.TOP_EMPLOYEES
+                    or (skills_count, -index) > top[0][:2]):
+                part._push_top(skills_count, index, {
+                    'name': name,
+                    'position': positions[position_code],
+                    'performance': performance,
+                    'skills_count': skills_count,
+                    'skills': [skill_names[skill_id]
+                               for skill_id in ids[start:end]]
+                })
+
+        part.seen = len(table)
+        self.merge(part)
+
+    def _add(self,
+             name: str,
+             position: str,
+             performance: float,
+             skills_list: List[str]) -> None:
+        """Добавляет сотрудника с разобранным списком навыков"""
+        for skill in skills_list:
+            stats = self.skills.get(skill)
+            if stats is None:
+                stats = self._new_group(self.seen)
+                self.skills[skill] = stats
+                self._size += self.GROUP_SIZE + sys.getsizeof(skill)
+            stats['count'] += 1
+            stats['total'], stats['error'] = _compensated_add(
+                stats['total'], stats['error'], performance)
+            stats['squares'] += performance * performance
+            if len(stats['employees']) < self.PREVIEW_SIZE:
+                stats['employees'].append(name)
+
+        if self._enters_top(len(skills_list), self.seen):
+            self._push_top(len(skills_list), self.seen, {
+                'name': name,
+                'position': position,
+                'performance': performance,
+                'skills_count': len(skills_list),
+                # Список из кэша разбора общий для одинаковых строк
+                'skills': list(skills_list)
+            })
+        self.seen += 1
+
+        if self.memory_limit and self._size > self.memory_limit:
+            self.spill()
+
+    def merge(self, other: 'SkillsAccumulator') -> None:
+        """Объединяет агрегаты, накопленные по следующей части данных"""
+        for skill, other_stats in other.groups():
+            stats = self.skills.get(skill)
+            if stats is None:
+                stats = self._new_group(self.seen + other_stats['first'])
+                self.skills[skill] = stats
+                self._size += self.GROUP_SIZE + sys.getsizeof(skill)
+            _add_skill_stats(stats, other_stats, self.PREVIEW_SIZE)
+            if self.memory_limit and self._size > self.memory_limit:
+                self.spill()
+
+        for skills_count, neg_index, employee in other._top:
+            self._push_top(skills_count, self.seen - neg_index, employee)
+        self.seen += other.seen
+
+    def groups(self) -> Iterable[Group]:
+        """
+        Возвращает агрегаты навыков
+
+        Без сброса на диск навыки идут в порядке первого появления,
+        после сброса - в порядке названий (порядок появления - 'first').
+        """
+        if not self._runs:
+            return self.skills.items()
+        return self._runs.merge(self.skills)
+
+    def spill(self) -> None:
+        """Сбрасывает агрегаты навыков из памяти на диск"""
+        if self._runs is None:
+            preview_size = self.PREVIEW_SIZE
+
+            def combine(stats: Dict[str, Any],
+                        other: Dict[str, Any]) -> None:
+                _add_skill_stats(stats, other, preview_size)
+                stats['first'] = min(stats['first'], other['first'])
+
+            self._runs = SpillRuns(combine)
+        self._runs.write(self.skills)
+        self.skills = {}
+        self._size = 0
+
+    def close(self) -> None:
+        """Удаляет сброшенные на диск агрегаты"""
+        if self._runs is not None:
+            self._runs.close()
+            self._runs = None
+
+    def top_employees(self) -> List[Dict[str, Any]]:
+        """Возвращает топ сотрудников по количеству навыков"""
+        ordered = sorted(self._top, key=lambda item: (-item[0], -item[1]))
+        return [employee for _, _, employee in ordered]
+
+    def is_empty(self) -> bool:
+        """Проверяет, были ли добавлены записи"""
+        return self.seen == 0
+
+    def _enters_top(self, skills_count: int, index: int) -> bool:
+        """Проверяет, попадет ли сотрудник в текущий топ"""
+        return (len(self._top) < self.TOP_EMPLOYEES
+                or (skills_count, -index) > self._top[0][:2])
+
+    @staticmethod
+    def _new_group(first: int) -> Dict[str, Any]:
+        """Создает пустые агрегаты навыка"""
+        return {'count': 0, 'total': 0.0, 'error': 0.0, 'squares': 0.0,
+                'employees': [], 'first': first}
+
+    def _push_top(self,
+                  skills_count: int,
+                  index: int,
+                  employee: Dict[str, Any]) -> None:
+        """Обновляет топ, сохраняя порядок поступления при равенстве"""
+        item = (skills_count, -index, employee)
+        if len(self._top) < self.TOP_EMPLOYEES:
+            heapq.heappush(self._top, item)
+        elif item[:2] > self._top[0][:2]:
+            heapq.heapreplace(self._top, item)
 
 
 class BaseReport(ABC):
     """Базовый класс для всех отчетов"""
 
+    # Колонки, значения которых использует отчет; загрузчик может
+    # проверять и переносить в записи только их (None - все колонки)
+    COLUMNS: Optional[Tuple[str, ...]] = None
+
     def __init__(self, name: str):
         self.name = name
+        # Предел памяти накопителя в байтах (0 - без ограничения)
+        self.memory_limit = 0
 
     @abstractmethod
-    def generate(self, data: List[Dict[str, Any]]) -> str:
+    def generate(self,
+                 data: EmployeeData,
+                 sample: Optional[SampleInfo] = None) -> str:
         """
         Генерирует отчет на основе данных
 
         Args:
-            data: Список словарей с данными сотрудников
+            data: Список словарей с данными сотрудников или EmployeeTable
+            sample: Описание выборки, если data - выборка строк;
+                тогда отчет показывает оценки с доверительными интервалами
 
         Returns:
             Строка с отформатированным отчетом
         """
         pass
 
+    def create_accumulator(self) -> Any:
+        """
+        Создает накопитель агрегатов для потоковой генерации отчета
+
+        Returns:
+            Объект с методами add() и merge()
+        """
+        raise NotImplementedError(
+            f"Отчет '{self.name}' не поддерживает потоковую обработку")
+
+    def render(self,
+               accumulator: Any,
+               sample: Optional[SampleInfo] = None) -> str:
+        """
+        Формирует отчет по накопленным агрегатам
+
+        Args:
+            accumulator: Накопитель, созданный create_accumulator()
+            sample: Описание выборки, по которой накоплены агрегаты
+
+        Returns:
+            Строка с отформатированным отчетом
+        """
+        raise NotImplementedError(
+            f"Отчет '{self.name}' не поддерживает потоковую обработку")
+
+    def accumulate(self,
+                   records: Iterable[Record],
+                   accumulator: Any = None) -> Any:
+        """
+        Сворачивает записи в накопитель по мере их поступления
+
+        Накопители работают с Employee; словари преобразуются
+        на лету для совместимости.
+
+        Args:
+            records: Поток записей сотрудников (Employee или словари)
+            accumulator: Накопитель для продолжения свертки
+
+        Returns:
+            Накопитель с агрегатами
+        """
+        if accumulator is None:
+            accumulator = self.create_accumulator()
+
+        if isinstance(records, EmployeeTable) and hasattr(
+                accumulator, 'add_table'):
+            # Колоночные данные сворачиваются без построения словарей
+            accumulator.add_table(records)
+            return accumulator
+
+        add = accumulator.add
+        from_dict = Employee.from_dict
+        for record in records:
+            if isinstance(record, dict):
+                record = from_dict(record)
+            add(record)
+        return accumulator
+
+    def generate_stream(self,
+                        records: Iterable[Record],
+                        sample: Optional[SampleInfo] = None) -> str:
+        """
+        Генерирует отчет по потоку записей без хранения всего набора
+
+        Args:
+            records: Поток записей сотрудников
+            sample: Описание выборки, если записи - выборка строк
+
+        Returns:
+            Строка с отформатированным отчетом
+        """
+        accumulator = self.create_accumulator()
+        try:
+            self.accumulate(records, accumulator)
+            return self.render(accumulator, sample)
+        finally:
+            # Сброшенные на диск агрегаты больше не нужны
+            close = getattr(accumulator, 'close', None)
+            if close is not None:
+                close()
+
 
 class PerformanceReport(BaseReport):
     """Отчет по эффективности сотрудников"""
 
+    COLUMNS = ('name', 'position', 'performance')
+
     def __init__(self):
         super().__init__("performance")
 
-    def generate(self, data: List[Dict[str, Any]]) -> str:
+    def generate(self,
+                 data: EmployeeData,
+                 sample: Optional[SampleInfo] = None) -> str:
         """
         Генерирует отчет по эффективности
 
@@ -44,8 +565,12 @@ class PerformanceReport(BaseReport):
         - Среднюю эффективность по каждой позиции
         - Сортировку по эффективности
 
+        По выборке средние и количества сотрудников показываются
+        как оценки с полуширинами доверительных интервалов.
+
         Args:
             data: Список словарей с данными сотрудников
+            sample: Описание выборки, если data - выборка строк
 
         Returns:
             Отформатированный отчет в виде таблицы
@@ -53,56 +578,61 @@ class PerformanceReport(BaseReport):
         if not data:
             return self._generate_empty_report()
 
-        # Группируем данные по позициям
-        position_performance = self._group_by_position(data)
+        return self.generate_stream(data, sample)
+
+    def create_accumulator(self) -> PerformanceAccumulator:
+        """Создает накопитель агрегатов по позициям"""
+        return PerformanceAccumulator(self.memory_limit or None)
+
+    def render(self,
+               accumulator: PerformanceAccumulator,
+               sample: Optional[SampleInfo] = None) -> str:
+        """Формирует таблицу по агрегатам позиций"""
+        if accumulator.is_empty():
+            return self._generate_empty_report()
 
         # Вычисляем среднюю эффективность для каждой позиции
-        report_data = self._calculate_average_performance(position_performance)
+        report_data = self._calculate_average_performance(
+            accumulator.groups(), sample)
 
         # Сортируем данные согласно конфигурации
         sorted_data = self._sort_data(report_data)
 
         # Формируем таблицу
-        return self._format_table(sorted_data)
-
-    def _group_by_position(
-        self,
-        data: List[Dict[str, Any]]
-    ) -> Dict[str, Dict[str, Any]]:
-        """Группирует данные по позициям"""
-        position_data: DefaultDict[str, Dict[str, Any]] = defaultdict(
-            lambda: {'performances': [], 'names': []}
-        )
-
-        for employee in data:
-            position = employee['position']
-            performance = employee['performance']
-            name = employee['name']
-
-            position_data[position]['performances'].append(performance)
-            position_data[position]['names'].append(name)
-
-        return dict(position_data)
+        table = self._format_table(sorted_data)
+        if sample is None:
+            return table
+        return _sample_note(sample) + table
 
     def _calculate_average_performance(
         self,
-        position_data: Dict[str, Dict[str, Any]]
+        position_data: Iterable[Group],
+        sample: Optional[SampleInfo] = None
     ) -> List[Dict[str, Any]]:
-        """Вычисляет среднюю эффективность для каждой позиции"""
-        report_data: List[Dict[str, Any]] = []
-
-        for position, data in position_data.items():
-            performances = data['performances']
-            names = data['names']
-            avg_performance = sum(performances) / len(performances)
-            report_data.append({
+        """
+        Вычисляет среднюю эффективность для каждой позиции
+
+        Позиции возвращаются в порядке первого появления в данных,
+        даже если агрегаты сбрасывались на диск.
+        """
+        report_data: List[Tuple[int, Dict[str, Any]]] = []
+
+        for position, data in position_data:
+            avg_performance = (data['total'] + data['error']) / data['count']
+            item = {
                 'position': position,
                 'avg_performance': round(avg_performance, 2),
-                'employee_count': len(performances),
-                'employee_names': names
-            })
-
-        return report_data
+                'employee_count': data['count'],
+                'employee_names': data['names']
+            }
+            if sample is not None:
+                # Значения для таблицы; сортировка - по среднему выборки
+                item['avg_display'] = _format_mean(sample, data)
+                item['count_display'] = _format_count(sample, data['count'])
+            report_data.append((data['first'], item))
+
+        report_data.sort(key=itemgetter(0))
+        return [item for _, item in report_data]
 
     def _sort_data(
         self,
@@ -132,8 +662,8 @@ class PerformanceReport(BaseReport):
             table_data.append([
                 i,
                 f"{item['position']}\n({employee_names})",
-                item['avg_performance'],
-                item['employee_count']
+                item.get('avg_display', item['avg_performance']),
+                item.get('count_display', item['employee_count'])
             ])
 
         headers = ['№', 'Позиция', 'Средняя эффективность',
@@ -158,10 +688,14 @@ class PerformanceReport(BaseReport):
 class SkillsReport(BaseReport):
     """Отчет по навыкам сотрудников"""
 
+    COLUMNS = ('name', 'position', 'performance', 'skills')
+
     def __init__(self):
         super().__init__("skills")
 
-    def generate(self, data: List[Dict[str, Any]]) -> str:
+    def generate(self,
+                 data: EmployeeData,
+                 sample: Optional[SampleInfo] = None) -> str:
         """
         Генерирует отчет по навыкам
 
@@ -170,8 +704,13 @@ class SkillsReport(BaseReport):
         - Топ сотрудников по количеству навыков
         - Статистику по навыкам
 
+        По выборке количество сотрудников и средняя эффективность
+        навыков показываются как оценки с доверительными интервалами;
+        топ сотрудников строится по записям выборки.
+
         Args:
             data: Список словарей с данными сотрудников
+            sample: Описание выборки, если data - выборка строк
 
         Returns:
             Отформатированный отчет по навыкам
@@ -179,25 +718,36 @@ class SkillsReport(BaseReport):
         if not data:
             return self._generate_empty_report()
 
-        # Парсинг навыков из данных
-        parsed_data = self._parse_skills_from_data(data)
+        return self.generate_stream(data, sample)
 
-        # Анализ распределения навыков
-        skills_stats = self._analyze_skills_distribution(parsed_data)
+    def create_accumulator(self) -> SkillsAccumulator:
+        """Создает накопитель агрегатов по навыкам"""
+        return SkillsAccumulator(
+            self._parse_skills_string, self.memory_limit or None)
 
-        # Анализ сотрудников по навыкам
-        employees_stats = self._analyze_employees_skills(parsed_data)
+    def render(self,
+               accumulator: SkillsAccumulator,
+               sample: Optional[SampleInfo] = None) -> str:
+        """Формирует отчет по агрегатам навыков"""
+        if accumulator.is_empty():
+            return self._generate_empty_report()
+
+        # Анализ распределения навыков
+        skills_stats = self._skills_stats(accumulator, sample)
 
         # Формирование отчета
-        return self._format_skills_report(skills_stats, employees_stats)
+        return self._format_skills_report(
+            skills_stats, accumulator.top_employees(), sample)
 
     def _parse_skills_from_data(
             self,
-            data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            data: Iterable[Record]) -> List[Dict[str, Any]]:
         """Парсит навыки из данных сотрудников"""
         parsed_data = []
 
         for employee in data:
+            if isinstance(employee, Employee):
+                employee = employee.as_dict()
             skills_str = employee.get('skills', '')
             skills_list = self._parse_skills_string(skills_str)
 
@@ -209,88 +759,61 @@ class SkillsReport(BaseReport):
 
     def _parse_skills_string(self, skills_string: str) -> List[str]:
         """Парсит строку навыков в список"""
-        if not skills_string:
-            return []
-
-        # Разделяем по запятой и убираем лишние пробелы
-        skills = [skill.strip() for skill in skills_string.split(',')]
-        # Убираем пустые строки
-        skills = [skill for skill in skills if skill]
-
-        return skills
+        return parse_skills(skills_string)
 
     def _analyze_skills_distribution(
             self,
-            data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            data: Iterable[Record]) -> List[Dict[str, Any]]:
         """Анализирует распределение навыков"""
-        skills_stats: DefaultDict[str, Dict[str, Any]] = defaultdict(
-            lambda: {'employees': [], 'performances': []}
-        )
+        return self._skills_stats(self.accumulate(data))
 
+    def _skills_stats(
+            self,
+            accumulator: SkillsAccumulator,
+            sample: Optional[SampleInfo] = None) -> List[Dict[str, Any]]:
+        """Формирует статистику навыков из накопителя"""
         min_occurrence = config.get('SKILLS_REPORT_MIN_OCCURRENCE', 2)
 
-        # Собираем статистику по каждому навыку
-        for employee in data:
-            name = employee['name']
-            performance = employee['performance']
-            skills_list = employee['skills_list']
-
-            for skill in skills_list:
-                skills_stats[skill]['employees'].append(name)
-                skills_stats[skill]['performances'].append(performance)
-
-        # Формируем результат
         result = []
-        for skill, stats in skills_stats.items():
-            if len(stats['employees']) >= min_occurrence:
-                avg_performance = sum(
-                    stats['performances']) / len(stats['performances'])
-                result.append({
+        for skill, stats in accumulator.groups():
+            if stats['count'] >= min_occurrence:
+                avg_performance = (
+                    stats['total'] + stats['error']) / stats['count']
+                item = {
                     'skill': skill,
-                    'employee_count': len(stats['employees']),
+                    'employee_count': stats['count'],
                     'avg_performance': round(avg_performance, 2),
                     'employees': stats['employees']
-                })
-
-        # Сортируем по количеству сотрудников (по убыванию)
-        return sorted(result, key=lambda x: x['employee_count'], reverse=True)
+                }
+                if sample is not None:
+                    item['avg_display'] = _format_mean(sample, stats)
+                    item['count_display'] = _format_count(
+                        sample, stats['count'])
+                result.append((-stats['count'], stats['first'], item))
+
+        # Сортируем по количеству сотрудников (по убыванию), при равенстве -
+        # по первому появлению навыка
+        result.sort(key=itemgetter(0, 1))
+        return [item for _, _, item in result]
 
     def _analyze_employees_skills(
             self,
-            data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Анализирует сотрудников по количеству навыков"""
-        employees_stats = []
-
-        for employee in data:
-            name = employee['name']
-            position = employee['position']
-            performance = employee['performance']
-            skills_list = employee['skills_list']
-
-            employees_stats.append({
-                'name': name,
-                'position': position,
-                'performance': performance,
-                'skills_count': len(skills_list),
-                'skills': skills_list
-            })
-
-        # Сортируем по количеству навыков (по убыванию)
-        return sorted(
-            employees_stats,
-            key=lambda x: x['skills_count'],
-            reverse=True
-        )
+            data: Iterable[Record]) -> List[Dict[str, Any]]:
+        """Анализирует сотрудников по количеству навыков (топ)"""
+        return self.accumulate(data).top_employees()
 
     def _format_skills_report(
             self,
             skills_stats: List[Dict],
-            employees_stats: List[Dict]) -> str:
+            employees_stats: List[Dict],
+            sample: Optional[SampleInfo] = None) -> str:
         """Форматирует полный отчет по навыкам"""
         report_parts = []
 
         # Заголовок отчета
         report_parts.append("=== ОТЧЕТ ПО НАВЫКАМ СОТРУДНИКОВ ===\n")
+        if sample is not None:
+            report_parts.append(_sample_note(sample))
 
         # Топ навыков
         report_parts.append(self._format_skills_table(
@@ -310,16 +833,16 @@ class SkillsReport(BaseReport):
 
         table_data = []
         for i, skill_data in enumerate(skills_stats, 1):
-            employees_str = ', '.join(
-                skill_data['employees'][:3])  # Показываем первых 3
-            if len(skill_data['employees']) > 3:
-                employees_str += f" и еще {len(skill_data['employees']) - 3}"
+            # Показываем первых 3
+            employees_str = ', '.join(skill_data['employees'][:3])
+            if skill_data['employee_count'] > 3:
+                employees_str += f" и еще {skill_data['employee_count'] - 3}"
 
             table_data.append([
                 i,
                 skill_data['skill'],
-                skill_data['employee_count'],
-                skill_data['avg_performance'],
+                skill_data.get('count_display', skill_data['employee_count']),
+                skill_data.get('avg_display', skill_data['avg_performance']),
                 employees_str
             ])
 
@@ -365,11 +888,32 @@ class ReportGenerator:
             'performance': PerformanceReport(),
             'skills': SkillsReport()
         }
+        self.configure(
+            memory_limit=config.get('MEMORY_LIMIT_MB', 0) * 1024 * 1024)
+
+    def configure(self, memory_limit: int = None) -> None:
+        """
+        Настраивает генерацию отчетов
+
+        Args:
+            memory_limit: Предел памяти агрегатов отчета в байтах;
+                при превышении агрегаты сбрасываются во временные файлы
+                (0 - без ограничения, None - оставить текущий)
+
+        Raises:
+            ValueError: Если предел отрицательный
+        """
+        if memory_limit is not None:
+            if memory_limit < 0:
+                raise ValueError(
+                    "Предел памяти не может быть отрицательным")
+            for report in self.reports.values():
+                report.memory_limit = memory_limit
 
     def generate_report(
             self,
             report_type: str,
-            data: List[Dict[str, Any]]) -> str:
+            data: EmployeeData) -> str:
         """
         Генерирует отчет указанного типа
 
@@ -380,6 +924,131 @@ class ReportGenerator:
         Returns:
             Отформатированный отчет
 
+        Raises:
+            ValueError: Если тип отчета не поддерживается
+        """
+        return self.get_report(report_type).generate(data)
+
+    def generate_sampled_report(
+            self,
+            report_type: str,
+            data: EmployeeData,
+            sample: SampleInfo) -> str:
+        """
+        Генерирует отчет указанного типа по выборке строк
+
+        Args:
+            report_type: Тип отчета
+            data: Записи выборки
+            sample: Описание выборки
+
+        Returns:
+            Отформатированный отчет с оценками и доверительными интервалами
+
+        Raises:
+            ValueError: Если тип отчета не поддерживается
+        """
+        return self.get_report(report_type).generate(data, sample)
+
+    def generate_report_stream(
+            self,
+            report_type: str,
+            records: Iterable[Record]) -> str:
+        """
+        Генерирует отчет указанного типа по потоку записей
+
+        Args:
+            report_type: Тип отчета
+            records: Поток записей для анализа
+
+        Returns:
+            Отформатированный отчет
+
+        Raises:
+            ValueError: Если тип отчета не поддерживается
+        """
+        return self.get_report(report_type).generate_stream(records)
+
+    def aggregate(self, report_type: str, data: EmployeeData) -> Any:
+        """
+        Сворачивает данные одной части (файла) в агрегаты отчета
+
+        Агрегаты частей объединяются render_aggregates(), поэтому при
+        изменении части достаточно свернуть заново только ее.
+
+        Args:
+            report_type: Тип отчета
+            data: Данные части
+
+        Returns:
+            Накопитель агрегатов части
+
+        Raises:
+            ValueError: Если тип отчета не поддерживается
+        """
+        report = self.get_report(report_type)
+        accumulator = report.create_accumulator()
+        # Агрегаты части хранятся между обновлениями и объединяются
+        # повторно, поэтому на диск не сбрасываются
+        accumulator.memory_limit = None
+        return report.accumulate(data, accumulator)
+
+    def render_aggregates(self,
+                          report_type: str,
+                          parts: Iterable[Any]) -> str:
+        """
+        Формирует отчет по агрегатам частей
+
+        Части объединяются в переданном порядке; отчет совпадает
+        с отчетом по данным всех частей, загруженным в том же порядке.
+        Агрегаты частей не изменяются.
+
+        Args:
+            report_type: Тип отчета
+            parts: Накопители, возвращенные aggregate()
+
+        Returns:
+            Отформатированный отчет
+
+        Raises:
+            ValueError: Если тип отчета не поддерживается
+        """
+        report = self.get_report(report_type)
+        accumulator = report.create_accumulator()
+        try:
+            for part in parts:
+                accumulator.merge(part)
+            return report.render(accumulator)
+        finally:
+            accumulator.close()
+
+    def get_report_columns(
+            self,
+            report_type: str) -> Optional[Tuple[str, ...]]:
+        """
+        Возвращает колонки, которые использует отчет
+
+        Args:
+            report_type: Тип отчета
+
+        Returns:
+            Кортеж колонок или None, если отчету нужны все колонки
+
+        Raises:
+            ValueError: Если тип отчета не поддерживается
+        """
+        return self.get_report(report_type).COLUMNS
+
+    def get_report(self, report_type: str) -> BaseReport:
+        """
+        Возвращает отчет указанного типа
+
+        Args:
+            report_type: Тип отчета
+
+        Returns:
+            Экземпляр отчета
+
         Raises:
             ValueError: Если тип отчета не поддерживается
         """
@@ -390,5 +1059,4 @@ class ReportGenerator:
                 f"Доступные отчеты: {available_reports}"
             )
 
-        report = self.reports[report_type]
-        return report.generate(data)
+        return self.reports[report_type]
@@ -0,0 +1,275 @@
+"""
+Случайные выборки строк и оценки по ним
+"""
+import math
+import random
+import time
+from itertools import islice
+from statistics import NormalDist
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+
+class Reservoir:
+    """
+    Простая случайная выборка фиксированного размера из потока
+
+    Алгоритм L: после заполнения выборки номер следующего элемента,
+    который в нее попадает, вычисляется заранее, поэтому для
+    пропускаемых элементов случайные числа не генерируются.
+    """
+
+    def __init__(self, size: int, rng: random.Random):
+        """
+        Инициализация выборки
+
+        Args:
+            size: Размер выборки
+            rng: Генератор случайных чисел
+        """
+        self.size = size
+        self.items: List[Any] = []
+        self.seen = 0
+        self._rng = rng
+        self._weight = 1.0
+        self._next = size
+
+    def offer(self, item: Any) -> None:
+        """Предлагает очередной элемент потока"""
+        index = self.seen
+        self.seen = index + 1
+        if index < self.size:
+            self.items.append(item)
+            if self.seen == self.size:
+                self._advance(index)
+        elif index == self._next:
+            self.items[self._rng.randrange(self.size)] = item
+            self._advance(index)
+
+    def _advance(self, index: int) -> None:
+        """Выбирает номер следующего элемента, попадающего в выборку"""
+        self._weight *= math.exp(math.log(self._uniform()) / self.size)
+        skip = math.log(self._uniform()) / math.log1p(-self._weight)
+        self._next = index + int(skip) + 1
+
+    def _uniform(self) -> float:
+        """Случайное число из интервала (0, 1)"""
+        value = self._rng.random()
+        while value == 0.0:
+            value = self._rng.random()
+        return value
+
+
+class SampleMerger:
+    """
+    Объединяет выборки частей данных в выборку всего набора
+
+    Без размера выборки (выборка с вероятностью или чтение до
+    deadline) записи частей просто объединяются. С размером части
+    должны быть простыми случайными выборками; из объединения берется
+    простая случайная выборка: число записей из новой части имеет
+    гипергеометрическое распределение по численности частей.
+    Записи внутри частей сохраняют исходный порядок.
+    """
+
+    def __init__(self,
+                 size: Optional[int],
+                 rng: random.Random,
+                 container: Any):
+        """
+        Инициализация
+
+        Args:
+            size: Размер выборки или None - объединять без отбора
+            rng: Генератор случайных чисел
+            container: Пустой контейнер записей для результата
+        """
+        self.size = size
+        self.population = 0.0
+        self._rng = rng
+        self._container = container
+        self._records: List[Any] = []
+
+    def add(self, records: Iterable[Any], population: float) -> None:
+        """
+        Добавляет выборку следующей части
+
+        Args:
+            records: Записи выборки части
+            population: Численность части, из которой взята выборка
+        """
+        if self.size is None:
+            self._container.extend(records)
+            self.population += population
+            return
+
+        records = list(records)
+        if not records:
+            self.population += population
+            return
+
+        kept, added = self.population, population
+        self.population += population
+        target = min(self.size, len(self._records) + len(records))
+        take = 0
+        for _ in range(target):
+            if self._rng.random() * (kept + added) < added:
+                take += 1
+                added = max(added - 1, 0.0)
+            else:
+                kept = max(kept - 1, 0.0)
+        take = min(take, len(records))
+        keep = min(target - take, len(self._records))
+        self._records = (
+            self._subset(self._records, keep)
+            + self._subset(records, take))
+
+    def _subset(self, records: List[Any], count: int) -> List[Any]:
+        """Случайные count записей в исходном порядке"""
+        if count >= len(records):
+            return records
+        positions = sorted(self._rng.sample(range(len(records)), count))
+        return [records[position] for position in positions]
+
+    def result(self) -> Any:
+        """Возвращает контейнер с итоговой выборкой"""
+        if self.size is not None:
+            self._container.extend(self._records)
+            self._records = []
+        return self._container
+
+
+class Deadline:
+    """Срок, до которого читаются строки"""
+
+    # Как часто (в строках) проверяется время
+    CHECK_EVERY = 1024
+
+    def __init__(self, at: float):
+        """
+        Инициализация
+
+        Args:
+            at: Момент окончания чтения (time.time())
+        """
+        self.at = at
+        self.stopped = False
+
+    def reached(self) -> bool:
+        """Проверяет, наступил ли срок"""
+        return time.time() >= self.at
+
+    def rows(self, rows: Iterable[Any]) -> Iterator[Any]:
+        """
+        Отдает строки, пока не наступил срок
+
+        Если чтение остановлено по сроку, stopped становится True.
+        """
+        rows = iter(rows)
+        while not self.reached():
+            chunk = list(islice(rows, self.CHECK_EVERY))
+            if not chunk:
+                return
+            yield from chunk
+        self.stopped = True
+
+
+def sample_population(valid: int, rejected: int, unsampled: int) -> float:
+    """
+    Оценивает число корректных строк части данных
+
+    Доля корректных строк среди невыбранных считается такой же,
+    как среди выбранных.
+
+    Args:
+        valid: Корректные строки выборки
+        rejected: Отклоненные строки выборки
+        unsampled: Невыбранные строки (не проверялись)
+    """
+    examined = valid + rejected
+    if not examined:
+        return float(unsampled)
+    return (examined + unsampled) * valid / examined
+
+
+class SampleInfo:
+    """
+    Описание выборки, по которой строится приближенный отчет
+
+    Оценки считаются как для простой случайной выборки sampled записей
+    из population корректных строк с поправкой на конечность
+    совокупности: при sampled == population интервалы нулевые.
+    """
+
+    def __init__(self,
+                 population: float,
+                 sampled: int,
+                 complete: bool = True,
+                 confidence: float = 0.95):
+        """
+        Инициализация
+
+        Args:
+            population: Число корректных строк (оценка), из которых
+                взята выборка
+            sampled: Число записей в выборке
+            complete: False - чтение остановлено по deadline, оценки
+                относятся только к прочитанным строкам
+            confidence: Уровень доверия интервалов
+        """
+        self.population = max(population, float(sampled))
+        self.sampled = sampled
+        self.complete = complete
+        self.confidence = confidence
+        self._z = NormalDist().inv_cdf(0.5 + confidence / 2)
+
+    @property
+    def fraction(self) -> float:
+        """Доля строк, попавших в выборку"""
+        if not self.population:
+            return 1.0
+        return self.sampled / self.population
+
+    @property
+    def exact(self) -> bool:
+        """Выборка содержит все прочитанные строки"""
+        return self.sampled >= self.population
+
+    def count(self, count: int) -> Tuple[float, float]:
+        """
+        Оценивает число строк группы
+
+        Args:
+            count: Число записей группы в выборке
+
+        Returns:
+            Оценка и полуширина доверительного интервала
+        """
+        if not self.sampled:
+            return 0.0, 0.0
+        share = count / self.sampled
+        variance = share * (1 - share) / self.sampled * (1 - self.fraction)
+        return (self.population * share,
+                self._z * self.population * math.sqrt(max(variance, 0.0)))
+
+    def mean(self,
+             total: float,
+             squares: float,
+             count: int) -> Tuple[float, Optional[float]]:
+        """
+        Оценивает среднее значение группы
+
+        Args:
+            total: Сумма значений группы в выборке
+            squares: Сумма квадратов значений
+            count: Число записей группы в выборке
+
+        Returns:
+            Среднее и полуширина доверительного интервала (None, если
+            записей меньше двух)
+        """
+        mean = total / count
+        if count < 2:
+            return mean, None
+        variance = max(squares - count * mean * mean, 0.0) / (count - 1)
+        return mean, self._z * math.sqrt(
+            variance / count * (1 - self.fraction))
@@ -0,0 +1,389 @@
+"""
+Схема записи сотрудника и построчные валидаторы
+"""
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+from src.config import config
+from src.employee import Employee
+from src.employee_table import Record
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - numpy не обязателен
+    numpy = None
+
+# Строка CSV: словарь от csv.DictReader или список от csv.reader
+Row = Any
+
+# Функция, проверяющая строку и возвращающая обработанную запись
+RowValidator = Callable[[Row], Record]
+
+# Функция, проверяющая пакет строк и возвращающая список записей
+BatchValidator = Callable[[List[Row]], List[Record]]
+
+# Словари строк по колонкам: значение -> общий экземпляр строки
+StringPools = Mapping[str, Dict[str, str]]
+
+# Строковые поля записи в порядке разбора строки
+STRING_FIELDS = ('name', 'position', 'skills', 'team')
+
+
+# Текст ошибки для строки, в которой меньше значений, чем колонок
+MISSING_VALUES_ERROR = "Недостаточно значений в строке"
+
+# Наибольшее целое значение: целые колонки EmployeeTable и numpy-проверки
+# хранятся в int64
+MAX_INTEGER = 2 ** 63 - 1
+
+
+class RowError(ValueError):
+    """Ошибка проверки строки с ее порядковым номером в пакете"""
+
+    def __init__(self, index: int, message: str):
+        super().__init__(message)
+        self.index = index
+        self.message = message
+
+
+def _record_dict(name: str,
+                 position: str,
+                 completed_tasks: int,
+                 performance: float,
+                 skills: str,
+                 team: str,
+                 experience_years: int) -> Dict[str, Any]:
+    """Собирает запись-словарь в порядке полей load_data()"""
+    return {
+        'name': name,
+        'position': position,
+        'skills': skills,
+        'team': team,
+        'completed_tasks': completed_tasks,
+        'performance': performance,
+        'experience_years': experience_years
+    }
+
+
+class EmployeeSchema:
+    """
+    Схема записи сотрудника: обязательные колонки и границы значений
+
+    Границы читаются из конфигурации один раз при создании схемы,
+    а compile() собирает из них функцию проверки одной строки, в которой
+    ключи колонок, преобразователи и тексты ошибок уже вычислены.
+    Проверяются и переносятся в запись только колонки validated;
+    остальные поля записи получают пустые значения (EMPTY_VALUES).
+    """
+
+    RECORD_FACTORIES = {
+        'dict': _record_dict,
+        # Для колоночной таблицы строки также собираются в Employee
+        'employee': Employee,
+        'table': Employee,
+    }
+
+    # Значения полей, колонки которых не проверяются
+    EMPTY_VALUES = {
+        'name': '',
+        'position': '',
+        'skills': '',
+        'team': '',
+        'completed_tasks': 0,
+        'performance': 0.0,
+        'experience_years': 0,
+    }
+
+    def __init__(self,
+                 columns: Sequence[str],
+                 min_performance: float,
+                 max_performance: float,
+                 min_experience_years: int,
+                 validated: Optional[Sequence[str]] = None):
+        """
+        Инициализация схемы
+
+        Args:
+            columns: Обязательные колонки файла
+            min_performance: Минимальное значение performance
+            max_performance: Максимальное значение performance
+            min_experience_years: Минимальный стаж
+            validated: Колонки, которые проверяются и переносятся
+                в запись (по умолчанию - все обязательные колонки)
+        """
+        self.columns = tuple(columns)
+        self.min_performance = min_performance
+        self.max_performance = max_performance
+        self.min_experience_years = min_experience_years
+        if validated is None:
+            self.validated = self.columns
+        else:
+            self.validated = tuple(
+                column for column in self.columns if column in validated)
+
+    @classmethod
+    def from_config(
+            cls,
+            columns: Sequence[str],
+            validated: Optional[Sequence[str]] = None) -> 'EmployeeSchema':
+        """
+        Создает схему с границами значений из конфигурации
+
+        Args:
+            columns: Обязательные колонки файла
+            validated: Проверяемые колонки (по умолчанию - все)
+
+        Returns:
+            Экземпляр EmployeeSchema
+        """
+        return cls(
+            columns,
+            float(config.get('MIN_PERFORMANCE')),
+            float(config.get('MAX_PERFORMANCE')),
+            int(config.get('MIN_EXPERIENCE_YEARS')),
+            validated,
+        )
+
+    def fingerprint(self) -> str:
+        """
+        Возвращает строку, однозначно описывающую правила проверки
+
+        Используется как часть ключа кэша разобранных файлов: при
+        изменении колонок, проверяемых колонок или границ значений
+        ключ меняется.
+        """
+        return repr((self.columns, self.validated, self.min_performance,
+                     self.max_performance, self.min_experience_years))
+
+    def compile(self,
+                record_format: str = 'dict',
+                keys: Optional[Mapping[str, Any]] = None,
+                pools: Optional[StringPools] = None) -> RowValidator:
+        """
+        Собирает функцию проверки строки для одного файла
+
+        Args:
+            record_format: Формат возвращаемой записи
+                ('dict', 'employee' или 'table')
+            keys: Ключ каждой колонки в строке: имя колонки для строк
+                csv.DictReader или индекс для строк csv.reader
+                (по умолчанию - имена колонок)
+            pools: Словари строк для колонок с небольшим числом
+                различных значений: одинаковые значения этих колонок
+                во всех записях ссылаются на один экземпляр строки
+
+        Returns:
+            Функция, которая принимает строку и возвращает запись
+            или выбрасывает ValueError с описанием ошибки
+        """
+        if keys is None:
+            keys = {column: column for column in self.columns}
+        make_record = self.RECORD_FACTORIES[record_format]
+
+        pools = pools or {}
+        validated = self.validated
+        string_fields = tuple(
+            (index, field, keys[field], pools.get(field))
+            for index, field in enumerate(STRING_FIELDS)
+            if field in validated)
+        empty_strings = [self.EMPTY_VALUES[field] for field in STRING_FIELDS]
+        check_tasks = 'completed_tasks' in validated
+        check_performance = 'performance' in validated
+        check_experience = 'experience_years' in validated
+        tasks_key = keys.get('completed_tasks')
+        performance_key = keys.get('performance')
+        experience_key = keys.get('experience_years')
+        empty_tasks = self.EMPTY_VALUES['completed_tasks']
+        empty_performance = self.EMPTY_VALUES['performance']
+        empty_experience = self.EMPTY_VALUES['experience_years']
+
+        min_perf = self.min_performance
+        max_perf = self.max_performance
+        min_exp = self.min_experience_years
+        performance_error = (
+            f"performance должно быть в диапазоне от {min_perf} до {max_perf}")
+        experience_error = f"experience_years должно быть не меньше {min_exp}"
+        integer_error = f"значение должно быть не больше {MAX_INTEGER}"
+
+        def validate(row: Row) -> Record:
+            try:
+                strings = empty_strings[:]
+                for index, field, key, pool in string_fields:
+                    value = row[key].strip()
+                    if not value:
+                        raise ValueError(f"Пустое значение в поле '{field}'")
+                    if pool is not None:
+                        value = pool.setdefault(value, value)
+                    strings[index] = value
+                name, position, skills, team = strings
+
+                completed_tasks = empty_tasks
+                if check_tasks:
+                    try:
+                        completed_tasks = int(row[tasks_key])
+                    except ValueError as e:
+                        raise ValueError(
+                            f"Некорректное значение completed_tasks: {e}")
+                    if completed_tasks < 0:
+                        raise ValueError(
+                            "Некорректное значение completed_tasks: "
+                            "completed_tasks должно быть неотрицательным")
+                    if completed_tasks > MAX_INTEGER:
+                        raise ValueError(
+                            f"Некорректное значение completed_tasks: "
+                            f"{integer_error}")
+
+                performance = empty_performance
+                if check_performance:
+                    try:
+                        performance = float(row[performance_key])
+                    except ValueError as e:
+                        raise ValueError(
+                            f"Некорректное значение performance: {e}")
+                    if not (min_perf <= performance <= max_perf):
+                        raise ValueError(
+                            f"Некорректное значение performance: "
+                            f"{performance_error}")
+
+                experience_years = empty_experience
+                if check_experience:
+                    try:
+                        experience_years = int(row[experience_key])
+                    except ValueError as e:
+                        raise ValueError(
+                            f"Некорректное значение experience_years: {e}")
+                    if experience_years < min_exp:
+                        raise ValueError(
+                            f"Некорректное значение experience_years: "
+                            f"{experience_error}")
+                    if experience_years > MAX_INTEGER:
+                        raise ValueError(
+                            f"Некорректное значение experience_years: "
+                            f"{integer_error}")
+
+                return make_record(name, position, completed_tasks,
+                                   performance, skills, team, experience_years)
+            except (IndexError, AttributeError, TypeError):
+                # В короткой строке значения нет (csv.reader)
+                # или оно равно None (csv.DictReader)
+                raise ValueError(MISSING_VALUES_ERROR)
+
+        return validate
+
+    def compile_batch(
+            self,
+            record_format: str = 'dict',
+            keys: Optional[Mapping[str, Any]] = None,
+            backend: str = 'numpy',
+            pools: Optional[StringPools] = None) -> BatchValidator:
+        """
+        Собирает функцию проверки пакета строк для одного файла
+
+        С backend='numpy' числовые колонки пакета преобразуются
+        в массивы numpy и проверяются по границам векторными масками.
+        Строка с ошибкой повторно проверяется построчным валидатором,
+        поэтому текст ошибки совпадает с compile(). Если numpy не
+        установлен, пакет проверяется построчно.
+
+        Args:
+            record_format: Формат возвращаемой записи
+            keys: Ключ каждой колонки в строке (см. compile())
+            backend: 'numpy' или 'python'
+            pools: Словари строк по колонкам (см. compile())
+
+        Returns:
+            Функция, которая принимает список строк и возвращает
+            список записей или выбрасывает RowError для первой
+            строки с ошибкой
+        """
+        validate = self.compile(record_format, keys, pools)
+
+        def validate_rows(rows: List[Row]) -> List[Record]:
+            records = []
+            for index, row in enumerate(rows):
+                try:
+                    records.append(validate(row))
+                except ValueError as e:
+                    raise RowError(index, str(e))
+            return records
+
+        if backend != 'numpy' or numpy is None:
+            return validate_rows
+
+        if keys is None:
+            keys = {column: column for column in self.columns}
+        make_record = self.RECORD_FACTORIES[record_format]
+        pools = pools or {}
+        validated = self.validated
+        string_fields = [
+            (index, keys[field], pools.get(field))
+            for index, field in enumerate(STRING_FIELDS)
+            if field in validated]
+        # Числовые колонки: (ключ, тип массива, пустое значение)
+        numeric_fields = [
+            (keys[field] if field in validated else None, dtype,
+             self.EMPTY_VALUES[field])
+            for field, dtype in (('completed_tasks', numpy.int64),
+                                 ('performance', numpy.float64),
+                                 ('experience_years', numpy.int64))]
+        min_perf = self.min_performance
+        max_perf = self.max_performance
+        min_exp = self.min_experience_years
+
+        def validate_batch(rows: List[Row]) -> List[Record]:
+            count = len(rows)
+            numbers = []
+            try:
+                for key, dtype, _ in numeric_fields:
+                    numbers.append(None if key is None else numpy.array(
+                        [row[key] for row in rows], dtype=dtype))
+            except (ValueError, TypeError, IndexError, OverflowError):
+                # Непреобразуемое значение: первую ошибку в порядке
+                # строк и полей находит построчная проверка
+                return validate_rows(rows)
+            tasks, performance, experience = numbers
+
+            invalid = numpy.zeros(count, dtype=bool)
+            if tasks is not None:
+                invalid |= tasks < 0
+            if performance is not None:
+                invalid |= ~((performance >= min_perf)
+                             & (performance <= max_perf))
+            if experience is not None:
+                invalid |= experience < min_exp
+            first_invalid = count
+            invalid_rows = numpy.flatnonzero(invalid)
+            if invalid_rows.size:
+                first_invalid = int(invalid_rows[0])
+
+            strings = [[self.EMPTY_VALUES[field]] * count
+                       for field in STRING_FIELDS]
+            try:
+                for index, key, pool in string_fields:
+                    values = [row[key].strip() for row in rows]
+                    if not all(values):
+                        first_invalid = min(first_invalid, values.index(''))
+                    if pool is not None:
+                        values = [pool.setdefault(value, value)
+                                  for value in values]
+                    strings[index] = values
+            except (IndexError, AttributeError):
+                return validate_rows(rows)
+
+            if first_invalid < count:
+                # Строки до first_invalid корректны: ошибка построчной
+                # проверки этой строки - первая ошибка пакета
+                try:
+                    validate(rows[first_invalid])
+                except ValueError as e:
+                    raise RowError(first_invalid, str(e))
+
+            columns = [
+                [empty] * count if values is None else values.tolist()
+                for values, (_, _, empty) in zip(numbers, numeric_fields)]
+            names, positions, skills, teams = strings
+            tasks_list, performance_list, experience_list = columns
+            return list(map(
+                make_record, names, positions, tasks_list,
+                performance_list, skills, teams, experience_list))
+
+        return validate_batch
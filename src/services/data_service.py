@@ -1,10 +1,15 @@
 """
 Сервис для работы с данными
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from pathlib import Path
 
-from src.interfaces.data_loader import DataLoaderInterface
+from src.interfaces.data_loader import (
+    DataLoaderInterface, DiscoveringDataLoaderInterface,
+    StreamingDataLoaderInterface)
+from src.employee_table import EmployeeData
+from src.utils.compression import is_csv_file
+from src.utils.discover import discover_csv_files
 
 
 class DataService:
@@ -19,9 +24,27 @@ class DataService:
         """
         self._data_loader = data_loader
 
+    def configure_loader(self, **options: Any) -> None:
+        """
+        Настраивает параметры загрузчика данных
+
+        Args:
+            **options: Параметры загрузки (None - оставить по умолчанию)
+        """
+        self._data_loader.configure(**options)
+
+    def get_load_summary(self) -> Dict[str, Any]:
+        """
+        Возвращает итоги последней загрузки данных
+
+        Returns:
+            Словарь с итогами загрузки или пустой словарь
+        """
+        return self._data_loader.get_load_summary()
+
     def load_data(self,
                   file_paths: List[str] = None,
-                  folder_path: str = None) -> List[Dict[str, Any]]:
+                  folder_path: str = None) -> EmployeeData:
         """
         Загружает данные из файлов или папки
 
@@ -30,7 +53,7 @@ class DataService:
             folder_path: Путь к папке
 
         Returns:
-            Список словарей с данными
+            Список словарей с данными или EmployeeTable
 
         Raises:
             ValueError: Если не указаны файлы или папка
@@ -44,6 +67,70 @@ class DataService:
             raise ValueError(
                 "Необходимо указать файлы или папку для загрузки данных")
 
+    def list_files(self,
+                   file_paths: List[str] = None,
+                   folder_path: str = None) -> List[str]:
+        """
+        Возвращает файлы, из которых будут загружены данные
+
+        Для папки файлы ищутся заново при каждом вызове; если загрузчик
+        не умеет искать файлы сам, ищутся CSV файлы папки
+        (discover_csv_files()). Список файлов проверяется, как
+        в load_data().
+
+        Args:
+            file_paths: Список путей к файлам
+            folder_path: Путь к папке
+
+        Returns:
+            Список путей к файлам
+
+        Raises:
+            FileNotFoundError: Если файл не найден
+            ValueError: Если не указаны файлы или папка
+        """
+        if folder_path:
+            if isinstance(self._data_loader, DiscoveringDataLoaderInterface):
+                return self._data_loader.discover_files(folder_path)
+            return discover_csv_files(folder_path)
+        elif file_paths:
+            self._validate_files(file_paths)
+            return list(file_paths)
+        else:
+            raise ValueError(
+                "Необходимо указать файлы или папку для загрузки данных")
+
+    def iter_data(self,
+                  file_paths: List[str] = None,
+                  folder_path: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Лениво читает данные из файлов или папки
+
+        Если загрузчик не поддерживает потоковое чтение,
+        итерирует по полностью загруженным данным.
+
+        Args:
+            file_paths: Список путей к файлам
+            folder_path: Путь к папке
+
+        Returns:
+            Итератор словарей с данными
+
+        Raises:
+            ValueError: Если не указаны файлы или папка
+        """
+        if not isinstance(self._data_loader, StreamingDataLoaderInterface):
+            return iter(self.load_data(file_paths, folder_path))
+
+        if folder_path:
+            return self._data_loader.iter_from_folder(folder_path)
+        elif file_paths:
+            self._validate_files(file_paths)
+            return self._data_loader.iter_from_files(file_paths)
+        else:
+            raise ValueError(
+                "Необходимо указать файлы или папку для загрузки данных")
+
     def _validate_files(self, file_paths: List[str]) -> None:
         """
         Валидирует существование файлов
@@ -61,6 +148,7 @@ class DataService:
                 raise FileNotFoundError(f"Файл не найден: {file_path}")
             if not path.is_file():
                 raise ValueError(f"Путь не является файлом: {file_path}")
-            if not file_path.lower().endswith('.csv'):
+            if not is_csv_file(file_path):
                 raise ValueError(
-                    f"Файл должен иметь расширение .csv: {file_path}")
+                    f"Файл должен иметь расширение .csv "
+                    f"(или .csv.gz, .csv.bz2, .csv.xz): {file_path}")
@@ -2,9 +2,14 @@
 Сервис для генерации отчетов
 """
 
-from typing import List, Dict, Any
+from itertools import chain
+from typing import List, Dict, Any, Iterable, Optional, Sequence
 
-from src.interfaces.report_generator import ReportGeneratorInterface
+from src.interfaces.report_generator import (
+    IncrementalReportGeneratorInterface, ReportGeneratorInterface,
+    StreamingReportGeneratorInterface)
+from src.employee_table import EmployeeData
+from src.sampling import SampleInfo
 
 
 class ReportService:
@@ -19,15 +24,40 @@ class ReportService:
         """
         self._report_generator = report_generator
 
+    def configure_generator(self, **options: Any) -> None:
+        """
+        Настраивает параметры генератора отчетов
+
+        Args:
+            **options: Параметры генерации (None - оставить по умолчанию)
+        """
+        self._report_generator.configure(**options)
+
+    def get_report_columns(
+            self,
+            report_type: str) -> Optional[Sequence[str]]:
+        """
+        Возвращает колонки, которые использует отчет
+
+        Args:
+            report_type: Тип отчета
+
+        Returns:
+            Колонки отчета или None, если нужны все колонки
+        """
+        return self._report_generator.get_report_columns(report_type)
+
     def generate_report(self,
                         report_type: str,
-                        data: List[Dict[str, Any]]) -> str:
+                        data: EmployeeData,
+                        sample: Optional[SampleInfo] = None) -> str:
         """
         Генерирует отчет указанного типа
 
         Args:
             report_type: Тип отчета
             data: Данные для анализа
+            sample: Описание выборки, если data - выборка строк
 
         Returns:
             Отформатированный отчет
@@ -38,4 +68,81 @@ class ReportService:
         if not data:
             raise ValueError("Нет данных для генерации отчета")
 
+        if sample is not None:
+            return self._report_generator.generate_sampled_report(
+                report_type, data, sample)
         return self._report_generator.generate_report(report_type, data)
+
+    def generate_report_stream(self,
+                               report_type: str,
+                               records: Iterable[Dict[str, Any]]) -> str:
+        """
+        Генерирует отчет по потоку записей без их накопления
+
+        Если генератор не поддерживает потоковую обработку,
+        поток материализуется в список.
+
+        Args:
+            report_type: Тип отчета
+            records: Поток записей для анализа
+
+        Returns:
+            Отформатированный отчет
+
+        Raises:
+            ValueError: Если поток пуст
+        """
+        iterator = iter(records)
+        first = next(iterator, None)
+        if first is None:
+            raise ValueError("Нет данных для генерации отчета")
+
+        records = chain((first,), iterator)
+        if not isinstance(self._report_generator,
+                          StreamingReportGeneratorInterface):
+            return self._report_generator.generate_report(
+                report_type, list(records))
+
+        return self._report_generator.generate_report_stream(
+            report_type, records)
+
+    def aggregate(self, report_type: str, data: EmployeeData) -> Any:
+        """
+        Сворачивает данные одной части (файла) для render_aggregates()
+
+        Если генератор не поддерживает агрегаты частей, часть
+        хранится как список записей.
+
+        Args:
+            report_type: Тип отчета
+            data: Данные части
+
+        Returns:
+            Агрегаты части
+        """
+        if not isinstance(self._report_generator,
+                          IncrementalReportGeneratorInterface):
+            return list(data)
+        return self._report_generator.aggregate(report_type, data)
+
+    def render_aggregates(self,
+                          report_type: str,
+                          parts: Sequence[Any]) -> str:
+        """
+        Генерирует отчет по агрегатам частей в переданном порядке
+
+        Если генератор не поддерживает агрегаты частей, отчет строится
+        по объединенным записям частей.
+
+        Args:
+            report_type: Тип отчета
+            parts: Агрегаты, возвращенные aggregate()
+
+        Returns:
+            Отформатированный отчет
+        """
+        if not isinstance(self._report_generator,
+                          IncrementalReportGeneratorInterface):
+            return self._report_generator.generate_report(
+                report_type, list(chain.from_iterable(parts)))
+        return self._report_generator.render_aggregates(report_type, parts)
@@ -0,0 +1,128 @@
+"""
+Сброс частичных агрегатов отчетов во временные файлы
+"""
+import heapq
+import os
+import pickle
+import shutil
+import tempfile
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Группа агрегатов: ключ (позиция, навык) и словарь агрегатов
+Group = Tuple[str, Dict[str, Any]]
+
+# Добавляет к агрегатам группы агрегаты той же группы из более поздней
+# части данных
+Combine = Callable[[Dict[str, Any], Dict[str, Any]], None]
+
+
+class SpillRuns:
+    """
+    Частичные агрегаты, сброшенные на диск сериями
+
+    Каждая серия (run) - временный файл с группами, отсортированными
+    по ключу. При чтении серии и группы в памяти сливаются по ключу
+    (heapq.merge), а группы с одинаковым ключом объединяются в порядке
+    сброса, поэтому одновременно в памяти находится одна группа
+    из каждой серии. Когда серий становится больше MAX_RUNS, они
+    заранее сливаются в одну, чтобы не держать открытыми много файлов.
+    """
+
+    # Сколько серий сливается за один проход
+    MAX_RUNS = 64
+
+    def __init__(self, combine: Combine, directory: Optional[str] = None):
+        """
+        Инициализация
+
+        Args:
+            combine: Функция объединения агрегатов одной группы
+            directory: Папка для временных файлов (None - системная)
+        """
+        self._combine = combine
+        self._parent = directory
+        self._directory: Optional[str] = None
+        self._paths: List[str] = []
+        self._written = 0
+
+    def __len__(self) -> int:
+        """Количество серий на диске"""
+        return len(self._paths)
+
+    def write(self, groups: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Сбрасывает группы на диск новой серией
+
+        Args:
+            groups: Группы по ключам; после записи словарь можно очистить
+        """
+        self._paths.append(self._write_run(
+            sorted(groups.items(), key=itemgetter(0))))
+        if len(self._paths) > self.MAX_RUNS:
+            paths, self._paths = self._paths, []
+            self._paths.append(self._write_run(self._merge_runs(paths)))
+            for path in paths:
+                os.remove(path)
+
+    def merge(self, groups: Dict[str, Dict[str, Any]]) -> Iterator[Group]:
+        """
+        Объединяет серии на диске с группами в памяти
+
+        Args:
+            groups: Группы, накопленные после последнего сброса
+
+        Yields:
+            Группы в порядке ключей с объединенными агрегатами
+        """
+        return self._merge_runs(
+            self._paths, iter(sorted(groups.items(), key=itemgetter(0))))
+
+    def close(self) -> None:
+        """Удаляет временные файлы"""
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+        self._directory = None
+        self._paths = []
+
+    def _merge_runs(self,
+                    paths: List[str],
+                    *tail: Iterator[Group]) -> Iterator[Group]:
+        """Сливает серии по ключу, объединяя группы с одинаковым ключом"""
+        # heapq.merge устойчив: при равных ключах группы идут в порядке
+        # источников, то есть в порядке сброса
+        sources = [self._read_run(path) for path in paths]
+        sources.extend(tail)
+        key: Optional[str] = None
+        current: Optional[Dict[str, Any]] = None
+        for group_key, stats in heapq.merge(*sources, key=itemgetter(0)):
+            if current is not None and group_key == key:
+                self._combine(current, stats)
+                continue
+            if current is not None:
+                yield key, current
+            key, current = group_key, stats
+        if current is not None:
+            yield key, current
+
+    def _write_run(self, groups: Iterator[Group]) -> str:
+        """Записывает группы во временный файл"""
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(
+                prefix='csv_report_spill_', dir=self._parent)
+        path = os.path.join(self._directory, f"run_{self._written}.pickle")
+        self._written += 1
+        with open(path, 'wb') as f:
+            for group in groups:
+                pickle.dump(group, f, pickle.HIGHEST_PROTOCOL)
+        return path
+
+    @staticmethod
+    def _read_run(path: str) -> Iterator[Group]:
+        """Читает группы серии по одной"""
+        with open(path, 'rb') as f:
+            while True:
+                try:
+                    yield pickle.load(f)
+                except EOFError:
+                    return
@@ -0,0 +1,98 @@
+"""
+Модуль для разбиения CSV файлов на диапазоны байтов
+"""
+import os
+import re
+from typing import BinaryIO, List, Tuple
+
+# Размер блока для поиска конца записи
+_SCAN_BLOCK_SIZE = 64 * 1024
+# Кавычка или перевод строки - единственные байты, влияющие на границы
+_RECORD_DELIMITERS = re.compile(rb'["\n]')
+
+
+def split_record_ranges(
+    file_path: str,
+    chunk_size: int
+) -> Tuple[int, List[Tuple[int, int]]]:
+    """
+    Разбивает CSV файл на диапазоны байтов по границам записей.
+
+    Граница выбирается на первом переводе строки после целевого смещения,
+    который находится вне кавычек, поэтому многострочные значения
+    в кавычках (например, колонка skills) не разрываются. Четность
+    кавычек до целевого смещения считается по блокам без разбора CSV.
+
+    Args:
+        file_path:
+        Путь к CSV файлу
+
+        chunk_size:
+        Желаемый размер диапазона в байтах
+
+    Returns:
+        Конец строки заголовка и список диапазонов (start, end) с данными
+
+    Raises:
+        ValueError: Если размер диапазона не положительный
+    """
+    if chunk_size < 1:
+        raise ValueError("Размер диапазона должен быть положительным")
+
+    size = os.path.getsize(file_path)
+    ranges: List[Tuple[int, int]] = []
+
+    with open(file_path, 'rb') as file:
+        header_end = _find_record_end(file, 0, False, size)
+        start = header_end
+
+        while start < size:
+            target = start + chunk_size
+            if target >= size:
+                ranges.append((start, size))
+                break
+
+            # Начало диапазона - граница записи, т.е. вне кавычек
+            file.seek(start)
+            in_quotes = file.read(target - start).count(b'"') % 2 == 1
+
+            end = _find_record_end(file, target, in_quotes, size)
+            ranges.append((start, end))
+            start = end
+
+    return header_end, ranges
+
+
+def _find_record_end(
+    file: BinaryIO,
+    position: int,
+    in_quotes: bool,
+    size: int
+) -> int:
+    """
+    Находит смещение сразу после ближайшего конца записи
+
+    Args:
+        file: Файл, открытый в бинарном режиме
+        position: Смещение, с которого начинается поиск
+        in_quotes: Находится ли position внутри значения в кавычках
+        size: Размер файла
+
+    Returns:
+        Смещение начала следующей записи (или размер файла)
+    """
+    file.seek(position)
+    while position < size:
+        block = file.read(_SCAN_BLOCK_SIZE)
+        if not block:
+            break
+
+        for match in _RECORD_DELIMITERS.finditer(block):
+            if match.group() == b'"':
+                in_quotes = not in_quotes
+            elif not in_quotes:
+                return position + match.end()
+
+        position += len(block)
+
+    return size
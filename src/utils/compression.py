@@ -0,0 +1,151 @@
+"""
+Модуль для чтения сжатых CSV файлов
+"""
+import bz2
+import gzip
+import io
+import lzma
+import queue
+import threading
+from typing import BinaryIO, Callable, Dict, Optional, TextIO
+
+# Функции открытия сжатых файлов по расширению
+_OPENERS: Dict[str, Callable[[str], BinaryIO]] = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open,
+}
+
+# Расширения, которые считаются CSV файлами (регистронезависимо)
+CSV_SUFFIXES = ('.csv',) + tuple('.csv' + suffix for suffix in _OPENERS)
+
+# Размер блока распакованных данных, передаваемого между потоками
+_BLOCK_SIZE = 256 * 1024
+# Сколько распакованных блоков может ждать разбора
+_QUEUE_BLOCKS = 8
+
+
+def is_csv_file(file_name: str) -> bool:
+    """
+    Проверяет, что имя файла - CSV файл (возможно, сжатый)
+
+    Args:
+        file_name: Имя или путь файла
+
+    Returns:
+        True для .csv, .csv.gz, .csv.bz2 и .csv.xz
+    """
+    return file_name.lower().endswith(CSV_SUFFIXES)
+
+
+def compression_of(file_path: str) -> Optional[str]:
+    """
+    Определяет сжатие файла по расширению
+
+    Args:
+        file_path: Путь к файлу
+
+    Returns:
+        Расширение сжатия ('.gz', '.bz2', '.xz') или None
+    """
+    lower = file_path.lower()
+    for suffix in _OPENERS:
+        if lower.endswith(suffix):
+            return suffix
+    return None
+
+
+def open_csv_text(file_path: str, threaded: bool = True) -> TextIO:
+    """
+    Открывает CSV файл для чтения текста, распаковывая сжатые файлы
+
+    Сжатый файл распаковывается потоково, без временных файлов.
+    С threaded=True распаковка идет в отдельном потоке и перекрывается
+    с разбором строк: gzip, bz2 и lzma освобождают GIL на время
+    распаковки блока.
+
+    Args:
+        file_path: Путь к файлу (.csv или .csv.gz/.csv.bz2/.csv.xz)
+        threaded: Распаковывать в отдельном потоке
+
+    Returns:
+        Текстовый файл в кодировке UTF-8
+    """
+    compression = compression_of(file_path)
+    if compression is None:
+        return open(file_path, 'r', encoding='utf-8')
+
+    raw = _OPENERS[compression](file_path, 'rb')
+    if threaded:
+        raw = io.BufferedReader(
+            _ThreadedReader(raw), buffer_size=_BLOCK_SIZE)
+    return io.TextIOWrapper(raw, encoding='utf-8')
+
+
+class _ThreadedReader(io.RawIOBase):
+    """
+    Поток байтов, который читается из файла в фоновом потоке
+
+    Фоновый поток читает блоки из исходного файла в ограниченную
+    очередь, поэтому опережает разбор не больше чем на _QUEUE_BLOCKS
+    блоков. Ошибка чтения передается читающему потоку.
+    """
+
+    def __init__(self, source: BinaryIO):
+        super().__init__()
+        self._source = source
+        self._blocks: 'queue.Queue' = queue.Queue(maxsize=_QUEUE_BLOCKS)
+        self._stopped = threading.Event()
+        self._pending = memoryview(b'')
+        self._finished = False
+        self._thread = threading.Thread(
+            target=self._produce, name='csv-decompress', daemon=True)
+        self._thread.start()
+
+    def _produce(self) -> None:
+        """Читает блоки исходного файла в очередь"""
+        try:
+            while not self._stopped.is_set():
+                block = self._source.read(_BLOCK_SIZE)
+                if not block:
+                    break
+                self._put(block)
+        except Exception as e:
+            self._put(e)
+        finally:
+            self._put(None)
+
+    def _put(self, item) -> None:
+        """Кладет элемент в очередь, пока чтение не остановлено"""
+        while not self._stopped.is_set():
+            try:
+                self._blocks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending and not self._finished:
+            item = self._blocks.get()
+            if item is None:
+                self._finished = True
+            elif isinstance(item, Exception):
+                self._finished = True
+                raise item
+            else:
+                self._pending = memoryview(item)
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stopped.set()
+            self._thread.join()
+            self._source.close()
+        super().close()
@@ -0,0 +1,176 @@
+"""
+Манифест папок для повторного поиска CSV файлов без обхода
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Содержимое папки: найденные CSV файлы (путь, размер) и подпапки
+FolderListing = Tuple[List[Tuple[str, int]], List[str]]
+
+
+class DirectoryManifest:
+    """
+    Сохраненные результаты чтения папок при поиске CSV файлов
+
+    Для каждой прочитанной папки хранится время ее изменения
+    (st_mtime_ns), найденные CSV файлы с размерами и подпапки.
+    Время изменения папки меняется при добавлении, удалении
+    и переименовании записей в ней, поэтому папка с тем же временем
+    изменения не читается повторно: ее содержимое берется из
+    манифеста, а проверка стоит один stat вместо чтения папки и stat
+    каждого файла. Размеры файлов, перезаписанных на месте, берутся
+    из манифеста и могут быть устаревшими; список путей - нет.
+
+    Папки, измененные незадолго до обхода (RACY_WINDOW_NS), в манифест
+    не попадают: изменение в пределах точности времени изменения
+    иначе можно пропустить.
+
+    Ключ манифеста - хэш от абсолютного пути корня обхода, шаблонов
+    отбора и пользователя: с другими шаблонами используется другой
+    манифест. Сохраняются только папки, прочитанные при последнем
+    обходе, поэтому удаленные папки из манифеста исчезают.
+    """
+
+    # Версия формата: меняется при несовместимых изменениях
+    FORMAT_VERSION = 1
+
+    SUFFIX = '.manifest'
+
+    # Папки, измененные позже чем за это время до начала обхода,
+    # не сохраняются
+    RACY_WINDOW_NS = 2 * 10 ** 9
+
+    def __init__(self,
+                 directory: str,
+                 root: str,
+                 include: Sequence[str] = (),
+                 exclude: Sequence[str] = (),
+                 rescan: bool = False):
+        """
+        Инициализация и загрузка манифеста
+
+        Args:
+            directory: Папка для файлов манифестов (создается при
+                сохранении)
+            root: Корень обхода
+            include: Шаблоны включаемых файлов
+            exclude: Шаблоны исключаемых файлов и папок
+            rescan: Не использовать сохраненные результаты (они
+                заменяются результатами нового обхода)
+        """
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        source = '\n'.join((
+            str(self.FORMAT_VERSION),
+            os.path.abspath(root),
+            '\0'.join(include),
+            '\0'.join(exclude),
+            str(os.geteuid() if os.name != 'nt' else ''),
+        ))
+        self.path = os.path.join(
+            directory,
+            hashlib.sha256(source.encode('utf-8')).hexdigest() + self.SUFFIX)
+        self._started = time.time_ns()
+        self._folders: Dict[str, List[Any]] = {} if rescan else self._load()
+        self._visited: Dict[str, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, folder_path: str) -> Tuple[Optional[int],
+                                                Optional[FolderListing]]:
+        """
+        Ищет содержимое папки в манифесте
+
+        Args:
+            folder_path: Путь к папке
+
+        Returns:
+            Время изменения папки (None, если stat не удался) и ее
+            содержимое из манифеста или None, если папку нужно прочитать
+        """
+        try:
+            mtime = os.stat(folder_path).st_mtime_ns
+        except OSError:
+            return None, None
+        saved = self._folders.get(folder_path)
+        if saved is None or saved[0] != mtime:
+            with self._lock:
+                self.misses += 1
+            return mtime, None
+        with self._lock:
+            self.hits += 1
+            self._visited[folder_path] = saved
+        _, files, subfolders = saved
+        return mtime, (
+            [(os.path.join(folder_path, name), size) for name, size in files],
+            [os.path.join(folder_path, name) for name in subfolders])
+
+    def store(self,
+              folder_path: str,
+              mtime: Optional[int],
+              listing: FolderListing) -> None:
+        """
+        Запоминает прочитанное содержимое папки
+
+        Args:
+            folder_path: Путь к папке
+            mtime: Время изменения папки до чтения
+            listing: Найденные файлы и подпапки
+        """
+        if mtime is None or mtime >= self._started - self.RACY_WINDOW_NS:
+            return
+        files, subfolders = listing
+        saved = [
+            mtime,
+            [[os.path.basename(path), size] for path, size in files],
+            [os.path.basename(path) for path in subfolders],
+        ]
+        with self._lock:
+            self._visited[folder_path] = saved
+
+    def save(self) -> None:
+        """
+        Сохраняет папки, прочитанные при этом обходе
+
+        Манифест пишется во временный файл и атомарно
+        переименовывается. Ошибки записи не прерывают поиск.
+        """
+        with self._lock:
+            folders = dict(self._visited)
+        payload = json.dumps({
+            'version': self.FORMAT_VERSION,
+            'folders': folders,
+        }, separators=(',', ':')).encode('utf-8')
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    file.write(payload)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                raise
+        except OSError:
+            return
+
+    def _load(self) -> Dict[str, List[Any]]:
+        """Читает сохраненный манифест (пустой при ошибке)"""
+        try:
+            with open(self.path, 'rb') as file:
+                saved = json.loads(file.read().decode('utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(saved, dict) or (
+                saved.get('version') != self.FORMAT_VERSION):
+            return {}
+        return saved.get('folders', {})
@@ -0,0 +1,60 @@
+"""
+Отслеживание изменений файлов опросом
+"""
+import os
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+# Размер и время изменения файла
+FileStamp = Tuple[int, int]
+
+
+class FileChanges(NamedTuple):
+    """Изменения набора файлов с прошлого опроса (пути отсортированы)"""
+
+    added: List[str]
+    changed: List[str]
+    removed: List[str]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+class FileWatcher:
+    """
+    Отслеживает изменения файлов по размеру и времени изменения
+
+    Каждый опрос выполняет один stat на файл и сравнивает результат
+    с прошлым опросом; содержимое файлов не читается. Файл, stat
+    которого не удался, считается удаленным.
+    """
+
+    def __init__(self):
+        self._stamps: Dict[str, FileStamp] = {}
+
+    def poll(self, file_paths: Iterable[str]) -> FileChanges:
+        """
+        Сравнивает текущие файлы с прошлым опросом
+
+        Args:
+            file_paths: Файлы, которые отслеживаются сейчас
+
+        Returns:
+            Добавленные, измененные и удаленные файлы
+        """
+        stamps: Dict[str, FileStamp] = {}
+        for path in file_paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            stamps[path] = (stat.st_size, stat.st_mtime_ns)
+
+        previous = self._stamps
+        self._stamps = stamps
+        return FileChanges(
+            added=sorted(path for path in stamps if path not in previous),
+            changed=sorted(
+                path for path, stamp in stamps.items()
+                if path in previous and previous[path] != stamp),
+            removed=sorted(path for path in previous if path not in stamps))
+
@@ -0,0 +1,18 @@
+"""
+Общие фикстуры тестов
+"""
+import pytest
+
+from src.config import config
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Папка кэша во временной папке теста, а не в рабочей копии"""
+    path = str(tmp_path / 'csv_cache')
+    get = config.get
+    monkeypatch.setattr(
+        config, 'get',
+        lambda key, default=None: path if key == 'CACHE_DIR'
+        else get(key, default))
+    return path
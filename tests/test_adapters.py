@@ -146,8 +146,7 @@ Another User,Designer,20,3.8,"Figma, Sketch",Design Team,2
         with patch('src.adapters.csv_processor_adapter.CSVProcessor') as mock_processor_class:
             mock_processor = mock_processor_class.return_value
             mock_processor.load_data.return_value = [{'test': 'data'}]
-            mock_processor.discover_and_validate_files.return_value = [
-                'file1.csv', 'file2.csv']
+            mock_processor.load_folder.return_value = [{'test': 'data'}]
 
             adapter = CSVProcessorAdapter()
 
@@ -163,10 +162,8 @@ Another User,Designer,20,3.8,"Figma, Sketch",Design Team,2
             # Тест load_from_folder
             result = adapter.load_from_folder('/test/folder')
             assert result == [{'test': 'data'}]
-            mock_processor.discover_and_validate_files.assert_called_once_with(
+            mock_processor.load_folder.assert_called_once_with(
                 '/test/folder')
-            mock_processor.load_data.assert_called_once_with(
-                ['file1.csv', 'file2.csv'])
 
     def test_adapter_preserves_csv_processor_behavior(self):
         """Тест сохранения поведения CSVProcessor в адаптере"""
@@ -0,0 +1,100 @@
+"""
+Тесты для разбиения CSV файлов на диапазоны байтов
+"""
+import csv
+import io
+import os
+import tempfile
+
+import pytest
+
+from src.utils.chunking import split_record_ranges
+
+
+HEADER = "name,position,completed_tasks,performance,skills,team,experience_years\n"
+
+
+def _write(content: str) -> str:
+    with tempfile.NamedTemporaryFile(
+        mode='w',
+        suffix='.csv',
+        delete=False,
+        encoding='utf-8',
+        newline=''
+    ) as f:
+        f.write(content)
+        return f.name
+
+
+class TestSplitRecordRanges:
+    """Тесты для функции split_record_ranges"""
+
+    def test_ranges_cover_file_after_header(self):
+        """Тест непрерывного покрытия файла диапазонами"""
+        rows = ''.join(
+            f'User{i},Dev,{i},4.5,"Python, Go",Team,{i}\n' for i in range(50))
+        path = _write(HEADER + rows)
+
+        try:
+            header_end, ranges = split_record_ranges(path, 100)
+
+            assert header_end == len(HEADER.encode('utf-8'))
+            assert ranges[0][0] == header_end
+            assert ranges[-1][1] == os.path.getsize(path)
+            assert len(ranges) > 1
+            for (_, end), (start, _) in zip(ranges, ranges[1:]):
+                assert end == start
+        finally:
+            os.unlink(path)
+
+    def test_quoted_newlines_are_not_split(self):
+        """Тест: переводы строк внутри кавычек не становятся границами"""
+        rows = ''.join(
+            f'User{i},Dev,{i},4.5,"Python,\nDjango,\n""Go""",Team,{i}\n'
+            for i in range(30))
+        path = _write(HEADER + rows)
+
+        try:
+            header_end, ranges = split_record_ranges(path, 16)
+
+            with open(path, 'rb') as f:
+                content = f.read()
+
+            total = 0
+            for start, end in ranges:
+                chunk = content[start:end].decode('utf-8')
+                records = list(csv.reader(io.StringIO(chunk)))
+                # Каждый диапазон содержит только целые записи
+                assert all(len(record) == 7 for record in records)
+                total += len(records)
+
+            assert total == 30
+        finally:
+            os.unlink(path)
+
+    def test_file_without_trailing_newline(self):
+        """Тест файла без перевода строки в конце"""
+        path = _write(HEADER + 'User,Dev,1,4.5,"Python",Team,1')
+
+        try:
+            _, ranges = split_record_ranges(path, 4)
+            assert ranges == [
+                (len(HEADER), os.path.getsize(path))]
+        finally:
+            os.unlink(path)
+
+    def test_header_only_file(self):
+        """Тест файла только с заголовком"""
+        path = _write(HEADER)
+
+        try:
+            header_end, ranges = split_record_ranges(path, 10)
+            assert header_end == len(HEADER)
+            assert ranges == []
+        finally:
+            os.unlink(path)
+
+    def test_invalid_chunk_size(self):
+        """Тест недопустимого размера диапазона"""
+        with pytest.raises(ValueError, match="должен быть положительным"):
+            split_record_ranges('unused.csv', 0)
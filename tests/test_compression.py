@@ -0,0 +1,117 @@
+"""
+Тесты для чтения сжатых CSV файлов
+"""
+import bz2
+import gzip
+import lzma
+import os
+import tempfile
+
+import pytest
+
+from src.csv_processor import CSVProcessor
+from src.utils.compression import (
+    compression_of, is_csv_file, open_csv_text)
+from src.utils.discover import discover_csv_files
+
+HEADER = ("name,position,completed_tasks,performance,"
+          "skills,team,experience_years\n")
+
+ROWS = ''.join(
+    f'User{i},Developer,{i},4.5,"Python,\nGo",Команда {i % 3},{i}\n'
+    for i in range(2000))
+
+OPENERS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+
+def write_compressed(folder, suffix, content=HEADER + ROWS):
+    path = os.path.join(folder, 'employees.csv' + suffix)
+    with OPENERS[suffix](path, 'wt', encoding='utf-8') as f:
+        f.write(content)
+    return path
+
+
+class TestCompression:
+    """Тесты для функций модуля compression"""
+
+    def test_is_csv_file(self):
+        """Тест распознавания сжатых CSV файлов"""
+        assert is_csv_file('data.csv')
+        assert is_csv_file('DATA.CSV.GZ')
+        assert is_csv_file('data.csv.bz2')
+        assert is_csv_file('data.csv.xz')
+        assert not is_csv_file('data.gz')
+        assert not is_csv_file('data.csv.zip')
+
+    def test_compression_of(self):
+        """Тест определения сжатия по расширению"""
+        assert compression_of('data.csv') is None
+        assert compression_of('data.csv.GZ') == '.gz'
+        assert compression_of('data.csv.xz') == '.xz'
+
+    @pytest.mark.parametrize('suffix', ['.gz', '.bz2', '.xz'])
+    @pytest.mark.parametrize('threaded', [True, False])
+    def test_open_csv_text(self, suffix, threaded):
+        """Тест потоковой распаковки"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = write_compressed(temp_dir, suffix)
+            with open_csv_text(path, threaded=threaded) as f:
+                assert f.read() == HEADER + ROWS
+
+    def test_corrupted_file_error(self):
+        """Тест передачи ошибки распаковки из фонового потока"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'broken.csv.gz')
+            with open(path, 'wb') as f:
+                f.write(b'not a gzip file')
+
+            with pytest.raises(OSError):
+                with open_csv_text(path) as f:
+                    f.read()
+
+    def test_close_before_end(self):
+        """Тест закрытия файла до окончания чтения"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = write_compressed(temp_dir, '.gz', HEADER + ROWS * 20)
+            with open_csv_text(path) as f:
+                assert f.readline() == HEADER
+
+
+class TestCompressedLoading:
+    """Тесты загрузки сжатых файлов через CSVProcessor"""
+
+    @pytest.mark.parametrize('suffix', ['.gz', '.bz2', '.xz'])
+    def test_load_matches_uncompressed(self, suffix):
+        """Тест совпадения данных сжатого и несжатого файла"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            plain = os.path.join(temp_dir, 'plain.csv')
+            with open(plain, 'w', encoding='utf-8') as f:
+                f.write(HEADER + ROWS)
+            path = write_compressed(temp_dir, suffix)
+
+            expected = CSVProcessor(cache_enabled=False).load_data([plain])
+            processor = CSVProcessor(
+                workers=2, chunk_size=1024, cache_enabled=False)
+            assert processor.load_data([path, plain]) == expected * 2
+
+    def test_error_row_number(self):
+        """Тест номера строки ошибки в сжатом файле"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = write_compressed(
+                temp_dir, '.gz',
+                HEADER + ROWS + 'Bad,Developer,1,9.5,Python,Team,1\n')
+
+            with pytest.raises(ValueError, match="Ошибка в строке 2002"):
+                CSVProcessor(cache_enabled=False).load_data([path])
+
+    def test_discover_compressed_files(self):
+        """Тест обнаружения сжатых файлов в папке"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for suffix in OPENERS:
+                write_compressed(temp_dir, suffix)
+            open(os.path.join(temp_dir, 'archive.gz'), 'wb').close()
+
+            names = [os.path.basename(path)
+                     for path in discover_csv_files(temp_dir)]
+            assert names == [
+                'employees.csv.bz2', 'employees.csv.gz', 'employees.csv.xz']
@@ -1,11 +1,16 @@
 """
 Тесты для CSVProcessor
 """
+import csv
+import gzip
+import json
 import pytest
 import tempfile
+import threading
 import os
 
 from src.csv_processor import CSVProcessor
+from src.sampling import Deadline
 from src.config import config
 
 
@@ -286,3 +291,1140 @@ Test User,Developer,10,4.5,"Python",Test Team,2
             assert txt_file not in result
             assert pdf_file not in result
             assert xlsx_file not in result
+
+    def test_discover_and_validate_files_patterns(self, monkeypatch):
+        """Тест шаблонов и глубины поиска файлов"""
+        processor = CSVProcessor(
+            exclude_patterns=['archive'], include_patterns=['*.csv'])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = [os.path.join(temp_dir, *parts) for parts in (
+                ('data.csv',), ('archive', 'old.csv'),
+                ('2024', 'new.csv'), ('2024', 'q1', 'deep.csv'),
+                ('2024', 'packed.csv.gz'))]
+            for path in paths:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                open(path, 'w').close()
+
+            monkeypatch.setattr(
+                'src.utils.discover.config.get',
+                lambda key, default=None: key == 'INCLUDE_SUBFOLDERS'
+                or default)
+            result = processor.discover_and_validate_files(temp_dir)
+            processor.configure(max_depth=2)
+            shallow = processor.discover_and_validate_files(temp_dir)
+
+            assert result == [paths[2], paths[3], paths[0]]
+            assert shallow == [paths[2], paths[0]]
+
+    def test_invalid_max_depth(self):
+        """Тест отрицательной глубины поиска"""
+        with pytest.raises(ValueError, match="Глубина обхода"):
+            CSVProcessor(max_depth=-1)
+
+    def test_discovery_threads(self, monkeypatch):
+        """Тест передачи потоков обхода в поиск файлов"""
+        calls = []
+        monkeypatch.setattr(
+            'src.csv_processor.discover_csv_files',
+            lambda folder, **options: calls.append(options) or ['a.csv'])
+        processor = CSVProcessor(discovery_threads=4)
+
+        assert processor.discover_and_validate_files('data') == ['a.csv']
+        assert calls[0]['threads'] == 4
+        with pytest.raises(ValueError, match="потоков"):
+            processor.configure(discovery_threads=0)
+
+    def test_iter_records_matches_load_data(self):
+        """Тест совпадения потокового чтения с полной загрузкой"""
+        processor = CSVProcessor()
+
+        demo_file = config.get('demo_data_file')
+        test_file = config.get('test_data_file')
+
+        records = processor.iter_records([demo_file, test_file])
+
+        # Генератор не читает файлы до начала итерации
+        assert not isinstance(records, list)
+        assert list(records) == processor.load_data([demo_file, test_file])
+
+    def test_iter_records_is_lazy(self):
+        """Тест ленивого чтения: ошибка возникает только при итерации"""
+        processor = CSVProcessor()
+
+        csv_content = """name,position,completed_tasks,performance,skills,team,experience_years
+Good User,Developer,10,4.5,"Python",Team,2
+Bad User,Developer,10,invalid,"Python",Team,2
+"""
+
+        with tempfile.NamedTemporaryFile(
+            mode='w',
+            suffix='.csv',
+            delete=False
+        ) as f:
+            f.write(csv_content)
+            temp_file = f.name
+
+        try:
+            records = processor.iter_records([temp_file])
+            first = next(records)
+            assert first['name'] == 'Good User'
+
+            with pytest.raises(ValueError, match="Ошибка в строке 3"):
+                next(records)
+        finally:
+            os.unlink(temp_file)
+
+
+class TestCSVProcessorParallel:
+    """Тесты параллельной загрузки файлов"""
+
+    HEADER = ("name,position,completed_tasks,performance,"
+              "skills,team,experience_years\n")
+
+    def _write_files(self, folder, rows_per_file):
+        paths = []
+        for index, rows in enumerate(rows_per_file):
+            path = os.path.join(folder, f"part_{index}.csv")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(self.HEADER)
+                f.write(''.join(rows))
+            paths.append(path)
+        return paths
+
+    def test_parallel_matches_sequential_order(self):
+        """Тест сохранения порядка файлов при параллельной загрузке"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = self._write_files(temp_dir, [
+                [f'User{i}_{j},Developer,{j},4.{j},"Python",Team,{j}\n'
+                 for j in range(5)]
+                for i in range(4)
+            ])
+
+            sequential = CSVProcessor(workers=1).load_data(paths)
+            processor = CSVProcessor(workers=3)
+            parallel = processor.load_data(paths)
+
+            assert parallel == sequential
+            assert processor.data == sequential
+            assert parallel[0]['name'] == 'User0_0'
+            assert parallel[-1]['name'] == 'User3_4'
+
+    def test_parallel_reports_first_failed_file(self):
+        """Тест сообщения об ошибке первого по порядку файла"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = self._write_files(temp_dir, [
+                ['Good,Developer,1,4.5,"Python",Team,1\n'],
+                ['Good,Developer,1,4.5,"Python",Team,1\n',
+                 'Bad,Developer,1,9.5,"Python",Team,1\n'],
+                ['Bad,Developer,x,4.5,"Python",Team,1\n'],
+            ])
+
+            processor = CSVProcessor(workers=2)
+            with pytest.raises(ValueError) as exc_info:
+                processor.load_data(paths)
+
+            message = str(exc_info.value)
+            assert f"Ошибка в строке 3 файла {paths[1]}" in message
+            assert "performance должно быть в диапазоне" in message
+
+    def test_parallel_file_not_found(self):
+        """Тест отсутствующего файла при параллельной загрузке"""
+        processor = CSVProcessor(workers=2)
+
+        with pytest.raises(FileNotFoundError, match="Файл не найден"):
+            processor.load_data([
+                config.get('test_data_file'), 'nonexistent_file.csv'])
+
+    def test_invalid_workers(self):
+        """Тест недопустимого количества процессов"""
+        with pytest.raises(ValueError, match="должно быть положительным"):
+            CSVProcessor(workers=0)
+
+    def test_chunked_matches_sequential(self):
+        """Тест совпадения разбора по диапазонам с обычным разбором"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = self._write_files(temp_dir, [
+                [f'User{j},Developer,{j},4.{j % 10},'
+                 f'"Python,\nDjango",Team,{j}\n' for j in range(40)],
+                ['Small,Developer,1,4.5,"Go",Team,1\n'],
+            ])
+
+            sequential = CSVProcessor(workers=1).load_data(paths)
+            chunked = CSVProcessor(workers=2, chunk_size=128).load_data(paths)
+
+            assert chunked == sequential
+            assert len(chunked) == 41
+            assert chunked[0]['skills'] == 'Python,\nDjango'
+
+    def test_chunked_error_row_number(self):
+        """Тест номера строки ошибки в одном из последних диапазонов"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            rows = [f'User{j},Developer,{j},4.5,"Python,\nGo",Team,{j}\n'
+                    for j in range(40)]
+            rows[33] = 'Broken,Developer,1,4.5,"Python",Team,-\n'
+            paths = self._write_files(temp_dir, [rows])
+
+            processor = CSVProcessor(workers=2, chunk_size=100)
+            with pytest.raises(ValueError) as exc_info:
+                processor.load_data(paths)
+
+            assert str(exc_info.value).startswith(
+                f"Ошибка в строке 35 файла {paths[0]}: "
+                f"Некорректное значение experience_years")
+
+    def test_chunked_invalid_header(self):
+        """Тест проверки заголовка файла, разбираемого по диапазонам"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'bad.csv')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("name,position\n" + "User,Developer\n" * 20)
+
+            processor = CSVProcessor(workers=2, chunk_size=32)
+            with pytest.raises(ValueError, match="некорректные колонки"):
+                processor.load_data([path])
+
+
+class TestCSVProcessorNumericBackend:
+    """Тесты пакетной проверки числовых колонок"""
+
+    HEADER = TestCSVProcessorParallel.HEADER
+
+    def _write_file(self, folder, rows):
+        path = os.path.join(folder, 'employees.csv')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.HEADER)
+            f.write(''.join(rows))
+        return path
+
+    @pytest.mark.parametrize('record_format', ['dict', 'employee', 'table'])
+    def test_numpy_backend_matches_python(self, record_format):
+        """Тест совпадения результатов с построчной проверкой"""
+        files = [config.get('demo_data_file'), config.get('test_data_file')]
+
+        expected = CSVProcessor(
+            record_format=record_format,
+            numeric_backend='python').load_data(files)
+        processor = CSVProcessor(
+            record_format=record_format, numeric_backend='numpy')
+        processor.BATCH_SIZE = 3
+
+        assert list(processor.load_data(files)) == list(expected)
+
+    @pytest.mark.parametrize('numeric_backend', ['python', 'numpy'])
+    def test_error_row_number_in_later_batch(self, numeric_backend):
+        """Тест номера строки первой ошибки за пределами первого пакета"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            rows = [f'User{j},Developer,{j},4.5,Python,Team,{j}\n'
+                    for j in range(20)]
+            rows[14] = 'Late,Developer,1,4.5,Python,Team,-1\n'
+            rows[11] = 'Early,Developer,1,7.5,Python,Team,1\n'
+            rows[17] = 'Broken,Developer,x,4.5,Python,Team,1\n'
+            path = self._write_file(temp_dir, rows)
+
+            processor = CSVProcessor(numeric_backend=numeric_backend)
+            processor.BATCH_SIZE = 4
+            with pytest.raises(ValueError) as exc_info:
+                processor.load_data([path])
+
+            assert str(exc_info.value) == (
+                f"Ошибка в строке 13 файла {path}: "
+                f"Некорректное значение performance: "
+                f"performance должно быть в диапазоне от 0.0 до 5.0")
+
+    def test_invalid_numeric_backend(self):
+        """Тест неподдерживаемого способа проверки чисел"""
+        with pytest.raises(ValueError, match="Неподдерживаемый способ"):
+            CSVProcessor(numeric_backend='fortran')
+
+
+class TestCSVProcessorOnError:
+    """Тесты загрузки с пропуском некорректных строк"""
+
+    HEADER = TestCSVProcessorParallel.HEADER
+
+    ROWS = [f'User{j},Developer,{j},4.5,"Python",Team,{j}\n'
+            for j in range(12)]
+    ROWS[3] = 'Bad,Developer,1,9.5,"Python",Team,1\n'
+    ROWS[8] = 'Broken,Developer,x,4.5,"Python",Team,1\n'
+
+    def _write_file(self, folder, rows):
+        path = os.path.join(folder, 'employees.csv')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.HEADER)
+            f.write(''.join(rows))
+        return path
+
+    @pytest.mark.parametrize('options', [
+        {},
+        {'numeric_backend': 'numpy'},
+        {'workers': 2},
+        {'workers': 2, 'chunk_size': 64},
+    ])
+    def test_collect_jsonl(self, options):
+        """Тест записи отклоненных строк в JSON Lines"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir, self.ROWS)
+            quarantine = os.path.join(temp_dir, 'rejected.jsonl')
+
+            processor = CSVProcessor(
+                on_error='collect', quarantine_file=quarantine, **options)
+            processor.BATCH_SIZE = 4
+            data = processor.load_data([path])
+
+            assert [row['name'] for row in data] == [
+                f'User{j}' for j in range(12) if j not in (3, 8)]
+            assert processor.get_load_summary() == {
+                'rejected_rows': 2, 'quarantine_file': quarantine}
+
+            with open(quarantine, encoding='utf-8') as f:
+                entries = [json.loads(line) for line in f]
+            assert [(e['file'], e['row']) for e in entries] == [
+                (path, 5), (path, 10)]
+            assert 'performance должно быть в диапазоне' in entries[0]['error']
+            assert entries[1]['data']['name'] == 'Broken'
+
+    def test_collect_csv(self):
+        """Тест записи отклоненных строк в CSV"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir, self.ROWS)
+            quarantine = os.path.join(temp_dir, 'rejected.csv')
+
+            processor = CSVProcessor(
+                on_error='collect', quarantine_file=quarantine)
+            processor.load_data([path])
+
+            with open(quarantine, encoding='utf-8', newline='') as f:
+                rows = list(csv.DictReader(f))
+            assert [row['row'] for row in rows] == ['5', '10']
+            assert rows[0]['name'] == 'Bad'
+            assert rows[0]['performance'] == '9.5'
+
+    def test_skip_counts_without_file(self):
+        """Тест пропуска строк без файла карантина"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir, self.ROWS)
+            quarantine = os.path.join(temp_dir, 'rejected.jsonl')
+
+            processor = CSVProcessor(
+                on_error='skip', quarantine_file=quarantine)
+            records = list(processor.iter_records([path]))
+
+            assert len(records) == 10
+            assert processor.get_load_summary() == {
+                'rejected_rows': 2, 'quarantine_file': None}
+            assert not os.path.exists(quarantine)
+
+    def test_fail_has_no_summary(self):
+        """Тест режима по умолчанию: ошибка и пустые итоги"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir, self.ROWS)
+
+            processor = CSVProcessor(on_error='fail')
+            with pytest.raises(ValueError, match="Ошибка в строке 5"):
+                processor.load_data([path])
+            assert processor.get_load_summary() == {}
+
+    def test_invalid_on_error(self):
+        """Тест неподдерживаемого режима обработки ошибок"""
+        with pytest.raises(ValueError, match="Неподдерживаемый режим"):
+            CSVProcessor(on_error='ignore')
+
+
+class TestCSVProcessorParser:
+    """Тесты разбора строк через csv.reader и csv.DictReader"""
+
+    def _write_file(self, folder, content):
+        path = os.path.join(folder, 'employees.csv')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    @pytest.mark.parametrize('options', [
+        {},
+        {'record_format': 'table'},
+        {'numeric_backend': 'numpy'},
+        {'workers': 2, 'chunk_size': 64},
+    ])
+    def test_positional_matches_dict(self, options):
+        """Тест совпадения результатов на файле с лишними колонками"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir, (
+                "id,team,experience_years,name,extra,skills,"
+                "performance,position,completed_tasks,note\n"
+                + ''.join(
+                    f'{j},Team,{j},User{j},x,"Python,\nGo",4.5,'
+                    f'Developer,{j},note\n\n' for j in range(10))
+            ))
+
+            expected = CSVProcessor(
+                parser='dict', cache_enabled=False,
+                **options).load_data([path])
+            data = CSVProcessor(
+                parser='positional', cache_enabled=False,
+                **options).load_data([path])
+
+            assert list(data) == list(expected)
+            assert len(data) == 10
+
+    @pytest.mark.parametrize('parser', ['positional', 'dict'])
+    def test_short_row(self, parser):
+        """Тест строки, в которой меньше значений, чем колонок"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(
+                temp_dir,
+                TestCSVProcessorParallel.HEADER
+                + 'User,Developer,1,4.5,Python,Team,1\n'
+                + 'Short,Developer,1\n')
+
+            processor = CSVProcessor(parser=parser, cache_enabled=False)
+            with pytest.raises(ValueError) as exc_info:
+                processor.load_data([path])
+            assert str(exc_info.value) == (
+                f"Ошибка в строке 3 файла {path}: "
+                f"Недостаточно значений в строке")
+
+    def test_rejected_row_written_as_dict(self):
+        """Тест записи отклоненной строки csv.reader в карантин"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(
+                temp_dir,
+                TestCSVProcessorParallel.HEADER
+                + 'Bad,Developer,1,9.5,Python,Team,1\n')
+            quarantine = os.path.join(temp_dir, 'rejected.jsonl')
+
+            CSVProcessor(
+                parser='positional', on_error='collect',
+                quarantine_file=quarantine,
+                cache_enabled=False).load_data([path])
+
+            with open(quarantine, encoding='utf-8') as f:
+                entry = json.loads(f.readline())
+            assert entry['data']['name'] == 'Bad'
+            assert entry['data']['performance'] == '9.5'
+
+    def test_invalid_parser(self):
+        """Тест неподдерживаемого способа разбора"""
+        with pytest.raises(ValueError, match="Неподдерживаемый способ разбора"):
+            CSVProcessor(parser='pandas')
+
+
+class TestCSVProcessorDictionaryColumns:
+    """Тесты общих строк для колонок с небольшим числом значений"""
+
+    HEADER = TestCSVProcessorParallel.HEADER
+
+    def _write_files(self, folder):
+        paths = []
+        for i in range(2):
+            path = os.path.join(folder, f'employees{i}.csv')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(self.HEADER)
+                for j in range(3):
+                    f.write(f'User{i}{j},Backend Developer,{j},4.5,'
+                            f'Python,API Team,{j}\n')
+            paths.append(path)
+        return paths
+
+    @staticmethod
+    def _values(data, field):
+        return [record[field] if isinstance(record, dict)
+                else getattr(record, field) for record in data]
+
+    @pytest.mark.parametrize('options', [
+        {},
+        {'record_format': 'employee'},
+        {'numeric_backend': 'numpy'},
+        {'parser': 'dict'},
+    ])
+    def test_values_shared_across_files(self, options):
+        """Тест одного экземпляра строки для одинаковых значений"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = self._write_files(temp_dir)
+            data = CSVProcessor(
+                cache_enabled=False, **options).load_data(paths)
+
+            for field in CSVProcessor.DICTIONARY_COLUMNS:
+                values = self._values(data, field)
+                assert len(values) == 6
+                assert all(value is values[0] for value in values)
+
+            names = self._values(data, 'name')
+            assert len(set(map(id, names))) == 6
+
+    def test_iter_records_shares_values(self):
+        """Тест общих строк при потоковом чтении"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = self._write_files(temp_dir)
+            records = list(CSVProcessor().iter_records(paths))
+
+            positions = self._values(records, 'position')
+            assert all(value is positions[0] for value in positions)
+
+    def test_without_dictionary_columns(self):
+        """Тест загрузки без общих строк"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = self._write_files(temp_dir)
+            processor = CSVProcessor(cache_enabled=False)
+            processor.DICTIONARY_COLUMNS = ()
+            data = processor.load_data(paths)
+
+            positions = self._values(data, 'position')
+            assert positions == ['Backend Developer'] * 6
+            assert len(set(map(id, positions))) == 6
+
+
+class TestCSVProcessorColumns:
+    """Тесты проверки только колонок, нужных отчету"""
+
+    HEADER = TestCSVProcessorParallel.HEADER
+
+    def _write_file(self, folder):
+        path = os.path.join(folder, 'employees.csv')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.HEADER)
+            f.write('User1,Developer,5,4.5,"Python, Go",Team,3\n')
+            f.write('User2,QA,x,4.0,,Team,-1\n')
+        return path
+
+    @pytest.mark.parametrize('options', [
+        {},
+        {'record_format': 'table'},
+        {'numeric_backend': 'numpy'},
+        {'parser': 'dict'},
+    ])
+    def test_unused_columns_not_validated(self, options):
+        """Тест загрузки строки с ошибками только в ненужных колонках"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir)
+            processor = CSVProcessor(
+                columns=['name', 'position', 'performance'],
+                cache_enabled=False, **options)
+
+            rows = list(processor.load_data([path]))
+
+            assert rows[1] == {
+                'name': 'User2', 'position': 'QA', 'completed_tasks': 0,
+                'performance': 4.0, 'skills': '', 'team': '',
+                'experience_years': 0}
+            assert rows[0]['skills'] == ''
+
+    def test_always_validate(self):
+        """Тест колонок, которые проверяются при любом отчете"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir)
+            processor = CSVProcessor(
+                columns=['name', 'position', 'performance'],
+                always_validate=['experience_years'], cache_enabled=False)
+
+            with pytest.raises(ValueError, match="experience_years"):
+                processor.load_data([path])
+
+    def test_cache_separates_column_sets(self):
+        """Тест отдельных записей кэша для разных наборов колонок"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir)
+            cache_dir = os.path.join(temp_dir, 'cache')
+            projected = CSVProcessor(
+                columns=['name', 'position', 'performance', 'skills'],
+                on_error='skip', cache_dir=cache_dir, cache_enabled=True)
+            full = CSVProcessor(
+                on_error='skip', cache_dir=cache_dir, cache_enabled=True)
+
+            assert len(projected.load_data([path])) == 1
+            data = full.load_data([path])
+
+            assert len(data) == 1
+            assert data[0]['team'] == 'Team'
+            assert data[0]['experience_years'] == 3
+
+    def test_unknown_column(self):
+        """Тест неизвестной колонки"""
+        with pytest.raises(ValueError, match="Неизвестные колонки: salary"):
+            CSVProcessor(columns=['name', 'salary'])
+
+
+class TestCSVProcessorFilters:
+    """Тесты отбора строк во время разбора"""
+
+    HEADER = TestCSVProcessorParallel.HEADER
+
+    ROWS = [
+        'User1,Developer,5,4.5,"Python, Go",API Team,3\n',
+        'User2,QA,2,4.0,Selenium,Mobile Team,1\n',
+        'User3,Developer,7,4.8,Go,API Team,6\n',
+        'User4,Designer,3,3.9,Figma,API Team,2\n',
+    ]
+
+    def _write_file(self, folder, rows=None):
+        path = os.path.join(folder, 'employees.csv')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.HEADER)
+            f.write(''.join(self.ROWS if rows is None else rows))
+        return path
+
+    @pytest.mark.parametrize('options', [
+        {},
+        {'record_format': 'employee'},
+        {'record_format': 'table'},
+        {'numeric_backend': 'numpy'},
+        {'parser': 'dict'},
+        {'workers': 2, 'chunk_size': 64},
+    ])
+    def test_filtered_rows_not_loaded(self, options):
+        """Тест загрузки только строк, прошедших все условия"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir)
+            processor = CSVProcessor(
+                filters=['team=API Team', 'experience_years>=3'],
+                cache_enabled=False, **options)
+
+            data = processor.load_data([path])
+
+            record_format = options.get('record_format', 'dict')
+            if record_format == 'table':
+                names = list(data.name)
+            elif record_format == 'employee':
+                names = [employee.name for employee in data]
+            else:
+                names = [row['name'] for row in data]
+            assert names == ['User1', 'User3']
+            assert processor.get_load_summary() == {'filtered_rows': 2}
+
+    def test_iter_records(self):
+        """Тест отбора при потоковом чтении"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir)
+            processor = CSVProcessor(
+                filters=['position in (QA, Designer)'])
+
+            names = [row['name'] for row in processor.iter_records([path])]
+
+            assert names == ['User2', 'User4']
+            assert processor.get_load_summary() == {'filtered_rows': 2}
+
+    @pytest.mark.parametrize('options', [
+        {},
+        {'numeric_backend': 'numpy'},
+        {'workers': 2, 'chunk_size': 64},
+    ])
+    def test_error_row_number(self, options):
+        """Тест номера строки ошибки после отброшенных строк"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir, self.ROWS + [
+                'Bad,Developer,5,9.5,Go,API Team,3\n'])
+            processor = CSVProcessor(
+                filters=['team=API Team'], cache_enabled=False, **options)
+
+            with pytest.raises(ValueError, match="Ошибка в строке 6"):
+                processor.load_data([path])
+
+    def test_invalid_filtered_row_skips_validation(self):
+        """Тест отброшенной строки с ошибкой: она не проверяется"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir, self.ROWS + [
+                'Bad,QA,5,9.5,Go,Mobile Team,3\n'])
+            processor = CSVProcessor(
+                filters=['team=API Team'], cache_enabled=False)
+
+            assert len(processor.load_data([path])) == 3
+
+    def test_filter_column_validated(self):
+        """Тест проверки колонки условия, не нужной отчету"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir, self.ROWS + [
+                'Bad,QA,5,4.5,Go,API Team,x\n'])
+            processor = CSVProcessor(
+                columns=['name', 'position', 'performance'],
+                filters=['experience_years>=3'], cache_enabled=False)
+
+            with pytest.raises(ValueError, match="Ошибка в строке 6"):
+                processor.load_data([path])
+
+    def test_cache_separates_filters(self):
+        """Тест отдельных записей кэша для разных условий"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir)
+            cache_dir = os.path.join(temp_dir, 'cache')
+
+            for _ in range(2):
+                processor = CSVProcessor(
+                    filters=['team=API Team'], cache_dir=cache_dir,
+                    cache_enabled=True)
+                api = processor.load_data([path])
+                api_summary = processor.get_load_summary()
+                mobile = CSVProcessor(
+                    filters=['team=Mobile Team'], cache_dir=cache_dir,
+                    cache_enabled=True).load_data([path])
+
+                assert [row['name'] for row in api] == [
+                    'User1', 'User3', 'User4']
+                assert [row['name'] for row in mobile] == ['User2']
+                assert api_summary == {'filtered_rows': 1}
+
+    def test_incremental_row_numbers(self):
+        """Тест номеров строк дочитанной части после отбора"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir)
+            cache_dir = os.path.join(temp_dir, 'cache')
+            options = {
+                'filters': ['team=API Team'], 'cache_dir': cache_dir,
+                'cache_enabled': True, 'incremental': True}
+            CSVProcessor(**options).load_data([path])
+
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write('Bad,Developer,5,9.5,Go,API Team,3\n')
+
+            with pytest.raises(ValueError, match="Ошибка в строке 6"):
+                CSVProcessor(**options).load_data([path])
+
+    def test_clear_filters(self):
+        """Тест отключения отбора пустым списком условий"""
+        processor = CSVProcessor(filters=['team=API Team'])
+
+        processor.configure(filters=[])
+
+        assert processor.row_filter is None
+
+    def test_invalid_filter(self):
+        """Тест некорректного условия"""
+        with pytest.raises(ValueError, match="Некорректный фильтр"):
+            CSVProcessor(filters=['salary>100'])
+
+
+class TestCSVProcessorSampling:
+    """Тесты загрузки выборки строк и загрузки до срока"""
+
+    HEADER = TestCSVProcessorParallel.HEADER
+
+    def _write_file(self, folder, count=2000, name='employees.csv',
+                    start=0):
+        path = os.path.join(folder, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.HEADER)
+            for index in range(start, start + count):
+                f.write(f'User{index},Developer {index % 4},5,'
+                        f'{index % 50 / 10},"Python, Go",API Team,3\n')
+        return path
+
+    @staticmethod
+    def _numbers(data):
+        return [int(row['name'][4:]) for row in data]
+
+    @pytest.mark.parametrize('options', [
+        {},
+        {'numeric_backend': 'numpy'},
+        {'parser': 'dict'},
+        {'workers': 2, 'chunk_size': 4096},
+    ])
+    def test_sample_size(self, options):
+        """Тест выборки фиксированного размера"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = [self._write_file(temp_dir),
+                     self._write_file(temp_dir, 500, 'more.csv', 2000)]
+            processor = CSVProcessor(
+                sample_size=100, sample_seed=7, cache_enabled=False,
+                **options)
+
+            data = processor.load_data(paths)
+            sample = processor.get_load_summary()['sample']
+
+            assert len(data) == 100
+            assert len(set(self._numbers(data))) == 100
+            assert sample.sampled == 100
+            assert sample.population == pytest.approx(2500)
+            assert sample.complete
+
+    @pytest.mark.parametrize('options', [
+        {},
+        {'numeric_backend': 'numpy'},
+        {'workers': 2, 'chunk_size': 4096},
+    ])
+    def test_sample_rate(self, options):
+        """Тест выборки с вероятностью: строки в исходном порядке"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir)
+            processor = CSVProcessor(
+                sample_rate=0.1, sample_seed=7, cache_enabled=False,
+                **options)
+
+            numbers = self._numbers(processor.load_data([path]))
+
+            assert 120 < len(numbers) < 280
+            assert numbers == sorted(numbers)
+            assert processor.get_load_summary()['sample'].population == 2000
+
+    def test_seed_reproducible(self):
+        """Тест одинаковой выборки при одинаковом sample_seed"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir)
+
+            def load(seed):
+                return self._numbers(CSVProcessor(
+                    sample_size=50, sample_seed=seed,
+                    cache_enabled=False).load_data([path]))
+
+            assert load(1) == load(1)
+            assert load(1) != load(2)
+
+    def test_invalid_rows_outside_sample_not_validated(self):
+        """Тест: строки вне выборки не проверяются"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir)
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write('Bad,Developer,5,9.5,Go,API Team,3\n' * 1000)
+            processor = CSVProcessor(
+                sample_rate=0.1, sample_seed=3, on_error='skip',
+                cache_enabled=False)
+
+            data = processor.load_data([path])
+            summary = processor.get_load_summary()
+
+            assert 'Bad' not in [row['name'] for row in data]
+            assert 50 < summary['rejected_rows'] < 150
+            # Численность оценивается по доле корректных строк выборки
+            assert summary['sample'].population == pytest.approx(
+                2000, rel=0.1)
+
+    def test_deadline_keeps_prefix(self, monkeypatch):
+        """Тест отчета по строкам, прочитанным до срока"""
+        checks = iter([False, False])
+        monkeypatch.setattr(Deadline, 'CHECK_EVERY', 100)
+        monkeypatch.setattr(
+            Deadline, 'reached', lambda self: next(checks, True))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = [self._write_file(temp_dir),
+                     self._write_file(temp_dir, 10, 'more.csv', 2000)]
+            processor = CSVProcessor(deadline=60, cache_enabled=False)
+
+            data = processor.load_data(paths)
+            sample = processor.get_load_summary()['sample']
+
+            assert self._numbers(data) == list(range(200))
+            assert not sample.complete
+            assert sample.sampled == 200
+
+    def test_deadline_not_reached(self):
+        """Тест загрузки, уложившейся в срок: оценки не нужны"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir)
+            processor = CSVProcessor(deadline=60, cache_enabled=False)
+
+            assert len(processor.load_data([path])) == 2000
+            assert 'sample' not in processor.get_load_summary()
+
+    def test_sample_skips_cache(self):
+        """Тест: выборка не читается из кэша и не сохраняется в него"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir)
+            cache_dir = os.path.join(temp_dir, 'cache')
+
+            CSVProcessor(
+                sample_size=10, cache_dir=cache_dir,
+                cache_enabled=True).load_data([path])
+            full = CSVProcessor(
+                cache_dir=cache_dir, cache_enabled=True).load_data([path])
+
+            assert len(full) == 2000
+
+    def test_iter_records_sample_rate(self):
+        """Тест выборки с вероятностью при потоковом чтении"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self._write_file(temp_dir)
+            processor = CSVProcessor(sample_rate=0.5, sample_seed=1)
+
+            numbers = self._numbers(processor.iter_records([path]))
+
+            assert 800 < len(numbers) < 1200
+
+    def test_iter_records_sample_size_unsupported(self):
+        """Тест ошибки выборки фиксированного размера в потоке"""
+        processor = CSVProcessor(sample_size=10)
+
+        with pytest.raises(ValueError):
+            list(processor.iter_records([config.get('DEMO_DATA_FILE')]))
+
+    @pytest.mark.parametrize('options', [
+        {'sample_rate': 1.5},
+        {'sample_size': -1},
+        {'deadline': -1},
+        {'sample_rate': 0.1, 'sample_size': 10},
+    ])
+    def test_invalid_options(self, options):
+        """Тест некорректных параметров выборки"""
+        with pytest.raises(ValueError):
+            CSVProcessor(**options)
+
+
+class TestCSVProcessorHeaderCheck:
+    """Тесты проверки заголовков до разбора"""
+
+    HEADER = TestCSVProcessorParallel.HEADER
+    ROW = 'User,Developer,5,4.5,Python,API Team,3\n'
+
+    def _write_files(self, folder, count=5, bad=(3,)):
+        paths = []
+        for index in range(count):
+            path = os.path.join(folder, f"part_{index}.csv")
+            with open(path, 'w', encoding='utf-8') as f:
+                if index in bad:
+                    f.write('name,position,performance\n')
+                else:
+                    f.write(self.HEADER)
+                f.write(self.ROW)
+            paths.append(path)
+        return paths
+
+    def test_fail_before_parsing(self, monkeypatch):
+        """Тест ошибки заголовка до разбора первого файла"""
+        def parse(*args, **kwargs):
+            raise AssertionError("файл не должен разбираться")
+
+        monkeypatch.setattr(CSVProcessor, '_iter_single_file', parse)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = self._write_files(temp_dir, bad=(2, 4))
+            processor = CSVProcessor(cache_enabled=False, header_threads=3)
+
+            with pytest.raises(ValueError, match="part_2.csv содержит"):
+                processor.load_data(paths)
+
+    @pytest.mark.parametrize('options', [
+        {}, {'workers': 2}, {'record_format': 'table'}])
+    def test_exclude(self, options):
+        """Тест исключения файлов с некорректным заголовком"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = self._write_files(temp_dir, bad=(1, 3))
+            processor = CSVProcessor(
+                header_check='exclude', cache_enabled=False, **options)
+
+            data = processor.load_data(paths)
+            excluded = processor.get_load_summary()['excluded_files']
+
+            assert len(data) == 3
+            assert [path for path, _ in excluded] == [paths[1], paths[3]]
+            assert 'Отсутствуют' in excluded[0][1]
+
+    def test_exclude_iter_records(self):
+        """Тест исключения файлов при потоковом чтении"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = self._write_files(temp_dir, bad=(0,))
+            processor = CSVProcessor(header_check='exclude')
+
+            assert len(list(processor.iter_records(paths))) == 4
+
+    def test_exclude_all_files(self):
+        """Тест ошибки, если исключены все файлы"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = self._write_files(temp_dir, count=2, bad=(0, 1))
+            processor = CSVProcessor(
+                header_check='exclude', cache_enabled=False)
+
+            with pytest.raises(ValueError, match="Все файлы исключены"):
+                processor.load_data(paths)
+
+    def test_empty_and_binary_files(self):
+        """Тест пустого файла и файла не в UTF-8"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            empty = os.path.join(temp_dir, 'empty.csv')
+            binary = os.path.join(temp_dir, 'binary.csv')
+            open(empty, 'w').close()
+            with open(binary, 'wb') as f:
+                f.write(b'\xff\xfe\x00name\n')
+            good = self._write_files(temp_dir, count=1, bad=())
+            processor = CSVProcessor(
+                header_check='exclude', cache_enabled=False)
+
+            processor.load_data([empty, binary] + good)
+            errors = [error for _, error in
+                      processor.get_load_summary()['excluded_files']]
+
+            assert 'не содержит заголовков' in errors[0]
+            assert 'UTF-8' in errors[1]
+
+    @pytest.mark.parametrize('name, content', [
+        ('broken.csv.gz', b'not a gzip file'),
+        ('truncated.csv.gz', gzip.compress(b'name,position\n')[:12]),
+        ('broken.csv.bz2', b'not a bzip2 file'),
+        ('broken.csv.xz', b'not an xz file'),
+    ])
+    def test_corrupted_compressed_file(self, name, content):
+        """Тест исключения поврежденного сжатого файла"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            broken = os.path.join(temp_dir, name)
+            with open(broken, 'wb') as f:
+                f.write(content)
+            good = self._write_files(temp_dir, count=1, bad=())
+            processor = CSVProcessor(
+                header_check='exclude', cache_enabled=False)
+
+            data = processor.load_data([broken] + good)
+            excluded = processor.get_load_summary()['excluded_files']
+
+            assert len(data) == 1
+            assert excluded[0][0] == broken
+            assert 'не удалось прочитать' in excluded[0][1]
+
+    def test_missing_file(self):
+        """Тест отсутствующего файла при исключении заголовков"""
+        processor = CSVProcessor(header_check='exclude')
+
+        with pytest.raises(FileNotFoundError):
+            processor.load_data(['missing.csv'])
+
+    def test_off(self):
+        """Тест загрузки без предварительной проверки"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = self._write_files(temp_dir, bad=(4,))
+            processor = CSVProcessor(header_check='off', cache_enabled=False)
+
+            with pytest.raises(ValueError, match="part_4.csv содержит"):
+                processor.load_data(paths)
+            assert 'excluded_files' not in processor.get_load_summary()
+
+    def test_invalid_mode(self):
+        """Тест неподдерживаемого режима"""
+        with pytest.raises(ValueError, match="проверки заголовков"):
+            CSVProcessor(header_check='skip')
+
+
+class TestCSVProcessorPipeline:
+    """Тесты загрузки папки с разбором во время обхода"""
+
+    HEADER = TestCSVProcessorParallel.HEADER
+
+    def _write_tree(self, folder):
+        paths = []
+        for index, parts in enumerate((
+                ('b.csv',), ('a', 'x.csv'), ('a', 'late', 'y.csv'),
+                ('c', 'z.csv'), ('c', 'a.csv'))):
+            path = os.path.join(folder, *parts)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(self.HEADER)
+                for row in range(3):
+                    f.write(f'User {index}-{row},Dev {row},{index},4.0,'
+                            f'"Python",Team,{row}\n')
+            paths.append(path)
+        return paths
+
+    @pytest.fixture
+    def subfolders(self, monkeypatch):
+        get = config.get
+        monkeypatch.setattr(
+            config, 'get',
+            lambda key, default=None: True if key == 'INCLUDE_SUBFOLDERS'
+            else get(key, default))
+
+    @pytest.mark.parametrize('options', [
+        {}, {'workers': 2}, {'record_format': 'table'},
+        {'discovery_threads': 4}, {'on_error': 'skip'}])
+    def test_matches_load_data(self, subfolders, options):
+        """Тест совпадения данных с загрузкой после обхода"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._write_tree(temp_dir)
+            expected = CSVProcessor(cache_enabled=False, **options)
+            pipelined = CSVProcessor(
+                cache_enabled=False, pipeline=True, **options)
+
+            data = pipelined.load_folder(temp_dir)
+            reference = expected.load_data(
+                expected.discover_and_validate_files(temp_dir))
+
+            assert list(data) == list(reference)
+            assert len(data) == 15
+
+    def test_parses_before_walk_ends(self, subfolders, monkeypatch):
+        """Тест разбора первых файлов до окончания обхода"""
+        parsed = threading.Event()
+        load_file = CSVProcessor._load_file_task
+        scandir = os.scandir
+
+        def tracking_load(self, file_path):
+            result = load_file(self, file_path)
+            parsed.set()
+            return result
+
+        def slow_scandir(path):
+            if isinstance(path, str) and os.path.basename(path) == 'late':
+                # Обход ждет, пока разбирается уже найденный файл
+                assert parsed.wait(timeout=5)
+            return scandir(path)
+
+        monkeypatch.setattr(CSVProcessor, '_load_file_task', tracking_load)
+        monkeypatch.setattr('src.utils.discover.os.scandir', slow_scandir)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = self._write_tree(temp_dir)
+            processor = CSVProcessor(cache_enabled=False, pipeline=True)
+
+            data = processor.load_folder(temp_dir)
+
+            assert [record['name'] for record in data][::3] == [
+                f'User {paths.index(path)}-0' for path in sorted(paths)]
+
+    def test_first_error_in_path_order(self, subfolders):
+        """Тест ошибки первого по порядку путей файла"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = self._write_tree(temp_dir)
+            for path in (paths[0], paths[1]):
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write('Bad,Dev,x,4.0,"Python",Team,1\n')
+            processor = CSVProcessor(cache_enabled=False, pipeline=True)
+
+            with pytest.raises(ValueError, match=r"x\.csv"):
+                processor.load_folder(temp_dir)
+
+    def test_header_check(self, subfolders):
+        """Тест проверки заголовков при разборе во время обхода"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = self._write_tree(temp_dir)
+            for path in (paths[0], paths[3]):
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write('name,position\n')
+            processor = CSVProcessor(cache_enabled=False, pipeline=True)
+
+            with pytest.raises(ValueError, match=r"b\.csv содержит"):
+                processor.load_folder(temp_dir)
+
+            processor.configure(header_check='exclude')
+            data = processor.load_folder(temp_dir)
+            excluded = processor.get_load_summary()['excluded_files']
+
+            assert len(data) == 9
+            assert [path for path, _ in excluded] == [paths[0], paths[3]]
+
+    def test_cache(self, subfolders, monkeypatch):
+        """Тест чтения неизмененных файлов из кэша"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._write_tree(os.path.join(temp_dir, 'data'))
+            processor = CSVProcessor(
+                cache_enabled=True, pipeline=True,
+                cache_dir=os.path.join(temp_dir, 'cache'))
+            first = processor.load_folder(os.path.join(temp_dir, 'data'))
+
+            def fail(*args):
+                raise AssertionError("файл не должен разбираться")
+
+            monkeypatch.setattr(CSVProcessor, '_load_file_task', fail)
+            second = processor.load_folder(os.path.join(temp_dir, 'data'))
+
+            assert list(second) == list(first)
+
+    def test_empty_folder(self):
+        """Тест папки без CSV файлов"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            processor = CSVProcessor(pipeline=True)
+
+            with pytest.raises(ValueError, match="не найдено CSV файлов"):
+                processor.load_folder(temp_dir)
+
+    def test_sampling_falls_back(self, subfolders, monkeypatch):
+        """Тест загрузки после обхода для выборки строк"""
+        monkeypatch.setattr(
+            CSVProcessor, '_load_pipelined',
+            lambda *args: pytest.fail("конвейер не используется"))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._write_tree(temp_dir)
+            processor = CSVProcessor(
+                pipeline=True, sample_rate=0.5, sample_seed=1)
+
+            assert len(processor.load_folder(temp_dir)) < 15
@@ -6,7 +6,9 @@ from unittest.mock import patch
 from typing import List, Dict, Any
 
 from src.services.data_service import DataService
-from src.interfaces.data_loader import DataLoaderInterface
+from src.interfaces.data_loader import (
+    DataLoaderInterface, DiscoveringDataLoaderInterface,
+    StreamingDataLoaderInterface)
 
 
 class MockDataLoader(DataLoaderInterface):
@@ -26,6 +28,18 @@ class MockDataLoader(DataLoaderInterface):
         return self.data_to_return
 
 
+class MockStreamingDataLoader(MockDataLoader, StreamingDataLoaderInterface):
+    """Mock-реализация потокового загрузчика для тестирования"""
+
+    def iter_from_files(self, file_paths: List[str]):
+        self.load_from_files_calls.append(file_paths)
+        return iter(self.data_to_return)
+
+    def iter_from_folder(self, folder_path: str):
+        self.load_from_folder_calls.append(folder_path)
+        return iter(self.data_to_return)
+
+
 class TestDataService:
     """Тесты для класса DataService"""
 
@@ -226,3 +240,74 @@ class TestDataService:
         assert result1 == loader1_data
         assert result2 == loader2_data
         assert result1 != result2
+
+    def test_iter_data_from_folder_streaming_loader(self):
+        """Тест потокового чтения через потоковый загрузчик"""
+        test_data = [{'name': 'John Doe'}, {'name': 'Jane Smith'}]
+        mock_loader = MockStreamingDataLoader(test_data)
+        service = DataService(mock_loader)
+
+        result = service.iter_data(folder_path='data')
+
+        assert not isinstance(result, list)
+        assert list(result) == test_data
+        assert mock_loader.load_from_folder_calls == ['data']
+
+    def test_iter_data_falls_back_to_load(self):
+        """Тест потокового чтения через обычный загрузчик"""
+        test_data = [{'name': 'John Doe'}]
+        mock_loader = MockDataLoader(test_data)
+        service = DataService(mock_loader)
+
+        assert list(service.iter_data(folder_path='data')) == test_data
+        assert mock_loader.load_from_folder_calls == ['data']
+
+    def test_iter_data_no_parameters_raises_error(self):
+        """Тест ошибки потокового чтения без параметров"""
+        service = DataService(MockStreamingDataLoader([]))
+
+        with pytest.raises(
+            ValueError,
+            match="Необходимо указать файлы или папку"
+        ):
+            service.iter_data()
+
+    def test_configure_loader_delegates_options(self):
+        """Тест передачи параметров загрузки загрузчику"""
+        mock_loader = MockDataLoader([])
+        received = []
+        mock_loader.configure = lambda **options: received.append(options)
+        service = DataService(mock_loader)
+
+        service.configure_loader(workers=4)
+
+        assert received == [{'workers': 4}]
+
+    def test_list_files(self, tmp_path):
+        """Тест списка файлов для загрузки"""
+        csv_file = tmp_path / 'data.csv'
+        csv_file.write_text('name\n')
+
+        class DiscoveringLoader(MockDataLoader,
+                                DiscoveringDataLoaderInterface):
+            def discover_files(self, folder_path):
+                return [str(csv_file)]
+
+        service = DataService(DiscoveringLoader([]))
+
+        assert service.list_files(folder_path=str(tmp_path)) == [
+            str(csv_file)]
+        assert service.list_files(file_paths=[str(csv_file)]) == [
+            str(csv_file)]
+        with pytest.raises(FileNotFoundError):
+            service.list_files(file_paths=[str(tmp_path / 'missing.csv')])
+
+    def test_list_files_without_discovery(self, tmp_path):
+        """Тест поиска файлов для загрузчика, который не ищет их сам"""
+        (tmp_path / 'b.csv').write_text('name\n')
+        (tmp_path / 'a.csv').write_text('name\n')
+        (tmp_path / 'notes.txt').write_text('')
+        service = DataService(MockDataLoader([]))
+
+        assert service.list_files(folder_path=str(tmp_path)) == [
+            str(tmp_path / 'a.csv'), str(tmp_path / 'b.csv')]
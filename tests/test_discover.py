@@ -2,10 +2,13 @@
 Тесты для утилит обнаружения файлов
 """
 import pytest
+import threading
+import time
 import os
 import tempfile
 
-from src.utils.discover import discover_csv_files
+from src.utils import discover
+from src.utils.discover import discover_csv_files, scan_csv_files
 
 
 class TestDiscoverCSVFiles:
@@ -133,3 +136,277 @@ class TestDiscoverCSVFiles:
                 # Восстанавливаем права
                 if os.name != 'nt':
                     os.chmod(csv_readonly, 0o644)
+
+
+class TestScanCSVFiles:
+    """Тесты для функции scan_csv_files"""
+
+    def _write(self, path, content='name\n'):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+
+    def test_sizes(self):
+        """Тест размеров найденных файлов"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            small = os.path.join(temp_dir, 'small.csv')
+            large = os.path.join(temp_dir, 'large.csv.gz')
+            self._write(small, 'a\n')
+            self._write(large, 'a' * 100)
+            self._write(os.path.join(temp_dir, 'notes.txt'))
+
+            assert scan_csv_files(temp_dir) == [(large, 100), (small, 2)]
+
+    def test_subfolders(self):
+        """Тест обхода подпапок и порядка путей"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = [os.path.join(temp_dir, *parts) for parts in (
+                ('a', 'b', 'deep.csv'), ('a', 'x.csv'), ('top.csv',))]
+            for path in paths:
+                self._write(path)
+
+            assert scan_csv_files(temp_dir, include_subfolders=False) == [
+                (paths[2], 5)]
+            assert discover_csv_files(
+                temp_dir, include_subfolders=True) == paths
+
+    def test_folder_named_csv(self):
+        """Тест папки с расширением .csv"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.mkdir(os.path.join(temp_dir, 'archive.csv'))
+
+            assert scan_csv_files(temp_dir, include_subfolders=True) == []
+
+    @pytest.mark.skipif(os.name == 'nt', reason="символические ссылки")
+    def test_symlinks(self):
+        """Тест ссылок: на файл учитывается, папка не обходится"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target = os.path.join(temp_dir, 'data', 'real.csv')
+            self._write(target)
+            link = os.path.join(temp_dir, 'link.csv')
+            os.symlink(target, link)
+            os.symlink(os.path.join(temp_dir, 'data'),
+                       os.path.join(temp_dir, 'loop'))
+            os.symlink(os.path.join(temp_dir, 'missing.csv'),
+                       os.path.join(temp_dir, 'broken.csv'))
+
+            result = discover_csv_files(temp_dir, include_subfolders=True)
+
+            assert result == [target, link]
+
+    @pytest.mark.skipif(os.name == 'nt', reason="права доступа Unix")
+    def test_unreadable_file(self, monkeypatch):
+        """Тест пропуска файла без права чтения"""
+        monkeypatch.setattr(discover.os, 'geteuid', lambda: os.getuid() + 1)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            hidden = os.path.join(temp_dir, 'hidden.csv')
+            shared = os.path.join(temp_dir, 'shared.csv')
+            self._write(hidden)
+            self._write(shared)
+            os.chmod(hidden, 0o600)
+            os.chmod(shared, 0o644)
+
+            assert discover_csv_files(temp_dir) == [shared]
+
+    def test_no_access_calls(self, monkeypatch):
+        """Тест, что для файлов не вызываются isfile() и access()"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for index in range(3):
+                self._write(os.path.join(temp_dir, f'{index}.csv'))
+            calls = []
+            access = os.access
+
+            def counting_access(path, mode):
+                calls.append(path)
+                return access(path, mode)
+
+            monkeypatch.setattr(discover.os, 'access', counting_access)
+            monkeypatch.setattr(
+                discover.os.path, 'isfile',
+                lambda path: pytest.fail("isfile() не должен вызываться"))
+
+            assert len(discover_csv_files(temp_dir)) == 3
+            assert calls == [temp_dir]
+
+
+class TestDiscoverPatterns:
+    """Тесты шаблонов отбора и глубины обхода"""
+
+    FILES = (
+        'top.csv',
+        'top.bak.csv',
+        'archive/old.csv',
+        'archive/2020/older.csv',
+        'sales/q1.csv',
+        'sales/archive/q0.csv',
+        'sales/deep/more/q2.csv',
+    )
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        for relative in self.FILES:
+            path = tmp_path.joinpath(*relative.split('/'))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text('name\n')
+        return str(tmp_path)
+
+    def _found(self, root, **options):
+        options.setdefault('include_subfolders', True)
+        return [os.path.relpath(path, root).replace(os.sep, '/')
+                for path in discover_csv_files(root, **options)]
+
+    def test_no_patterns(self, tree):
+        """Тест поиска без шаблонов"""
+        assert self._found(tree) == sorted(self.FILES)
+
+    def test_exclude_by_name(self, tree):
+        """Тест исключения папок и файлов по имени на любом уровне"""
+        assert self._found(tree, exclude=['archive', '*.bak.csv']) == [
+            'sales/deep/more/q2.csv', 'sales/q1.csv', 'top.csv']
+
+    def test_exclude_by_path(self, tree):
+        """Тест исключения по пути относительно папки"""
+        assert self._found(tree, exclude=['sales/archive', 'sales/deep/']) \
+            == ['archive/2020/older.csv', 'archive/old.csv',
+                'sales/q1.csv', 'top.bak.csv', 'top.csv']
+
+    def test_include(self, tree):
+        """Тест отбора файлов шаблонами include"""
+        assert self._found(tree, include=['q*.csv']) == [
+            'sales/archive/q0.csv', 'sales/deep/more/q2.csv',
+            'sales/q1.csv']
+        assert self._found(
+            tree, include=['sales/*'], exclude=['archive']) == [
+            'sales/deep/more/q2.csv', 'sales/q1.csv']
+
+    def test_excluded_folder_not_read(self, tree, monkeypatch):
+        """Тест, что исключенные папки не читаются"""
+        scanned = []
+        scandir = os.scandir
+
+        def tracking_scandir(path):
+            scanned.append(os.path.basename(path))
+            return scandir(path)
+
+        monkeypatch.setattr(discover.os, 'scandir', tracking_scandir)
+        self._found(tree, exclude=['archive', 'deep'])
+
+        assert sorted(scanned[1:]) == ['sales']
+
+    @pytest.mark.parametrize('max_depth, expected', [
+        (1, ['top.bak.csv', 'top.csv']),
+        (2, ['archive/old.csv', 'sales/q1.csv', 'top.bak.csv', 'top.csv']),
+        (0, sorted(FILES)),
+    ])
+    def test_max_depth(self, tree, max_depth, expected):
+        """Тест ограничения глубины обхода"""
+        assert self._found(tree, max_depth=max_depth) == expected
+
+    def test_without_subfolders(self, tree):
+        """Тест, что без подпапок глубина не важна"""
+        assert self._found(tree, include_subfolders=False, max_depth=5) == [
+            'top.bak.csv', 'top.csv']
+
+    def test_negative_depth(self, tree):
+        """Тест отрицательной глубины"""
+        with pytest.raises(ValueError, match="Глубина обхода"):
+            discover_csv_files(tree, max_depth=-1)
+
+    def test_config_defaults(self, tree, monkeypatch):
+        """Тест шаблонов и глубины из конфигурации"""
+        values = {'INCLUDE_SUBFOLDERS': True,
+                  'EXCLUDE_PATTERNS': ['archive'],
+                  'MAX_DEPTH': 2}
+        get = discover.config.get
+        monkeypatch.setattr(
+            discover.config, 'get',
+            lambda key, default=None: values.get(key, get(key, default)))
+
+        assert self._found(tree, include_subfolders=None) == [
+            'sales/q1.csv', 'top.bak.csv', 'top.csv']
+
+
+class TestParallelDiscover:
+    """Тесты параллельного обхода подпапок"""
+
+    # Задержка одного чтения папки, как на сетевом диске
+    LATENCY = 0.02
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        for top in range(4):
+            for sub in range(4):
+                folder = tmp_path / f'd{top}' / f's{sub}'
+                folder.mkdir(parents=True)
+                (folder / f'{top}_{sub}.csv').write_text('name\n')
+                (folder / 'skip.txt').write_text('')
+            (tmp_path / f'd{top}' / 'top.csv').write_text('name\n')
+        return str(tmp_path)
+
+    @pytest.fixture
+    def overlap(self, monkeypatch):
+        """Наибольшее число одновременных чтений папок"""
+        scandir = os.scandir
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+
+        def delayed(path):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            try:
+                time.sleep(self.LATENCY)
+                return scandir(path)
+            finally:
+                with lock:
+                    state['active'] -= 1
+
+        monkeypatch.setattr(discover.os, 'scandir', delayed)
+        return state
+
+    def test_same_result(self, tree):
+        """Тест совпадения результата с последовательным обходом"""
+        serial = scan_csv_files(tree, include_subfolders=True, threads=1)
+
+        for threads in (2, 8):
+            assert scan_csv_files(
+                tree, include_subfolders=True, threads=threads) == serial
+        assert len(serial) == 20
+
+    def test_patterns_and_depth(self, tree):
+        """Тест шаблонов и глубины при параллельном обходе"""
+        options = {'exclude': ['s0', 'd1'], 'include_subfolders': True}
+
+        assert scan_csv_files(tree, threads=4, **options) == (
+            scan_csv_files(tree, threads=1, **options))
+        assert len(scan_csv_files(
+            tree, include_subfolders=True, threads=4, max_depth=2)) == 4
+
+    def test_concurrent_reads(self, tree, overlap):
+        """Тест одновременного чтения папок при задержке чтения"""
+        serial = scan_csv_files(tree, include_subfolders=True, threads=1)
+        assert overlap['peak'] == 1
+
+        parallel = scan_csv_files(tree, include_subfolders=True, threads=8)
+
+        assert parallel == serial
+        assert overlap['peak'] > 1
+
+    def test_unreadable_subfolder(self, tree, monkeypatch):
+        """Тест пропуска подпапки, которую не удалось прочитать"""
+        scandir = os.scandir
+
+        def failing(path):
+            if os.path.basename(path) == 'd2':
+                raise PermissionError(path)
+            return scandir(path)
+
+        monkeypatch.setattr(discover.os, 'scandir', failing)
+
+        assert len(scan_csv_files(
+            tree, include_subfolders=True, threads=4)) == 15
+
+    def test_invalid_threads(self, tree):
+        """Тест недопустимого количества потоков"""
+        with pytest.raises(ValueError, match="потоков"):
+            scan_csv_files(tree, threads=0)
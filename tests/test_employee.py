@@ -0,0 +1,88 @@
+"""
+Тесты для записи Employee
+"""
+import pickle
+
+import pytest
+
+from src.csv_processor import CSVProcessor
+from src.employee import Employee
+from src.report_generator import PerformanceReport, SkillsReport
+from src.config import config
+
+
+class TestEmployee:
+    """Тесты для класса Employee"""
+
+    RECORD = {
+        'name': 'John Doe',
+        'position': 'Developer',
+        'completed_tasks': 25,
+        'performance': 4.5,
+        'skills': 'Python, Django',
+        'team': 'Backend Team',
+        'experience_years': 3
+    }
+
+    def test_dict_round_trip(self):
+        """Тест преобразования в словарь и обратно"""
+        employee = Employee.from_dict(self.RECORD)
+
+        assert employee.name == 'John Doe'
+        assert employee.performance == 4.5
+        assert employee.as_dict() == self.RECORD
+        assert Employee.from_dict(employee.as_dict()) == employee
+
+    def test_missing_fields_are_none(self):
+        """Тест создания записи из неполного словаря"""
+        employee = Employee.from_dict({'name': 'John Doe'})
+
+        assert employee.name == 'John Doe'
+        assert employee.skills is None
+
+    def test_slots_prevent_new_attributes(self):
+        """Тест отсутствия __dict__ у записи"""
+        employee = Employee.from_dict(self.RECORD)
+
+        assert not hasattr(employee, '__dict__')
+        with pytest.raises(AttributeError):
+            employee.salary = 100
+
+    def test_pickle(self):
+        """Тест передачи записи между процессами"""
+        employee = Employee.from_dict(self.RECORD)
+
+        assert pickle.loads(pickle.dumps(employee)) == employee
+
+
+class TestEmployeeRecordFormat:
+    """Тесты загрузки данных в виде Employee"""
+
+    def test_load_data_returns_employees(self):
+        """Тест загрузки файлов в список Employee"""
+        files = [config.get('demo_data_file'), config.get('test_data_file')]
+
+        rows = CSVProcessor().load_data(files)
+        employees = CSVProcessor(record_format='employee').load_data(files)
+
+        assert all(isinstance(item, Employee) for item in employees)
+        assert [item.as_dict() for item in employees] == rows
+
+    def test_parallel_load_employees(self):
+        """Тест загрузки Employee в пуле процессов"""
+        files = [config.get('demo_data_file'), config.get('test_data_file')]
+
+        sequential = CSVProcessor(record_format='employee').load_data(files)
+        parallel = CSVProcessor(
+            workers=2, record_format='employee').load_data(files)
+
+        assert parallel == sequential
+
+    def test_reports_accept_employees(self):
+        """Тест генерации отчетов по списку Employee"""
+        files = [config.get('demo_data_file'), config.get('test_data_file')]
+        rows = CSVProcessor().load_data(files)
+        employees = CSVProcessor(record_format='employee').load_data(files)
+
+        for report in (PerformanceReport(), SkillsReport()):
+            assert report.generate(employees) == report.generate(rows)
@@ -0,0 +1,230 @@
+"""
+Тесты для колоночного хранилища EmployeeTable
+"""
+import pickle
+
+import pytest
+
+from src.csv_processor import CSVProcessor
+from src.employee_table import (
+    EmployeeTable, SkillsColumn, StringColumn, parse_skills)
+from src.report_generator import PerformanceReport, SkillsReport
+from src.config import config
+
+
+def _record(name, position, performance, skills='Python'):
+    return {
+        'name': name,
+        'position': position,
+        'completed_tasks': 10,
+        'performance': performance,
+        'skills': skills,
+        'team': 'Team',
+        'experience_years': 2
+    }
+
+
+class TestStringColumn:
+    """Тесты для класса StringColumn"""
+
+    def test_values_are_deduplicated(self):
+        """Тест хранения повторяющихся значений одним кодом"""
+        column = StringColumn()
+        for value in ['Dev', 'QA', 'Dev', 'Dev']:
+            column.append(value)
+
+        assert list(column.codes) == [0, 1, 0, 0]
+        assert column.values == ['Dev', 'QA']
+        assert list(column) == ['Dev', 'QA', 'Dev', 'Dev']
+
+    def test_extend_remaps_codes(self):
+        """Тест перекодирования при объединении колонок"""
+        first = StringColumn()
+        first.append('Dev')
+        second = StringColumn()
+        second.append('QA')
+        second.append('Dev')
+
+        first.extend(second)
+
+        assert list(first) == ['Dev', 'QA', 'Dev']
+        assert first.values == ['Dev', 'QA']
+
+    def test_append_after_freeze(self):
+        """Тест добавления значений после освобождения индекса"""
+        column = StringColumn()
+        column.append('Dev')
+        column.freeze()
+        column.append('Dev')
+        column.append('QA')
+
+        assert list(column.codes) == [0, 0, 1]
+
+
+class TestSkillsColumn:
+    """Тесты для класса SkillsColumn"""
+
+    def test_skills_are_tokenized(self):
+        """Тест разбора строк навыков в идентификаторы"""
+        column = SkillsColumn()
+        for value in ['Python, Go', ' Go ,,SQL', '', 'Python, Go']:
+            column.append(value)
+
+        assert len(column) == 4
+        assert column.skills == ['Python', 'Go', 'SQL']
+        assert list(column.offsets) == [0, 2, 4, 4, 6]
+        assert list(column.ids) == [0, 1, 1, 2, 0, 1]
+        assert column[1] == ['Go', 'SQL']
+        assert column[2] == []
+
+    def test_cache_is_bounded(self):
+        """Тест ограничения кэша разобранных строк"""
+        column = SkillsColumn()
+        column.CACHE_SIZE = 2
+        for value in ['A', 'B', 'C', 'A, B']:
+            column.append(value)
+
+        assert len(column._cache) == 2
+        assert column.skills == ['A', 'B', 'C']
+        assert column[3] == ['A', 'B']
+
+    def test_extend_remaps_ids(self):
+        """Тест перекодирования навыков при объединении колонок"""
+        first = SkillsColumn()
+        first.append('Python')
+        second = SkillsColumn()
+        second.append('Go, Python')
+        second.append('Go')
+
+        first.extend(second)
+
+        assert first.skills == ['Python', 'Go']
+        assert [first[i] for i in range(3)] == [
+            ['Python'], ['Go', 'Python'], ['Go']]
+
+    def test_pickle_drops_cache(self):
+        """Тест передачи колонки между процессами без кэша разбора"""
+        column = SkillsColumn()
+        column.append('Python, Go')
+
+        restored = pickle.loads(pickle.dumps(column))
+        restored.append('Go, SQL')
+
+        assert restored._cache == {'Go, SQL': (1, 2)}
+        assert [restored[i] for i in range(2)] == [
+            ['Python', 'Go'], ['Go', 'SQL']]
+
+    @pytest.mark.parametrize('value, expected', [
+        ('Python, Go', ['Python', 'Go']),
+        (' Python ,, ', ['Python']),
+        ('', []),
+        (None, []),
+    ])
+    def test_parse_skills(self, value, expected):
+        """Тест разбора строки навыков"""
+        assert parse_skills(value) == expected
+
+
+class TestEmployeeTable:
+    """Тесты для класса EmployeeTable"""
+
+    def test_rows_round_trip(self):
+        """Тест совпадения строк таблицы с исходными записями"""
+        records = [_record('User1', 'Dev', 4.5), _record('User2', 'QA', 4.8)]
+        table = EmployeeTable()
+        table.extend(records)
+
+        assert len(table) == 2
+        assert list(table) == records
+        assert table.row(1) == records[1]
+        assert table.column('performance').tolist() == [4.5, 4.8]
+
+    def test_unknown_column(self):
+        """Тест запроса несуществующей колонки"""
+        with pytest.raises(KeyError):
+            EmployeeTable().column('salary')
+
+    def test_load_table_matches_load_data(self):
+        """Тест загрузки файлов в таблицу"""
+        files = [config.get('demo_data_file'), config.get('test_data_file')]
+
+        rows = CSVProcessor().load_data(files)
+        processor = CSVProcessor()
+        table = processor.load_table(files)
+
+        assert isinstance(table, EmployeeTable)
+        assert list(table) == rows
+        # Формат по умолчанию не меняется
+        assert isinstance(processor.load_data(files), list)
+
+    def test_parallel_load_table(self):
+        """Тест загрузки таблицы в пуле процессов"""
+        files = [config.get('demo_data_file'), config.get('test_data_file')]
+
+        rows = CSVProcessor().load_data(files)
+        table = CSVProcessor(
+            workers=2, chunk_size=256, record_format='table').load_data(files)
+
+        assert list(table) == rows
+
+    def test_invalid_record_format(self):
+        """Тест неподдерживаемого формата записей"""
+        with pytest.raises(ValueError, match="Неподдерживаемый формат"):
+            CSVProcessor(record_format='xml')
+
+    @pytest.mark.parametrize('record_format', ['dict', 'table'])
+    @pytest.mark.parametrize('numeric_backend', ['python', 'numpy'])
+    def test_large_integers(self, tmp_path, record_format, numeric_backend):
+        """Тест целых значений вне int32 и отклонения значений вне int64"""
+        path = tmp_path / 'large.csv'
+        path.write_text(
+            'name,position,completed_tasks,performance,skills,team,'
+            'experience_years\n'
+            'A,Dev,3000000000,4.5,Python,Team,2\n'
+            f'B,Dev,{2 ** 63},4.5,Python,Team,2\n'
+            f'C,QA,{2 ** 63 - 1},4.0,Python,Team,{2 ** 40}\n',
+            encoding='utf-8')
+        processor = CSVProcessor(record_format=record_format,
+                                 numeric_backend=numeric_backend,
+                                 on_error='skip', cache_enabled=False)
+
+        records = list(processor.load_data([str(path)]))
+
+        assert [record['completed_tasks'] for record in records] == [
+            3000000000, 2 ** 63 - 1]
+        assert records[1]['experience_years'] == 2 ** 40
+
+    def test_reports_accept_table(self):
+        """Тест генерации отчетов по колоночной таблице"""
+        files = [config.get('demo_data_file'), config.get('test_data_file')]
+        rows = CSVProcessor().load_data(files)
+        table = CSVProcessor(record_format='table').load_data(files)
+
+        for report in (PerformanceReport(), SkillsReport()):
+            assert report.generate(table) == report.generate(rows)
+
+    def test_skills_report_top_from_table(self):
+        """Тест топа сотрудников по навыкам из колонки skill_lists"""
+        records = [
+            _record(f'User{i}', 'Dev', 4.0,
+                    ', '.join(f'Skill{j}' for j in range(i % 5 + 1)))
+            for i in range(30)
+        ]
+        table = EmployeeTable()
+        table.extend(records)
+        table.freeze()
+        report = SkillsReport()
+
+        from_table = report.accumulate(table)
+        from_rows = report.accumulate(records)
+
+        assert from_table.top_employees() == from_rows.top_employees()
+        assert from_table.skills == from_rows.skills
+
+    def test_reports_accept_empty_table(self):
+        """Тест генерации отчетов по пустой таблице"""
+        table = EmployeeTable()
+
+        assert PerformanceReport().generate(table) == (
+            PerformanceReport().generate([]))
+        assert SkillsReport().generate(table) == SkillsReport().generate([])
@@ -0,0 +1,104 @@
+"""
+Тесты для условий отбора строк
+"""
+import pytest
+
+from src.csv_processor import CSVProcessor
+from src.filters import Condition, RowFilter
+
+
+COLUMNS = CSVProcessor.REQUIRED_COLUMNS
+
+ROW = {
+    'name': 'John Doe',
+    'position': 'Developer',
+    'completed_tasks': '25',
+    'performance': '4.5',
+    'skills': 'Python, Django',
+    'team': ' API Team ',
+    'experience_years': '3'
+}
+
+
+def matches(*expressions, row=ROW, keys=None):
+    """Проверяет строку условиями из выражений"""
+    row_filter = RowFilter(
+        [Condition.parse(expression, COLUMNS) for expression in expressions])
+    return row_filter.compile(keys)(row)
+
+
+class TestCondition:
+    """Тесты разбора условий"""
+
+    @pytest.mark.parametrize('expression, expected', [
+        ('team=API Team', ('team', '=', ('API Team',))),
+        ('experience_years >= 3', ('experience_years', '>=', (3,))),
+        ('performance<4.5', ('performance', '<', (4.5,))),
+        ("team != 'Mobile Team'", ('team', '!=', ('Mobile Team',))),
+        ('position in (Developer, "QA Engineer")',
+         ('position', 'in', ('Developer', 'QA Engineer'))),
+        ('completed_tasks NOT IN (1, 2)',
+         ('completed_tasks', 'not in', (1, 2))),
+    ])
+    def test_parse(self, expression, expected):
+        """Тест разбора выражений"""
+        condition = Condition.parse(expression, COLUMNS)
+
+        assert (condition.column, condition.operator,
+                condition.values) == expected
+
+    @pytest.mark.parametrize('expression, message', [
+        ('team', 'ожидается'),
+        ('salary>1', "неизвестная колонка 'salary'"),
+        ('team>A', "неприменим к строковой колонке 'team'"),
+        ('experience_years>=three', "'three' не является числом"),
+        ('team=', 'пустое значение'),
+        ('position in ()', 'пустой список значений'),
+    ])
+    def test_invalid_expression(self, expression, message):
+        """Тест некорректных выражений"""
+        with pytest.raises(ValueError, match=message):
+            Condition.parse(expression, COLUMNS)
+
+
+class TestRowFilter:
+    """Тесты проверки строк условиями"""
+
+    @pytest.mark.parametrize('expressions, expected', [
+        (['team=API Team'], True),
+        (['team=Mobile Team'], False),
+        (['experience_years>=3'], True),
+        (['experience_years>3'], False),
+        (['performance<=4.5', 'completed_tasks>20'], True),
+        (['performance<=4.5', 'completed_tasks>30'], False),
+        (['position in (QA, Developer)'], True),
+        (['position not in (QA, Developer)'], False),
+    ])
+    def test_matches(self, expressions, expected):
+        """Тест отбора строки"""
+        assert matches(*expressions) is expected
+
+    def test_positional_keys(self):
+        """Тест строк csv.reader с индексами колонок"""
+        row = [ROW[column] for column in COLUMNS]
+        keys = {column: index for index, column in enumerate(COLUMNS)}
+
+        assert matches('team=API Team', row=row, keys=keys)
+        assert not matches('experience_years<3', row=row, keys=keys)
+
+    def test_unconvertible_value_passes(self):
+        """Тест пропуска строки с непреобразуемым значением к проверке"""
+        row = dict(ROW, experience_years='x')
+
+        assert matches('experience_years>=10', row=row)
+
+    def test_columns_and_fingerprint(self):
+        """Тест колонок условий и отпечатка фильтра"""
+        first = RowFilter([
+            Condition.parse('team=A', COLUMNS),
+            Condition.parse('team!=B', COLUMNS),
+            Condition.parse('performance>4', COLUMNS)])
+        second = RowFilter([Condition.parse('team=B', COLUMNS)])
+
+        assert first.columns == ('team', 'performance')
+        assert first.fingerprint() != second.fingerprint()
@@ -1,6 +1,8 @@
 """
 Интеграционные тесты
 """
+import json
+import os
 import pytest
 from io import StringIO
 from unittest.mock import patch
@@ -87,6 +89,238 @@ class TestIntegration:
                 assert 'Backend Developer' in output
                 assert 'Alex Ivanov' in output
 
+    def test_main_with_filter(self):
+        """Тест отбора строк условиями --filter"""
+        demo_file = config.get('DEMO_DATA_FILE')
+
+        from main import main
+
+        with patch(
+            'sys.argv',
+            [
+                'main.py', '--files', demo_file,
+                '--report', 'performance',
+                '--filter', 'team=API Team',
+                '--filter', 'experience_years>=3'
+            ]
+        ):
+            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+                main()
+                output = mock_stdout.getvalue()
+
+                assert 'Backend Developer' in output
+                assert 'Mobile Developer' not in output
+
+    def test_main_with_sample(self):
+        """Тест отчета по выборке строк --sample-size"""
+        demo_file = config.get('DEMO_DATA_FILE')
+        test_file = config.get('TEST_DATA_FILE')
+
+        from main import main
+
+        with patch(
+            'sys.argv',
+            [
+                'main.py', '--files', demo_file, test_file,
+                '--report', 'performance',
+                '--sample-size', '3', '--sample-seed', '1', '--no-cache'
+            ]
+        ):
+            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+                main()
+                output = mock_stdout.getvalue()
+
+                assert 'Оценка по выборке: 3 из ~' in output
+                assert '±' in output
+
+    def test_main_with_sample_and_stream(self):
+        """Тест ошибки выборки строк при потоковой обработке"""
+        demo_file = config.get('DEMO_DATA_FILE')
+
+        from main import main
+
+        with patch(
+            'sys.argv',
+            ['main.py', '--files', demo_file, '--stream', '--deadline', '5']
+        ):
+            with patch('sys.stderr', new_callable=StringIO) as mock_stderr:
+                with pytest.raises(SystemExit) as exc_info:
+                    main()
+
+                assert exc_info.value.code == 1
+                assert '--stream' in mock_stderr.getvalue()
+
+    def test_main_with_memory_limit(self):
+        """Тест потокового отчета с пределом памяти агрегатов"""
+        demo_file = config.get('DEMO_DATA_FILE')
+
+        from main import main
+
+        with patch(
+            'sys.argv',
+            [
+                'main.py', '--files', demo_file, '--report', 'skills',
+                '--stream', '--memory-limit', '1'
+            ]
+        ):
+            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+                main()
+                output = mock_stdout.getvalue()
+
+                assert 'ОТЧЕТ ПО НАВЫКАМ' in output
+
+    def test_main_with_header_check_exclude(self, tmp_path):
+        """Тест исключения файла с некорректным заголовком"""
+        demo_file = config.get('DEMO_DATA_FILE')
+        bad_file = tmp_path / 'bad.csv'
+        bad_file.write_text('name,position\nUser,Developer\n',
+                            encoding='utf-8')
+
+        from main import main
+
+        with patch(
+            'sys.argv',
+            [
+                'main.py', '--files', str(bad_file), demo_file,
+                '--report', 'performance', '--header-check', 'exclude'
+            ]
+        ):
+            with patch('sys.stdout', new_callable=StringIO) as mock_stdout, \
+                    patch('sys.stderr', new_callable=StringIO) as mock_stderr:
+                main()
+
+                assert 'Позиция' in mock_stdout.getvalue()
+                assert 'Файл исключен' in mock_stderr.getvalue()
+
+    def test_main_with_folder_exclude(self, tmp_path):
+        """Тест исключения файлов папки шаблоном --exclude"""
+        demo_file = config.get('DEMO_DATA_FILE')
+        (tmp_path / 'employees.csv').write_text(
+            open(demo_file, encoding='utf-8').read(), encoding='utf-8')
+        (tmp_path / 'broken_export.csv').write_text(
+            'name\nUser\n', encoding='utf-8')
+
+        from main import main
+
+        with patch(
+            'sys.argv',
+            [
+                'main.py', '--folder', str(tmp_path),
+                '--report', 'performance', '--exclude', 'broken*'
+            ]
+        ):
+            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+                main()
+
+                assert 'Backend Developer' in mock_stdout.getvalue()
+
+    def test_main_with_pipeline(self, tmp_path):
+        """Тест загрузки папки с разбором во время обхода"""
+        for name in ('DEMO_DATA_FILE', 'TEST_DATA_FILE'):
+            path = config.get(name)
+            (tmp_path / os.path.basename(path)).write_text(
+                open(path, encoding='utf-8').read(), encoding='utf-8')
+
+        from main import main
+
+        with patch(
+            'sys.argv',
+            ['main.py', '--folder', str(tmp_path), '--pipeline', '--no-cache']
+        ):
+            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+                main()
+                output = mock_stdout.getvalue()
+
+                assert 'Mobile Developer' in output
+                assert 'QA Engineer' in output
+
+    def test_main_with_watch(self, tmp_path):
+        """Тест перестроения отчета при изменении файлов папки"""
+        demo_file = config.get('DEMO_DATA_FILE')
+        (tmp_path / 'employees.csv').write_text(
+            open(demo_file, encoding='utf-8').read(), encoding='utf-8')
+        header = open(demo_file, encoding='utf-8').readline()
+        cycles = []
+
+        def sleep(seconds):
+            cycles.append(seconds)
+            if len(cycles) == 1:
+                (tmp_path / 'new.csv').write_text(
+                    header + 'New User,Chief Watcher,10,4.9,"Python",'
+                    'Ops,5\n', encoding='utf-8')
+            elif len(cycles) == 2:
+                os.remove(tmp_path / 'employees.csv')
+            else:
+                raise KeyboardInterrupt
+
+        from main import main
+
+        with patch(
+            'sys.argv',
+            ['main.py', '--folder', str(tmp_path), '--watch',
+             '--watch-interval', '0.5', '--no-cache']
+        ):
+            with patch('sys.stdout', new_callable=StringIO) as stdout, \
+                    patch('sys.stderr', new_callable=StringIO) as stderr, \
+                    patch('src.application.time.sleep', sleep):
+                main()
+                reports = stdout.getvalue().split('Позиция')[1:]
+                log = stderr.getvalue()
+
+        assert cycles == [0.5, 0.5, 0.5]
+        assert len(reports) == 3
+        assert 'Chief Watcher' not in reports[0]
+        assert 'Chief Watcher' in reports[1]
+        assert 'Backend Developer' in reports[1]
+        assert 'Backend Developer' not in reports[2]
+        assert log.count('Отчет обновлен за') == 3
+        assert 'добавлено 1, изменено 0, удалено 0' in log
+        assert 'добавлено 0, изменено 0, удалено 1' in log
+
+    def test_main_with_watch_quarantine(self, tmp_path):
+        """Тест карантина и итогов загрузки в режиме --watch"""
+        demo_file = config.get('DEMO_DATA_FILE')
+        header = open(demo_file, encoding='utf-8').readline()
+        data = tmp_path / 'data'
+        data.mkdir()
+        for name in ('a', 'b'):
+            (data / f'{name}.csv').write_text(
+                header + f'Bad {name},QA,1,9.9,Python,Team,1\n'
+                f'Good {name},QA,1,4.5,Python,Team,1\n', encoding='utf-8')
+        quarantine_file = tmp_path / 'quarantine.jsonl'
+        cycles = []
+
+        def sleep(seconds):
+            cycles.append(seconds)
+            if len(cycles) == 1:
+                with open(data / 'b.csv', 'a', encoding='utf-8') as f:
+                    f.write('Worse b,QA,1,-4.5,Python,Team,1\n')
+            else:
+                raise KeyboardInterrupt
+
+        from main import main
+
+        with patch(
+            'sys.argv',
+            ['main.py', '--folder', str(data), '--watch', '--no-cache',
+             '--on-error', 'collect',
+             '--quarantine-file', str(quarantine_file)]
+        ):
+            with patch('sys.stdout', new_callable=StringIO), \
+                    patch('sys.stderr', new_callable=StringIO) as stderr, \
+                    patch('src.application.time.sleep', sleep):
+                main()
+                log = stderr.getvalue()
+
+        names = [json.loads(line)['data']['name']
+                 for line in quarantine_file.read_text(
+                     encoding='utf-8').splitlines()]
+        assert names == ['Bad a', 'Bad b', 'Worse b']
+        assert (f"Пропущено некорректных строк: 2 "
+                f"(сохранены в {quarantine_file})") in log
+        assert (f"Пропущено некорректных строк: 3 "
+                f"(сохранены в {quarantine_file})") in log
+
     def test_main_with_nonexistent_file(self):
         """Тест обработки отсутствующего файла"""
         from main import main
@@ -0,0 +1,175 @@
+"""
+Тесты для манифеста папок
+"""
+import os
+import time
+
+import pytest
+
+from src.csv_processor import CSVProcessor
+from src.utils import discover
+from src.utils.discover import iter_csv_files, scan_csv_files
+from src.utils.manifest import DirectoryManifest
+
+
+def age(root, seconds=60):
+    """Сдвигает время изменения всех папок в прошлое"""
+    stamp = time.time() - seconds
+    for folder, _, _ in os.walk(root):
+        os.utime(folder, (stamp, stamp))
+
+
+class TestDirectoryManifest:
+    """Тесты поиска CSV файлов с манифестом"""
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        root = tmp_path / 'data'
+        for relative in ('top.csv', 'a/one.csv', 'a/deep/two.csv',
+                         'b/three.csv', 'b/notes.txt'):
+            path = root.joinpath(*relative.split('/'))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text('name\n')
+        age(str(root))
+        return str(root)
+
+    @pytest.fixture
+    def manifest_dir(self, tmp_path):
+        return str(tmp_path / 'cache')
+
+    @pytest.fixture
+    def scanned(self, monkeypatch):
+        calls = []
+        scandir = os.scandir
+
+        def tracking(path):
+            calls.append(os.path.basename(path))
+            return scandir(path)
+
+        monkeypatch.setattr(discover.os, 'scandir', tracking)
+        return calls
+
+    def _scan(self, tree, manifest_dir, **options):
+        options.setdefault('include_subfolders', True)
+        return scan_csv_files(tree, manifest_dir=manifest_dir, **options)
+
+    def test_unchanged_folders_not_read(self, tree, manifest_dir, scanned):
+        """Тест, что неизмененные папки не читаются повторно"""
+        first = self._scan(tree, manifest_dir)
+        assert sorted(scanned) == ['a', 'b', 'data', 'deep']
+
+        scanned.clear()
+        assert self._scan(tree, manifest_dir) == first
+        assert scanned == []
+        assert len(first) == 4
+
+    def test_changed_folder_read(self, tree, manifest_dir, scanned):
+        """Тест повторного чтения только измененных папок"""
+        self._scan(tree, manifest_dir)
+        os.remove(os.path.join(tree, 'a', 'one.csv'))
+        new_folder = os.path.join(tree, 'b', 'new')
+        os.mkdir(new_folder)
+        with open(os.path.join(new_folder, 'four.csv'), 'w') as f:
+            f.write('name\n')
+
+        scanned.clear()
+        found = [os.path.relpath(path, tree).replace(os.sep, '/')
+                 for path, _ in self._scan(tree, manifest_dir)]
+
+        assert sorted(scanned) == ['a', 'b', 'new']
+        assert found == ['a/deep/two.csv', 'b/new/four.csv',
+                         'b/three.csv', 'top.csv']
+
+    def test_rescan(self, tree, manifest_dir, scanned):
+        """Тест чтения всех папок с rescan=True"""
+        self._scan(tree, manifest_dir)
+
+        scanned.clear()
+        self._scan(tree, manifest_dir, rescan=True)
+        assert len(scanned) == 4
+
+        scanned.clear()
+        self._scan(tree, manifest_dir)
+        assert scanned == []
+
+    def test_recent_folders_not_stored(self, tree, manifest_dir, scanned):
+        """Тест, что недавно измененные папки не попадают в манифест"""
+        age(tree, seconds=0)
+        self._scan(tree, manifest_dir)
+
+        scanned.clear()
+        self._scan(tree, manifest_dir)
+        assert len(scanned) == 4
+
+    def test_interrupted_walk_not_saved(self, tree, manifest_dir):
+        """Тест, что прерванный обход не сохраняет манифест"""
+        entries = iter_csv_files(
+            tree, include_subfolders=True, manifest_dir=manifest_dir)
+        next(entries)
+        entries.close()
+
+        assert not os.path.exists(manifest_dir)
+
+    def test_depth_limit(self, tree, manifest_dir):
+        """Тест, что манифест не мешает ограничению глубины"""
+        self._scan(tree, manifest_dir)
+
+        assert len(self._scan(tree, manifest_dir, max_depth=2)) == 3
+        assert len(self._scan(tree, manifest_dir)) == 4
+
+    def test_patterns_use_own_manifest(self, tree, manifest_dir, scanned):
+        """Тест отдельного манифеста для других шаблонов"""
+        self._scan(tree, manifest_dir)
+
+        scanned.clear()
+        found = self._scan(tree, manifest_dir, exclude=['deep'])
+        assert sorted(scanned) == ['a', 'b', 'data']
+        assert len(found) == 3
+        assert len(os.listdir(manifest_dir)) == 2
+
+    def test_parallel_walk(self, tree, manifest_dir, scanned):
+        """Тест манифеста при параллельном обходе"""
+        serial = self._scan(tree, manifest_dir)
+
+        scanned.clear()
+        assert self._scan(tree, manifest_dir, threads=4) == serial
+        assert scanned == []
+
+    @pytest.mark.parametrize('content', [b'', b'{broken', b'[1, 2]',
+                                         b'{"version": 0, "folders": {}}'])
+    def test_corrupted_manifest(self, tree, manifest_dir, content):
+        """Тест, что поврежденный манифест игнорируется"""
+        expected = self._scan(tree, manifest_dir)
+        manifest = DirectoryManifest(manifest_dir, tree)
+        with open(manifest.path, 'wb') as f:
+            f.write(content)
+
+        assert self._scan(tree, manifest_dir) == expected
+
+    def test_write_error_ignored(self, tree, tmp_path):
+        """Тест, что ошибка записи манифеста не прерывает поиск"""
+        blocker = tmp_path / 'file'
+        blocker.write_text('')
+
+        assert len(self._scan(tree, str(blocker / 'cache'))) == 4
+
+    def test_processor_options(self, tree, tmp_path, monkeypatch, scanned):
+        """Тест манифеста в CSVProcessor"""
+        cache_dir = str(tmp_path / 'processor_cache')
+        get = discover.config.get
+        monkeypatch.setattr(
+            discover.config, 'get',
+            lambda key, default=None: True if key == 'INCLUDE_SUBFOLDERS'
+            else get(key, default))
+        processor = CSVProcessor(cache_dir=cache_dir,
+                                 discovery_manifest=True)
+
+        expected = processor.discover_and_validate_files(tree)
+        scanned.clear()
+        assert processor.discover_and_validate_files(tree) == expected
+        assert scanned == []
+        assert os.listdir(cache_dir)[0].endswith(DirectoryManifest.SUFFIX)
+
+        processor.configure(rescan=True)
+        processor.discover_and_validate_files(tree)
+        assert len(scanned) == 4
@@ -0,0 +1,328 @@
+"""
+Тесты для кэша разобранных файлов
+"""
+import json
+import os
+import tempfile
+import time
+
+import pytest
+
+from src import schema as schema_module
+from src.csv_processor import CSVProcessor
+from src.employee import Employee
+from src.employee_table import EmployeeTable
+from src.parse_cache import ParseCache
+
+HEADER = ("name,position,completed_tasks,performance,"
+          "skills,team,experience_years\n")
+
+
+def write_csv(path, rows):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(HEADER)
+        f.write(''.join(rows))
+
+
+def make_table(count):
+    table = EmployeeTable()
+    table.extend(
+        Employee(f'User{i}', 'Developer', i, 4.5, 'Python, Go',
+                 f'Команда {i % 2}', i)
+        for i in range(count))
+    return table
+
+
+class TestParseCache:
+    """Тесты для класса ParseCache"""
+
+    def _store(self, cache, key, path, table, rejected=()):
+        cache.store(key, table, list(rejected), path,
+                    ParseCache.stamp(path), len(table) + len(rejected))
+
+    def test_store_and_load_roundtrip(self):
+        """Тест восстановления таблицы, отклоненных строк и состояния"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'employees.csv')
+            write_csv(path, [])
+            cache = ParseCache(os.path.join(temp_dir, 'cache'), 0, 'schema')
+            table = make_table(5)
+            rejected = [(4, 'Ошибка', {'name': 'Bad', None: ['extra']})]
+
+            key = cache.key(path)
+            self._store(cache, key, path, table, rejected)
+            loaded, loaded_rejected, state = cache.load(key)
+
+            assert list(loaded) == list(table)
+            assert loaded.team.values == ['Команда 0', 'Команда 1']
+            assert [loaded.skill_lists[i] for i in range(len(loaded))] == [
+                table.skill_lists[i] for i in range(len(table))]
+            assert loaded_rejected == [(4, 'Ошибка', {'name': 'Bad'})]
+            assert cache.peek(key) == state
+            assert ParseCache.is_current(state, ParseCache.stamp(path))
+            assert state['rows'] == 6
+
+    def test_key_depends_on_path_and_schema(self):
+        """Тест смены ключа при другом файле или правилах проверки"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'employees.csv')
+            cache = ParseCache(temp_dir, 0, 'schema')
+            key = cache.key(path)
+
+            assert ParseCache(temp_dir, 0, 'other').key(path) != key
+            assert cache.key(os.path.join(temp_dir, 'other.csv')) != key
+            assert ParseCache.stamp(path) is None
+
+    def test_resume_point(self):
+        """Тест определения дополненного, обрезанного и измененного файла"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'employees.csv')
+            write_csv(path, TestCSVProcessorCache.ROWS)
+            cache = ParseCache(os.path.join(temp_dir, 'cache'), 0, 'schema')
+            key = cache.key(path)
+            self._store(cache, key, path, make_table(10))
+            state = cache.peek(key)
+            size = os.path.getsize(path)
+
+            assert ParseCache.resume_point(
+                path, state, ParseCache.stamp(path)) is None
+
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write('New,Developer,1,4.5,Python,Team,1\n')
+            assert ParseCache.resume_point(
+                path, state, ParseCache.stamp(path)) == (size, 10)
+
+            with open(path, 'r+b') as f:
+                f.seek(len(HEADER))
+                f.write(b'X')
+            assert ParseCache.resume_point(
+                path, state, ParseCache.stamp(path)) is None
+
+            write_csv(path, TestCSVProcessorCache.ROWS[:2])
+            assert ParseCache.resume_point(
+                path, state, ParseCache.stamp(path)) is None
+
+    def test_corrupted_entry_is_miss(self):
+        """Тест удаления поврежденной записи"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'employees.csv')
+            write_csv(path, [])
+            cache = ParseCache(temp_dir, 0, 'schema')
+            self._store(cache, 'key', path, make_table(3))
+            entry_path = os.path.join(temp_dir, 'key.bin')
+            with open(entry_path, 'r+b') as f:
+                f.truncate(os.path.getsize(entry_path) - 5)
+
+            assert cache.load('key') is None
+            assert not os.path.exists(entry_path)
+
+    def test_evicts_least_recently_used(self):
+        """Тест вытеснения давно использованных записей"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'employees.csv')
+            write_csv(path, [])
+            cache_dir = os.path.join(temp_dir, 'cache')
+            cache = ParseCache(cache_dir, 0, 'schema')
+            for key in ('a', 'b', 'c'):
+                self._store(cache, key, path, make_table(50))
+            entry_size = os.path.getsize(os.path.join(cache_dir, 'a.bin'))
+            for age, key in enumerate(('a', 'b', 'c')):
+                stamp = time.time() - 100 + age
+                os.utime(os.path.join(cache_dir, key + '.bin'),
+                         (stamp, stamp))
+
+            assert cache.load('a') is not None
+            cache.max_size = 2 * entry_size
+            cache.evict()
+
+            assert sorted(os.listdir(cache_dir)) == ['a.bin', 'c.bin']
+
+
+class TestCSVProcessorCache:
+    """Тесты загрузки через кэш"""
+
+    ROWS = [f'User{j},Developer,{j},4.5,"Python, Go",Team,{j}\n'
+            for j in range(10)]
+
+    def _processor(self, cache_dir, **options):
+        return CSVProcessor(
+            cache_enabled=True, cache_dir=cache_dir, **options)
+
+    @pytest.mark.parametrize('record_format', ['dict', 'employee', 'table'])
+    def test_cached_load_matches_parsing(self, record_format, monkeypatch):
+        """Тест совпадения данных из кэша с разбором файла"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'employees.csv')
+            write_csv(path, self.ROWS)
+            cache_dir = os.path.join(temp_dir, 'cache')
+
+            expected = list(CSVProcessor(
+                record_format=record_format,
+                cache_enabled=False).load_data([path]))
+            assert list(self._processor(
+                cache_dir, record_format=record_format).load_data(
+                    [path])) == expected
+
+            monkeypatch.setattr(
+                CSVProcessor, '_load_file_task',
+                lambda *args: pytest.fail("Файл разобран повторно"))
+            assert list(self._processor(
+                cache_dir, record_format=record_format).load_data(
+                    [path])) == expected
+
+    @pytest.mark.parametrize('record_format', ['dict', 'table'])
+    def test_large_integers_cached(self, record_format, monkeypatch):
+        """Тест кэширования целых значений вне int32"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'employees.csv')
+            write_csv(path, ['User,Developer,3000000000,4.5,Go,Team,2\n'])
+            cache_dir = os.path.join(temp_dir, 'cache')
+
+            first = self._processor(
+                cache_dir, record_format=record_format).load_data([path])
+            monkeypatch.setattr(
+                CSVProcessor, '_load_file_task',
+                lambda *args: pytest.fail("Файл разобран повторно"))
+            second = self._processor(
+                cache_dir, record_format=record_format).load_data([path])
+
+            assert list(first) == list(second)
+            assert list(second)[0]['completed_tasks'] == 3000000000
+
+    def test_unstorable_values_not_cached(self, monkeypatch):
+        """Тест, что значения вне колонок таблицы не прерывают загрузку"""
+        monkeypatch.setattr(schema_module, 'MAX_INTEGER', 2 ** 70)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'employees.csv')
+            write_csv(path, [f'User,Developer,{2 ** 64},4.5,Go,Team,2\n'])
+            cache_dir = os.path.join(temp_dir, 'cache')
+
+            data = self._processor(cache_dir).load_data([path])
+
+            assert data[0]['completed_tasks'] == 2 ** 64
+            assert not os.path.exists(cache_dir)
+
+    def test_changed_file_is_reparsed(self):
+        """Тест повторного разбора измененного файла"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'employees.csv')
+            write_csv(path, self.ROWS)
+            processor = self._processor(os.path.join(temp_dir, 'cache'))
+            processor.load_data([path])
+
+            write_csv(path, self.ROWS[:3])
+            assert len(processor.load_data([path])) == 3
+
+    def test_parallel_load_fills_cache(self):
+        """Тест сохранения в кэш файлов, разобранных по диапазонам"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = []
+            for index in range(3):
+                path = os.path.join(temp_dir, f'part_{index}.csv')
+                write_csv(path, self.ROWS)
+                paths.append(path)
+            cache_dir = os.path.join(temp_dir, 'cache')
+
+            expected = self._processor(
+                cache_dir, workers=2, chunk_size=128).load_data(paths)
+            assert len(os.listdir(cache_dir)) == 3
+            assert self._processor(cache_dir).load_data(paths) == expected
+
+    def test_cached_rejections(self):
+        """Тест учета отклоненных строк из кэша"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'employees.csv')
+            rows = list(self.ROWS)
+            rows[4] = 'Bad,Developer,1,9.5,"Python",Team,1\n'
+            write_csv(path, rows)
+            cache_dir = os.path.join(temp_dir, 'cache')
+            quarantine = os.path.join(temp_dir, 'rejected.jsonl')
+
+            self._processor(cache_dir, on_error='skip').load_data([path])
+
+            processor = self._processor(
+                cache_dir, on_error='collect', quarantine_file=quarantine)
+            assert len(processor.load_data([path])) == 9
+            with open(quarantine, encoding='utf-8') as f:
+                entries = [json.loads(line) for line in f]
+            assert [entry['row'] for entry in entries] == [6]
+
+            with pytest.raises(ValueError, match="Ошибка в строке 6"):
+                self._processor(cache_dir, on_error='fail').load_data([path])
+
+    @pytest.mark.parametrize('record_format', ['dict', 'employee', 'table'])
+    def test_incremental_parses_only_appended_rows(
+            self, record_format, monkeypatch):
+        """Тест дочитывания только новых строк дополненного файла"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'employees.csv')
+            write_csv(path, self.ROWS)
+            cache_dir = os.path.join(temp_dir, 'cache')
+            self._processor(cache_dir).load_data([path])
+
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write('New,Developer,1,4.5,"Python,\nGo",Team,1\n')
+            expected = list(CSVProcessor(
+                record_format=record_format,
+                cache_enabled=False).load_data([path]))
+
+            monkeypatch.setattr(
+                CSVProcessor, '_load_file_task',
+                lambda *args: pytest.fail("Файл разобран целиком"))
+            processor = self._processor(
+                cache_dir, record_format=record_format, incremental=True)
+            assert list(processor.load_data([path])) == expected
+            # Объединенные данные сохранены в кэш
+            assert list(processor.load_data([path])) == expected
+
+    def test_incremental_error_row_number(self):
+        """Тест номера строки ошибки в дочитанной части"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'employees.csv')
+            rows = list(self.ROWS)
+            rows[2] = 'Bad,Developer,1,9.5,"Python",Team,1\n'
+            write_csv(path, rows)
+            cache_dir = os.path.join(temp_dir, 'cache')
+            self._processor(cache_dir, on_error='skip').load_data([path])
+
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write('User,Developer,1,4.5,Python,Team,1\n'
+                        'Broken,Developer,x,4.5,Python,Team,1\n')
+
+            processor = self._processor(
+                cache_dir, on_error='skip', incremental=True)
+            assert len(processor.load_data([path])) == 10
+            assert processor.get_load_summary()['rejected_rows'] == 2
+
+            with pytest.raises(ValueError, match="Ошибка в строке 4"):
+                self._processor(
+                    cache_dir, incremental=True).load_data([path])
+
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write('Late,Developer,1,4.5,Python,Team,-1\n')
+            processor = self._processor(
+                cache_dir, on_error='collect', incremental=True,
+                quarantine_file=os.path.join(temp_dir, 'rejected.jsonl'))
+            processor.load_data([path])
+            with open(processor.quarantine_file, encoding='utf-8') as f:
+                assert [json.loads(line)['row'] for line in f] == [4, 13, 14]
+
+    def test_rewritten_file_is_reparsed(self):
+        """Тест полного разбора перезаписанного файла"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'employees.csv')
+            write_csv(path, self.ROWS)
+            processor = self._processor(
+                os.path.join(temp_dir, 'cache'), incremental=True)
+            processor.load_data([path])
+
+            write_csv(path, ['Other,Developer,1,4.5,Python,Team,1\n']
+                      + self.ROWS)
+            data = processor.load_data([path])
+            assert [row['name'] for row in data][:2] == ['Other', 'User0']
+            assert len(data) == 11
+
+    def test_invalid_cache_max_size(self):
+        """Тест отрицательного размера кэша"""
+        with pytest.raises(ValueError, match="Размер кэша"):
+            CSVProcessor(cache_max_size=-1)
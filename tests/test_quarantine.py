@@ -0,0 +1,58 @@
+"""
+Тесты для карантина отклоненных строк
+"""
+import csv
+
+from src.quarantine import Quarantine, QuarantineParts
+
+COLUMNS = ['name', 'team']
+
+
+class TestQuarantineParts:
+    """Тесты для класса QuarantineParts"""
+
+    def _collect(self, parts, file_path, names):
+        quarantine = Quarantine(COLUMNS, parts.part_path(file_path))
+        for row_num, name in enumerate(names, 2):
+            quarantine.add(file_path, row_num, 'ошибка',
+                           {'name': name, 'team': 'Team'})
+        quarantine.close()
+
+    def test_csv_parts_in_file_order(self, tmp_path):
+        """Тест сборки CSV карантина в порядке файлов"""
+        path = str(tmp_path / 'quarantine.csv')
+        parts = QuarantineParts(path)
+        try:
+            self._collect(parts, 'b.csv', ['B1'])
+            self._collect(parts, 'a.csv', ['A1', 'A2'])
+            parts.write(['a.csv', 'b.csv'])
+            self._collect(parts, 'a.csv', ['A3'])
+            parts.write(['a.csv', 'b.csv', 'c.csv'])
+
+            with open(path, encoding='utf-8', newline='') as f:
+                rows = list(csv.reader(f))
+        finally:
+            parts.close()
+
+        assert rows == [
+            Quarantine.SERVICE_COLUMNS + COLUMNS,
+            ['a.csv', '2', 'ошибка', 'A3', 'Team'],
+            ['b.csv', '2', 'ошибка', 'B1', 'Team'],
+        ]
+
+    def test_removed_file_rows_dropped(self, tmp_path):
+        """Тест, что строки файлов вне списка не попадают в карантин"""
+        path = tmp_path / 'quarantine.jsonl'
+        parts = QuarantineParts(str(path))
+        try:
+            parts.write(['a.csv'])
+            assert not path.exists()
+
+            self._collect(parts, 'a.csv', ['A1'])
+            parts.write(['a.csv'])
+            assert path.read_text(encoding='utf-8').count('\n') == 1
+
+            parts.write([])
+            assert path.read_text(encoding='utf-8') == ''
+        finally:
+            parts.close()
@@ -6,6 +6,7 @@ import pytest
 from src.report_generator import (
     ReportGenerator, PerformanceReport, SkillsReport)
 from src.config import config
+from src.sampling import SampleInfo
 
 
 class TestPerformanceReport:
@@ -415,3 +416,251 @@ class TestReportGenerator:
         # Проверяем, что обе строки содержат 4.5
         assert '4.5' in developer_line
         assert '4.5' in designer_line
+
+
+class TestStreamingReports:
+    """Тесты потоковой генерации отчетов"""
+
+    def _load_test_data(self):
+        from src.csv_processor import CSVProcessor
+
+        processor = CSVProcessor()
+        return processor.load_data([
+            config.get('demo_data_file'),
+            config.get('test_data_file')
+        ])
+
+    def test_performance_stream_matches_generate(self):
+        """Тест совпадения потокового отчета по эффективности"""
+        report = PerformanceReport()
+        data = self._load_test_data()
+
+        assert report.generate_stream(iter(data)) == report.generate(data)
+
+    def test_skills_stream_matches_generate(self):
+        """Тест совпадения потокового отчета по навыкам"""
+        report = SkillsReport()
+        data = self._load_test_data()
+
+        assert report.generate_stream(iter(data)) == report.generate(data)
+
+    def test_empty_stream(self):
+        """Тест потоковых отчетов по пустому потоку"""
+        assert (PerformanceReport().generate_stream(iter([]))
+                == PerformanceReport().generate([]))
+        assert (SkillsReport().generate_stream(iter([]))
+                == SkillsReport().generate([]))
+
+    def test_merged_accumulators_match_single_pass(self):
+        """Тест объединения накопителей, собранных по частям данных"""
+        data = self._load_test_data()
+        middle = len(data) // 2
+
+        for report in (PerformanceReport(), SkillsReport()):
+            merged = report.accumulate(data[:middle])
+            merged.merge(report.accumulate(data[middle:]))
+
+            assert report.render(merged) == report.generate(data)
+
+    def test_generate_report_stream_unsupported_type(self):
+        """Тест ошибки потоковой генерации неподдерживаемого отчета"""
+        generator = ReportGenerator()
+
+        with pytest.raises(ValueError, match="Неподдерживаемый тип отчета"):
+            generator.generate_report_stream('unsupported_report', iter([]))
+
+
+class TestSampledReports:
+    """Тесты отчетов по выборке строк"""
+
+    DATA = [
+        {'name': f'User{index}', 'position': position,
+         'performance': performance, 'skills': 'Python, Go'}
+        for index, (position, performance) in enumerate([
+            ('Developer', 4.0), ('Developer', 4.4), ('Developer', 4.8),
+            ('QA', 3.0), ('QA', 3.6), ('Designer', 4.1)])
+    ]
+
+    def test_performance_estimates(self):
+        """Тест оценок средних и количеств с интервалами"""
+        report = PerformanceReport().generate(
+            self.DATA, SampleInfo(600, 6))
+
+        assert 'Оценка по выборке: 6 из ~600 строк (1.0%)' in report
+        assert 'доверительные интервалы 95%' in report
+        # Developer: среднее 4.4 по трем записям, оценка 300 из 600
+        assert '4.40 ± 0.45' in report
+        assert '≈300 ± 239' in report
+        # Designer: одна запись, интервал среднего не оценивается
+        assert '4.1 ' in report
+
+    def test_skills_estimates(self):
+        """Тест оценок в отчете по навыкам"""
+        report = SkillsReport().generate(self.DATA, SampleInfo(600, 6))
+
+        assert 'Оценка по выборке' in report
+        # Навык есть у всех записей выборки: численность без интервала
+        assert ' 600 ' in report
+        assert '3.98 ± 0.50' in report
+
+    def test_full_sample_matches_exact_report(self):
+        """Тест выборки из всех строк: таблица как у точного отчета"""
+        for report in (PerformanceReport(), SkillsReport()):
+            sampled = report.generate(self.DATA, SampleInfo(6, 6))
+
+            assert sampled.endswith(report.generate(self.DATA).split(
+                "===\n")[-1])
+
+    def test_deadline_note(self):
+        """Тест пометки об отчете по части строк"""
+        report = PerformanceReport().generate(
+            self.DATA, SampleInfo(6, 6, complete=False))
+
+        assert 'остановлено по сроку --deadline' in report
+
+    def test_generate_sampled_report(self):
+        """Тест генерации отчета по выборке через ReportGenerator"""
+        generator = ReportGenerator()
+        sample = SampleInfo(600, 6)
+
+        assert (generator.generate_sampled_report(
+            'performance', self.DATA, sample)
+            == PerformanceReport().generate(self.DATA, sample))
+
+
+class TestAggregatedReports:
+    """Тесты отчетов по агрегатам частей данных"""
+
+    def _load_parts(self, record_format):
+        from src.csv_processor import CSVProcessor
+
+        processor = CSVProcessor(record_format=record_format)
+        return [processor.load_data([config.get(name)])
+                for name in ('demo_data_file', 'test_data_file')]
+
+    @pytest.mark.parametrize('record_format', ['dict', 'table'])
+    @pytest.mark.parametrize('report_type', ['performance', 'skills'])
+    def test_matches_full_report(self, report_type, record_format):
+        """Тест совпадения с отчетом по всем данным"""
+        from src.csv_processor import CSVProcessor
+
+        generator = ReportGenerator()
+        parts = [generator.aggregate(report_type, data)
+                 for data in self._load_parts(record_format)]
+        expected = generator.generate_report(
+            report_type, CSVProcessor().load_data([
+                config.get('demo_data_file'),
+                config.get('test_data_file')]))
+
+        assert generator.render_aggregates(report_type, parts) == expected
+        # Агрегаты частей не меняются при построении отчета
+        assert generator.render_aggregates(report_type, parts) == expected
+
+    def test_replaced_part(self):
+        """Тест замены агрегатов одной части"""
+        generator = ReportGenerator()
+        demo, test = self._load_parts('dict')
+        parts = [generator.aggregate('performance', demo),
+                 generator.aggregate('performance', test)]
+
+        parts[1] = generator.aggregate('performance', [])
+
+        assert generator.render_aggregates('performance', parts) == (
+            generator.generate_report('performance', demo))
+
+    def test_parts_not_spilled(self):
+        """Тест, что агрегаты частей не сбрасываются на диск"""
+        generator = ReportGenerator()
+        generator.configure(memory_limit=1024)
+        data = TestMemoryLimit.DATA
+
+        part = generator.aggregate('performance', data)
+
+        assert not part._runs
+        assert generator.render_aggregates('performance', [part]) == (
+            generator.generate_report('performance', data))
+
+    def test_no_parts(self):
+        """Тест отчета без частей"""
+        generator = ReportGenerator()
+
+        assert generator.render_aggregates('performance', []) == (
+            PerformanceReport().generate([]))
+
+
+class TestMemoryLimit:
+    """Тесты отчетов с ограничением памяти агрегатов"""
+
+    DATA = [
+        {'name': f'User{index}', 'position': f'Position {index % 7}',
+         'performance': index % 50 / 10,
+         'skills': f'Python, Skill {index % 40}, Skill {index % 13}'}
+        for index in range(2000)
+    ]
+
+    @pytest.mark.parametrize('report_class', [PerformanceReport, SkillsReport])
+    def test_spilled_report_matches(self, report_class, monkeypatch):
+        """Тест совпадения отчета со сбросом агрегатов на диск"""
+        monkeypatch.setattr(config, 'get', lambda key, default=None: {
+            'SKILLS_REPORT_MIN_OCCURRENCE': 1}.get(key, default))
+        expected = report_class().generate(self.DATA)
+        report = report_class()
+        report.memory_limit = 4096
+
+        accumulator = report.accumulate(self.DATA)
+        try:
+            assert accumulator._runs
+        finally:
+            accumulator.close()
+        assert report.generate(self.DATA) == expected
+        assert report.generate_stream(iter(self.DATA)) == expected
+
+    def test_spilled_accumulators_merge(self):
+        """Тест объединения накопителей со сброшенными агрегатами"""
+        middle = len(self.DATA) // 2
+        for report in (PerformanceReport(), SkillsReport()):
+            expected = report.generate(self.DATA)
+            report.memory_limit = 4096
+
+            merged = report.accumulate(self.DATA[:middle])
+            part = report.accumulate(self.DATA[middle:])
+            merged.merge(part)
+
+            assert report.render(merged) == expected
+            merged.close()
+            part.close()
+
+    def test_configure(self):
+        """Тест передачи предела памяти отчетам"""
+        generator = ReportGenerator()
+
+        generator.configure(memory_limit=1024)
+
+        assert all(report.memory_limit == 1024
+                   for report in generator.reports.values())
+        with pytest.raises(ValueError):
+            generator.configure(memory_limit=-1)
+
+
+class TestReportColumns:
+    """Тесты колонок, которые использует отчет"""
+
+    @pytest.mark.parametrize('report_type', ['performance', 'skills'])
+    def test_report_on_projected_data(self, report_type):
+        """Тест совпадения отчета по данным только с колонками отчета"""
+        from src.csv_processor import CSVProcessor
+
+        generator = ReportGenerator()
+        files = [config.get('demo_data_file'), config.get('test_data_file')]
+        columns = generator.get_report_columns(report_type)
+        projected = CSVProcessor(
+            columns=columns, cache_enabled=False).load_data(files)
+        full = CSVProcessor(cache_enabled=False).load_data(files)
+
+        assert (generator.generate_report(report_type, projected)
+                == generator.generate_report(report_type, full))
+
+    def test_unsupported_type(self):
+        """Тест ошибки для неподдерживаемого отчета"""
+        with pytest.raises(ValueError, match="Неподдерживаемый тип отчета"):
+            ReportGenerator().get_report_columns('unsupported_report')
@@ -7,6 +7,7 @@ from typing import List, Dict, Any
 
 from src.services.report_service import ReportService
 from src.interfaces.report_generator import ReportGeneratorInterface
+from src.sampling import SampleInfo
 
 
 class MockReportGenerator(ReportGeneratorInterface):
@@ -228,3 +229,61 @@ class TestReportService:
         # Проверяем, что данные переданы генератору
         assert len(mock_generator.generate_report_calls) == 1
         assert mock_generator.generate_report_calls[0]['data'] == large_data
+
+    def test_generate_report_stream_empty_raises_error(self):
+        """Тест ошибки потоковой генерации по пустому потоку"""
+        service = ReportService(MockReportGenerator("Mock Report"))
+
+        with pytest.raises(ValueError, match="Нет данных для генерации отчета"):
+            service.generate_report_stream('performance', iter([]))
+
+    def test_generate_report_stream_falls_back_to_list(self):
+        """Тест потоковой генерации через обычный генератор"""
+        mock_generator = MockReportGenerator("Mock Report")
+        service = ReportService(mock_generator)
+
+        records = iter([{'name': 'John Doe'}, {'name': 'Jane Smith'}])
+        result = service.generate_report_stream('performance', records)
+
+        assert result == "Mock Report"
+        assert mock_generator.generate_report_calls[0]['data'] == [
+            {'name': 'John Doe'}, {'name': 'Jane Smith'}]
+
+    def test_get_report_columns_default(self):
+        """Тест колонок отчета у генератора, который их не указывает"""
+        service = ReportService(MockReportGenerator("Mock Report"))
+
+        assert service.get_report_columns('performance') is None
+
+    def test_generate_sampled_report_default(self):
+        """Тест отчета по выборке у генератора без поддержки оценок"""
+        mock_generator = MockReportGenerator("Mock Report")
+        service = ReportService(mock_generator)
+
+        result = service.generate_report(
+            'performance', [{'name': 'John Doe'}], SampleInfo(100, 1))
+
+        assert result == "Mock Report"
+        assert mock_generator.generate_report_calls[0]['data'] == [
+            {'name': 'John Doe'}]
+
+    def test_configure_generator_default(self):
+        """Тест параметров генератора, который их не поддерживает"""
+        service = ReportService(MockReportGenerator("Mock Report"))
+
+        service.configure_generator(memory_limit=1024)
+
+        assert service.generate_report('performance', [{}]) == "Mock Report"
+
+    def test_render_aggregates_default(self):
+        """Тест отчета по частям у генератора без поддержки агрегатов"""
+        mock_generator = MockReportGenerator("Mock Report")
+        service = ReportService(mock_generator)
+
+        parts = [service.aggregate('performance', iter([{'name': 'A'}])),
+                 service.aggregate('performance', [{'name': 'B'}])]
+        result = service.render_aggregates('performance', parts)
+
+        assert result == "Mock Report"
+        assert mock_generator.generate_report_calls[0]['data'] == [
+            {'name': 'A'}, {'name': 'B'}]
@@ -0,0 +1,142 @@
+"""
+Тесты для случайных выборок и оценок по ним
+"""
+import random
+
+import pytest
+
+from src.sampling import (
+    Deadline, Reservoir, SampleInfo, SampleMerger, sample_population)
+
+
+class TestReservoir:
+    """Тесты выборки фиксированного размера"""
+
+    def test_short_stream_kept_entirely(self):
+        """Тест потока короче выборки"""
+        reservoir = Reservoir(10, random.Random(1))
+        for item in range(5):
+            reservoir.offer(item)
+
+        assert reservoir.items == [0, 1, 2, 3, 4]
+        assert reservoir.seen == 5
+
+    def test_sample_size_and_members(self):
+        """Тест размера выборки и принадлежности элементов потоку"""
+        reservoir = Reservoir(100, random.Random(2))
+        for item in range(10_000):
+            reservoir.offer(item)
+
+        assert len(reservoir.items) == 100
+        assert len(set(reservoir.items)) == 100
+        assert all(0 <= item < 10_000 for item in reservoir.items)
+        assert reservoir.seen == 10_000
+
+    def test_uniform_inclusion(self):
+        """Тест равной вероятности попадания в выборку"""
+        hits = [0] * 20
+        rng = random.Random(3)
+        for _ in range(4000):
+            reservoir = Reservoir(5, rng)
+            for item in range(20):
+                reservoir.offer(item)
+            for item in reservoir.items:
+                hits[item] += 1
+
+        # Ожидается 4000 * 5 / 20 = 1000 попаданий каждого элемента
+        assert all(850 < count < 1150 for count in hits)
+
+
+class TestSampleMerger:
+    """Тесты объединения выборок частей"""
+
+    def test_without_size_concatenates(self):
+        """Тест объединения без отбора"""
+        merger = SampleMerger(None, random.Random(1), [])
+        merger.add([1, 2], 20)
+        merger.add([3], 10)
+
+        assert merger.result() == [1, 2, 3]
+        assert merger.population == 30
+
+    def test_size_limits_result(self):
+        """Тест размера объединенной выборки и порядка записей"""
+        merger = SampleMerger(10, random.Random(2), [])
+        merger.add(list(range(10)), 1000)
+        merger.add(list(range(100, 110)), 1000)
+
+        result = merger.result()
+        assert len(result) == 10
+        assert result == sorted(result)
+        assert merger.population == 2000
+
+    def test_share_follows_population(self):
+        """Тест доли записей частей пропорционально их численности"""
+        rng = random.Random(3)
+        taken = 0
+        for _ in range(500):
+            merger = SampleMerger(10, rng, [])
+            merger.add(['a'] * 10, 900)
+            merger.add(['b'] * 10, 100)
+            taken += merger.result().count('b')
+
+        # Ожидается 10% записей из второй части
+        assert 350 < taken < 650
+
+
+class TestDeadline:
+    """Тесты срока чтения"""
+
+    def test_future_deadline_reads_all(self):
+        """Тест чтения всех строк до срока"""
+        deadline = Deadline(float('inf'))
+
+        assert list(deadline.rows(range(5000))) == list(range(5000))
+        assert not deadline.stopped
+
+    def test_past_deadline_stops(self):
+        """Тест остановки чтения по прошедшему сроку"""
+        deadline = Deadline(0.0)
+
+        assert list(deadline.rows(range(5000))) == []
+        assert deadline.stopped
+
+
+class TestSampleInfo:
+    """Тесты оценок по выборке"""
+
+    def test_sample_population(self):
+        """Тест оценки числа корректных строк"""
+        assert sample_population(90, 10, 900) == 900
+        assert sample_population(0, 0, 50) == 50
+
+    def test_full_sample_is_exact(self):
+        """Тест нулевых интервалов для выборки из всех строк"""
+        sample = SampleInfo(100, 100)
+
+        assert sample.exact
+        assert sample.count(40) == (40.0, 0.0)
+        assert sample.mean(10.0, 30.0, 4)[1] == 0.0
+
+    def test_count_estimate(self):
+        """Тест оценки численности группы"""
+        sample = SampleInfo(10_000, 100)
+
+        estimate, half_width = sample.count(25)
+
+        assert estimate == 2500
+        # 1.96 * 10000 * sqrt(0.25 * 0.75 / 100 * 0.99)
+        assert half_width == pytest.approx(844.4, abs=0.5)
+
+    def test_mean_estimate(self):
+        """Тест оценки среднего группы"""
+        sample = SampleInfo(1_000_000, 4)
+        values = [1.0, 2.0, 3.0, 4.0]
+
+        mean, half_width = sample.mean(
+            sum(values), sum(v * v for v in values), len(values))
+
+        assert mean == 2.5
+        # Стандартное отклонение выборки sqrt(5/3)
+        assert half_width == pytest.approx(1.96 * (5 / 3) ** 0.5 / 2, 1e-3)
+        assert sample.mean(4.0, 16.0, 1) == (4.0, None)
@@ -0,0 +1,223 @@
+"""
+Тесты для схемы записи сотрудника
+"""
+import pytest
+
+from src.csv_processor import CSVProcessor
+from src.employee import Employee
+from src import schema as schema_module
+from src.schema import EmployeeSchema, RowError
+
+
+class TestEmployeeSchema:
+    """Тесты для класса EmployeeSchema"""
+
+    ROW = {
+        'name': ' John Doe ',
+        'position': 'Developer',
+        'completed_tasks': '25',
+        'performance': '4.5',
+        'skills': 'Python, Django',
+        'team': 'Backend Team',
+        'experience_years': '3'
+    }
+
+    @pytest.fixture
+    def schema(self):
+        """Схема с границами по умолчанию"""
+        return EmployeeSchema(CSVProcessor.REQUIRED_COLUMNS, 0.0, 5.0, 0)
+
+    def test_from_config(self):
+        """Тест чтения границ из конфигурации"""
+        schema = EmployeeSchema.from_config(CSVProcessor.REQUIRED_COLUMNS)
+
+        assert schema.columns == tuple(CSVProcessor.REQUIRED_COLUMNS)
+        assert schema.min_performance == 0.0
+        assert schema.max_performance == 5.0
+        assert schema.min_experience_years == 0
+
+    def test_compile_dict(self, schema):
+        """Тест проверки строки с результатом-словарем"""
+        record = schema.compile('dict')(self.ROW)
+
+        assert record == {
+            'name': 'John Doe',
+            'position': 'Developer',
+            'skills': 'Python, Django',
+            'team': 'Backend Team',
+            'completed_tasks': 25,
+            'performance': 4.5,
+            'experience_years': 3
+        }
+        assert list(record) == [
+            'name', 'position', 'skills', 'team',
+            'completed_tasks', 'performance', 'experience_years'
+        ]
+
+    def test_compile_employee(self, schema):
+        """Тест проверки строки с результатом Employee"""
+        record = schema.compile('employee')(self.ROW)
+
+        assert isinstance(record, Employee)
+        assert record.name == 'John Doe'
+        assert record.completed_tasks == 25
+
+    def test_compile_positional_keys(self, schema):
+        """Тест проверки строки csv.reader по индексам колонок"""
+        header = list(self.ROW)[::-1]
+        row = [self.ROW[column] for column in header]
+        keys = {column: index for index, column in enumerate(header)}
+
+        record = schema.compile('dict', keys)(row)
+
+        assert record == schema.compile('dict')(self.ROW)
+
+    @pytest.mark.parametrize('field, value, message', [
+        ('team', '  ', "Пустое значение в поле 'team'"),
+        ('completed_tasks', '-1',
+         "Некорректное значение completed_tasks: "
+         "completed_tasks должно быть неотрицательным"),
+        ('performance', 'abc',
+         "Некорректное значение performance: "
+         "could not convert string to float: 'abc'"),
+        ('performance', '5.5',
+         "Некорректное значение performance: "
+         "performance должно быть в диапазоне от 0.0 до 5.0"),
+        ('experience_years', '-2',
+         "Некорректное значение experience_years: "
+         "experience_years должно быть не меньше 0"),
+        ('completed_tasks', str(2 ** 63),
+         "Некорректное значение completed_tasks: "
+         f"значение должно быть не больше {2 ** 63 - 1}"),
+        ('experience_years', str(2 ** 63),
+         "Некорректное значение experience_years: "
+         f"значение должно быть не больше {2 ** 63 - 1}"),
+    ])
+    def test_error_messages(self, schema, field, value, message):
+        """Тест текстов ошибок валидации"""
+        row = dict(self.ROW, **{field: value})
+
+        with pytest.raises(ValueError) as exc_info:
+            schema.compile('dict')(row)
+
+        assert str(exc_info.value) == message
+
+    def test_custom_bounds(self):
+        """Тест границ, заданных при создании схемы"""
+        schema = EmployeeSchema(CSVProcessor.REQUIRED_COLUMNS, 1.0, 10.0, 2)
+        validate = schema.compile('dict')
+
+        assert validate(dict(self.ROW, performance='9'))['performance'] == 9
+        with pytest.raises(ValueError, match="не меньше 2"):
+            validate(dict(self.ROW, experience_years='1'))
+
+    def test_validated_columns(self):
+        """Тест проверки только выбранных колонок"""
+        schema = EmployeeSchema(
+            CSVProcessor.REQUIRED_COLUMNS, 0.0, 5.0, 0,
+            validated=['performance', 'name', 'position'])
+        validate = schema.compile('dict')
+        row = dict(self.ROW, experience_years='-1', skills='',
+                   completed_tasks='x')
+
+        assert schema.validated == ('name', 'position', 'performance')
+        assert validate(row) == {
+            'name': 'John Doe',
+            'position': 'Developer',
+            'skills': '',
+            'team': '',
+            'completed_tasks': 0,
+            'performance': 4.5,
+            'experience_years': 0
+        }
+        with pytest.raises(ValueError, match="performance"):
+            validate(dict(row, performance='9'))
+
+    def test_fingerprint_depends_on_validated_columns(self):
+        """Тест ключа кэша для разных наборов проверяемых колонок"""
+        columns = CSVProcessor.REQUIRED_COLUMNS
+        full = EmployeeSchema(columns, 0.0, 5.0, 0)
+        projected = EmployeeSchema(columns, 0.0, 5.0, 0, ['name'])
+
+        assert full.fingerprint() != projected.fingerprint()
+        assert full.fingerprint() == EmployeeSchema(
+            columns, 0.0, 5.0, 0, columns).fingerprint()
+
+
+class TestBatchValidation:
+    """Тесты пакетной проверки строк"""
+
+    ROW = TestEmployeeSchema.ROW
+
+    @pytest.fixture(params=['numpy', 'python'])
+    def validate_batch(self, request):
+        """Пакетный валидатор для каждого способа проверки"""
+        if request.param == 'numpy':
+            pytest.importorskip('numpy')
+        schema = EmployeeSchema(CSVProcessor.REQUIRED_COLUMNS, 0.0, 5.0, 0)
+        return schema.compile_batch('dict', backend=request.param)
+
+    def test_valid_batch(self, validate_batch):
+        """Тест совпадения записей с построчной проверкой"""
+        rows = [dict(self.ROW, completed_tasks=str(i)) for i in range(5)]
+        schema = EmployeeSchema(CSVProcessor.REQUIRED_COLUMNS, 0.0, 5.0, 0)
+        validate = schema.compile('dict')
+
+        records = validate_batch(rows)
+
+        assert records == [validate(row) for row in rows]
+        assert type(records[0]['completed_tasks']) is int
+        assert type(records[0]['performance']) is float
+
+    @pytest.mark.parametrize('bad_rows, index, message', [
+        ({3: {'performance': '9'}, 1: {'team': ' '}}, 1,
+         "Пустое значение в поле 'team'"),
+        ({2: {'experience_years': '-1'}, 4: {'completed_tasks': 'x'}}, 2,
+         "Некорректное значение experience_years: "
+         "experience_years должно быть не меньше 0"),
+        ({1: {'completed_tasks': '1.5'}, 3: {'skills': ''}}, 1,
+         "Некорректное значение completed_tasks: "
+         "invalid literal for int() with base 10: '1.5'"),
+        ({2: {'performance': 'nan'}}, 2,
+         "Некорректное значение performance: "
+         "performance должно быть в диапазоне от 0.0 до 5.0"),
+        ({3: {'completed_tasks': str(2 ** 63)}}, 3,
+         "Некорректное значение completed_tasks: "
+         f"значение должно быть не больше {2 ** 63 - 1}"),
+    ])
+    def test_first_error(self, validate_batch, bad_rows, index, message):
+        """Тест номера и текста первой ошибки в пакете"""
+        rows = [dict(self.ROW, **bad_rows.get(i, {})) for i in range(5)]
+
+        with pytest.raises(RowError) as exc_info:
+            validate_batch(rows)
+
+        assert exc_info.value.index == index
+        assert exc_info.value.message == message
+
+    def test_validated_columns(self):
+        """Тест пакетной проверки только выбранных колонок"""
+        pytest.importorskip('numpy')
+        schema = EmployeeSchema(
+            CSVProcessor.REQUIRED_COLUMNS, 0.0, 5.0, 0,
+            validated=['name', 'position', 'performance'])
+        validate = schema.compile('employee')
+        validate_batch = schema.compile_batch('employee', backend='numpy')
+        rows = [dict(self.ROW, experience_years='-1', completed_tasks='x')
+                for _ in range(3)]
+
+        assert validate_batch(rows) == [validate(row) for row in rows]
+        rows[2] = dict(rows[2], performance='7')
+        with pytest.raises(RowError) as exc_info:
+            validate_batch(rows)
+        assert exc_info.value.index == 2
+
+    def test_fallback_without_numpy(self, monkeypatch):
+        """Тест построчной проверки, если numpy не установлен"""
+        monkeypatch.setattr(schema_module, 'numpy', None)
+        schema = EmployeeSchema(CSVProcessor.REQUIRED_COLUMNS, 0.0, 5.0, 0)
+
+        validate_batch = schema.compile_batch('employee', backend='numpy')
+        records = validate_batch([self.ROW])
+
+        assert records == [schema.compile('employee')(self.ROW)]
@@ -0,0 +1,59 @@
+"""
+Тесты для сброса агрегатов отчетов на диск
+"""
+import os
+
+from src.spill import SpillRuns
+
+
+def combine(stats, other):
+    """Объединяет агрегаты тестовой группы"""
+    stats['count'] += other['count']
+    stats['names'].extend(other['names'])
+
+
+class TestSpillRuns:
+    """Тесты серий частичных агрегатов"""
+
+    def test_merge_combines_in_spill_order(self):
+        """Тест объединения групп с одинаковым ключом в порядке сброса"""
+        runs = SpillRuns(combine)
+        runs.write({'b': {'count': 1, 'names': ['B1']},
+                    'a': {'count': 2, 'names': ['A1', 'A2']}})
+        runs.write({'a': {'count': 1, 'names': ['A3']}})
+
+        merged = list(runs.merge({'c': {'count': 1, 'names': ['C1']},
+                                  'a': {'count': 1, 'names': ['A4']}}))
+        runs.close()
+
+        assert merged == [
+            ('a', {'count': 4, 'names': ['A1', 'A2', 'A3', 'A4']}),
+            ('b', {'count': 1, 'names': ['B1']}),
+            ('c', {'count': 1, 'names': ['C1']}),
+        ]
+
+    def test_runs_compacted(self, monkeypatch):
+        """Тест слияния серий при превышении MAX_RUNS"""
+        monkeypatch.setattr(SpillRuns, 'MAX_RUNS', 3)
+        runs = SpillRuns(combine)
+        for index in range(10):
+            runs.write({'a': {'count': 1, 'names': [index]},
+                        f'k{index}': {'count': 1, 'names': [index]}})
+
+        assert len(runs) <= 3
+        merged = dict(runs.merge({}))
+        runs.close()
+
+        assert merged['a'] == {'count': 10, 'names': list(range(10))}
+        assert len(merged) == 11
+
+    def test_close_removes_files(self, tmp_path):
+        """Тест удаления временных файлов"""
+        runs = SpillRuns(combine, directory=str(tmp_path))
+        runs.write({'a': {'count': 1, 'names': []}})
+
+        assert os.listdir(tmp_path)
+        runs.close()
+
+        assert not os.listdir(tmp_path)
+        assert len(runs) == 0
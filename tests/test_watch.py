@@ -0,0 +1,66 @@
+"""
+Тесты для отслеживания изменений файлов
+"""
+import os
+
+from src.utils.watch import FileChanges, FileWatcher
+
+
+class TestFileWatcher:
+    """Тесты для класса FileWatcher"""
+
+    def _write(self, path, text):
+        path.write_text(text)
+        return str(path)
+
+    def test_first_poll_adds_all(self, tmp_path):
+        """Тест первого опроса"""
+        paths = [self._write(tmp_path / name, 'x') for name in 'ba']
+
+        changes = FileWatcher().poll(paths)
+
+        assert changes == FileChanges(sorted(paths), [], [])
+        assert changes
+
+    def test_no_changes(self, tmp_path):
+        """Тест опроса без изменений"""
+        paths = [self._write(tmp_path / 'a.csv', 'x')]
+        watcher = FileWatcher()
+        watcher.poll(paths)
+
+        assert not watcher.poll(paths)
+
+    def test_changes(self, tmp_path):
+        """Тест добавленных, измененных и удаленных файлов"""
+        kept = self._write(tmp_path / 'kept.csv', 'x')
+        changed = self._write(tmp_path / 'changed.csv', 'x')
+        removed = self._write(tmp_path / 'removed.csv', 'x')
+        watcher = FileWatcher()
+        watcher.poll([kept, changed, removed])
+
+        self._write(tmp_path / 'changed.csv', 'xy')
+        added = self._write(tmp_path / 'added.csv', 'x')
+
+        assert watcher.poll([kept, changed, added]) == FileChanges(
+            [added], [changed], [removed])
+
+    def test_same_size_rewrite(self, tmp_path):
+        """Тест изменения файла без изменения размера"""
+        path = self._write(tmp_path / 'a.csv', 'x')
+        watcher = FileWatcher()
+        watcher.poll([path])
+
+        self._write(tmp_path / 'a.csv', 'y')
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+        assert watcher.poll([path]).changed == [path]
+
+    def test_missing_file_removed(self, tmp_path):
+        """Тест файла, который удален между поиском и опросом"""
+        path = self._write(tmp_path / 'a.csv', 'x')
+        watcher = FileWatcher()
+        watcher.poll([path])
+        os.remove(path)
+
+        assert watcher.poll([path]).removed == [path]